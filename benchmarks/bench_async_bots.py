@@ -0,0 +1,136 @@
+"""Runs 50 simulated bots in threads, then 50 on one asyncio event loop.
+
+Every bot reads health and mana, then either presses a key or waits,
+like a simple potion bot. Both variants read and post through the same
+FakeProcess.
+
+Run from the repository root:
+    python benchmarks/bench_async_bots.py [--bots N] [--ticks N]
+"""
+import argparse
+import asyncio
+import struct
+import sys
+import threading
+import time
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).resolve().parents[1]))
+sys.path.insert(0, str(Path(__file__).resolve().parents[1] / "tests"))
+
+from fake_process import FakeProcess  # noqa: E402
+from pywinbot import (Address, AsyncMemoryReader,  # noqa: E402
+                      AsyncWindowMessagePoster, MemoryReader,
+                      WindowMessagePoster)
+from pywinbot.backend import FakeBackend, set_backend  # noqa: E402
+
+BASE = 0x20000000
+# Bot i reads health and mana of client i, 0x1000 bytes apart
+STRIDE = 0x1000
+INTERVAL = 0.05
+
+peak_threads = 0
+
+
+def count_threads():
+    global peak_threads
+    peak_threads = max(peak_threads, threading.active_count())
+
+
+def threaded_bot(memory_reader, poster, index, ticks):
+    health_address = Address(BASE + index * STRIDE)
+    mana_address = Address(BASE + index * STRIDE + 4)
+
+    for tick in range(ticks):
+        count_threads()
+        health = memory_reader.read(health_address, "i", 4)
+        mana = memory_reader.read(mana_address, "i", 4)
+        if health < 50 and mana and tick % 2:
+            poster.send_key_press("F1")
+        else:
+            time.sleep(INTERVAL)
+
+
+async def async_bot(memory_reader, poster, index, ticks):
+    health_address = Address(BASE + index * STRIDE)
+    mana_address = Address(BASE + index * STRIDE + 4)
+
+    for tick in range(ticks):
+        count_threads()
+        health, mana = await asyncio.gather(
+            memory_reader.read(health_address, "i", 4),
+            memory_reader.read(mana_address, "i", 4))
+        if health < 50 and mana and tick % 2:
+            await poster.send_key_press("F1")
+        else:
+            await asyncio.sleep(INTERVAL)
+
+
+def run_threads(memory_reader, bots, ticks):
+    poster = WindowMessagePoster(memory_reader.hwnd)
+    threads = [threading.Thread(target=threaded_bot,
+                                args=(memory_reader, poster, index, ticks))
+               for index in range(bots)]
+    for thread in threads:
+        thread.start()
+    for thread in threads:
+        thread.join()
+
+
+def run_asyncio(memory_reader, bots, ticks):
+    async def main():
+        async_reader = AsyncMemoryReader(memory_reader)
+        poster = AsyncWindowMessagePoster(memory_reader.hwnd)
+        try:
+            tasks = [asyncio.create_task(
+                         async_bot(async_reader, poster, index, ticks))
+                     for index in range(bots)]
+            await asyncio.gather(*tasks)
+        finally:
+            async_reader.close()
+
+    asyncio.run(main())
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(
+        description=__doc__.splitlines()[0],
+        formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--bots", type=int, default=50)
+    parser.add_argument("--ticks", type=int, default=40)
+    args = parser.parse_args()
+
+    process = FakeProcess()
+    process.add_module("game.exe", 0x400000, 0x1000)
+    # Every other client needs a potion
+    process.map(BASE, b"".join(
+        struct.pack("<ii", 30 if index % 2 else 100, 80).ljust(STRIDE, b"\0")
+        for index in range(args.bots)))
+    set_backend(FakeBackend(process.functions()))
+
+    memory_reader = MemoryReader("game.exe", window_class="Game")
+    # Every tick takes one key press delay or one interval
+    ideal = args.ticks * INTERVAL
+
+    print(f"{args.bots} bots, {args.ticks} ticks, "
+          f"ideal: {ideal * 1000:.0f} ms")
+    global peak_threads
+    for name, run in (("threads", run_threads), ("asyncio", run_asyncio)):
+        peak_threads = 0
+        process.calls.clear()
+        process.messages.clear()
+
+        start = time.perf_counter()
+        run(memory_reader, args.bots, args.ticks)
+        elapsed = time.perf_counter() - start
+
+        print(f"{name:>8}: {elapsed * 1000:7.0f} ms "
+              f"(+{(elapsed - ideal) * 1000:.0f} ms), "
+              f"threads: {peak_threads:3}, "
+              f"ReadProcessMemory calls: "
+              f"{process.calls['ReadProcessMemory']:5}, "
+              f"messages: {len(process.messages)}")
+
+
+if __name__ == "__main__":
+    main()
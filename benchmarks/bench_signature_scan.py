@@ -0,0 +1,62 @@
+"""Scans a simulated 100 MB module for a byte signature.
+
+Run from the repository root:
+    python benchmarks/bench_signature_scan.py [--size MB] [--repeat N]
+"""
+import argparse
+import random
+import sys
+import time
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).resolve().parents[1]))
+sys.path.insert(0, str(Path(__file__).resolve().parents[1] / "tests"))
+
+from fake_process import FakeProcess  # noqa: E402
+from pywinbot import MemoryReader  # noqa: E402
+from pywinbot.backend import FakeBackend, set_backend  # noqa: E402
+
+BASE = 0x140000000
+PATTERN = "48 8B 05 ?? ?? ?? ?? 48 85 C0 74 ?? 8B 48 ??"
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--size", type=int, default=100,
+                        help="module size in MB")
+    parser.add_argument("--repeat", type=int, default=5)
+    args = parser.parse_args()
+
+    size = args.size * 0x100000
+    # Random bytes, so the anchor byte 0x48 appears every 256 bytes and
+    # many candidates have to be verified, like in real code sections
+    module = bytearray(random.Random(0).randbytes(size))
+    match = size - 0x1234
+    module[match:match + 15] = bytes.fromhex(
+        "48 8B 05 10 00 00 00 48 85 C0 74 05 8B 48 08")
+
+    process = FakeProcess()
+    process.map(BASE, module)
+    process.modules.append(("game.exe", BASE, size, "C:\\game.exe"))
+    set_backend(FakeBackend(process.functions()))
+
+    memory_reader = MemoryReader("game.exe", window_class="Game")
+
+    times = []
+    for _ in range(args.repeat):
+        start = time.perf_counter()
+        found = memory_reader.scan_signature(PATTERN)
+        times.append(time.perf_counter() - start)
+
+    assert [int(address) for address in found] == [BASE + match], found
+
+    best = min(times)
+    print(f"module: {args.size} MB, matches: {len(found)}")
+    print(f"best: {best * 1000:.1f} ms ({args.size / best:.0f} MB/s), "
+          f"mean: {sum(times) / len(times) * 1000:.1f} ms")
+    print(f"ReadProcessMemory calls: "
+          f"{process.calls['ReadProcessMemory'] // args.repeat} per scan")
+
+
+if __name__ == "__main__":
+    main()
@@ -1,5 +1,48 @@
-# Memory Reader
-from .memory_reader.memory_reader import MemoryReader  # noqa F401
-from .memory_reader.address import Address  # noqa F401
+from importlib import import_module
 
-from .window_message_poster.window_message_poster import WindowMessagePoster  # noqa F401
+# Submodules are imported on first access, so importing pywinbot does
+# not load any Win32 function.
+_exports = {
+    # Memory Reader
+    "MemoryReader": ".memory_reader.memory_reader",
+    "DumpReader": ".memory_reader.dump",
+    "ValuePublisher": ".memory_reader.shared_values",
+    "ValueSubscriber": ".memory_reader.shared_values",
+    "AsyncMemoryReader": ".memory_reader.async_memory_reader",
+    "FreezeEngine": ".memory_reader.freeze",
+    "Watcher": ".memory_reader.watcher",
+    "Address": ".memory_reader.address",
+    "AddressArray": ".memory_reader.address_array",
+    "Field": ".memory_reader.schema",
+    "Pointer": ".memory_reader.schema",
+    "Schema": ".memory_reader.schema",
+    "Signature": ".memory_reader.signature",
+    "PointerScanner": ".memory_reader.pointer_scanner",
+    "PointerPaths": ".memory_reader.pointer_scanner",
+    "ValueScanner": ".memory_reader.value_scanner",
+
+    "WindowMessagePoster": ".window_message_poster.window_message_poster",
+    "AsyncWindowMessagePoster":
+        ".window_message_poster.async_window_message_poster",
+    "InputScheduler": ".window_message_poster.input_scheduler",
+    "Macro": ".window_message_poster.macro",
+    "WindowGroup": ".window_message_poster.window_group",
+}
+
+__all__ = list(_exports)
+
+
+def __getattr__(name: str):
+    try:
+        module = _exports[name]
+    except KeyError:
+        raise AttributeError(
+            f"module {__name__!r} has no attribute {name!r}") from None
+
+    value = getattr(import_module(module, __name__), name)
+    globals()[name] = value
+    return value
+
+
+def __dir__():
+    return sorted(set(globals()) | set(__all__))
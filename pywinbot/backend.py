@@ -0,0 +1,124 @@
+from typing import Any, Callable, Dict, List
+
+# All WinFunctions, so they can be reset when the backend changes
+_registry: List["WinFunction"] = []
+
+
+class WindllBackend:
+    """Default backend, loads functions from ctypes.windll."""
+
+    def load(self, function: "WinFunction") -> Callable:
+        # Only available on Windows, so they are imported on first use
+        try:
+            from ctypes import WINFUNCTYPE, windll
+        except ImportError:
+            raise OSError("Win32 functions are only available on Windows, "
+                          "use set_backend to use a different backend."
+                          ) from None
+
+        # A private prototype, so argtypes set by other libraries on
+        # the shared windll function objects do not matter.
+        prototype = WINFUNCTYPE(function.restype, *function.argtypes)
+        return prototype((function.name, getattr(windll, function.dll)))
+
+
+class FakeBackend:
+    def __init__(self, functions: Dict[str, Callable]):
+        """Backend that calls python functions instead of the Win32 API,
+        e.g. to run bots against a simulated process.
+
+        Args:
+            functions (Dict[str, Callable]): Maps function names like
+                "ReadProcessMemory" to callables. They are called with
+                the same arguments as the Win32 function and have to
+                return what it would return.
+
+        To use:
+        >>> def read_process_memory(handle, address, buffer, size, read):
+                ctypes.memmove(buffer, fake_memory[address:], size)
+                return 1
+
+        >>> set_backend(FakeBackend({
+                "ReadProcessMemory": read_process_memory,
+                ...
+            }))
+        """
+
+        self.functions = functions
+
+    def load(self, function: "WinFunction") -> Callable:
+        try:
+            return self.functions[function.name]
+        except KeyError:
+            raise NotImplementedError(
+                f"{function.dll}.{function.name} is not provided by "
+                "the backend.") from None
+
+
+_backend: Any = WindllBackend()
+
+
+def get_backend():
+    """Returns the backend Win32 functions are loaded from.
+
+    Returns:
+        The current backend.
+    """
+    return _backend
+
+
+def set_backend(backend) -> None:
+    """Sets the backend Win32 functions are loaded from. Every function
+    is loaded again from the new backend on its next call.
+
+    Args:
+        backend: An object with a load(function) method, returning the
+            callable for a WinFunction, e.g. WindllBackend or FakeBackend.
+    """
+
+    global _backend
+    _backend = backend
+
+    for function in _registry:
+        function._func = None
+
+
+class WinFunction:
+    def __init__(
+        self,
+        dll: str,
+        name: str,
+        argtypes: List[Any],
+        restype: Any,
+    ):
+        """A Win32 function that is loaded and prototyped once, on its
+        first call, instead of on every call.
+
+        Args:
+            dll (str): Name of the DLL, e.g. "kernel32".
+            name (str): Name of the function, e.g. "ReadProcessMemory".
+            argtypes (List[Any]): ctypes types of the arguments.
+            restype (Any): ctypes type of the return value.
+        """
+
+        self.dll = dll
+        self.name = name
+        self.argtypes = argtypes
+        self.restype = restype
+
+        self._func = None
+        _registry.append(self)
+
+    def __repr__(self) -> str:
+        return f"<WinFunction {self.dll}.{self.name}>"
+
+    def __call__(self, *args):
+        func = self._func
+        if func is None:
+            func = self._load()
+
+        return func(*args)
+
+    def _load(self) -> Callable:
+        self._func = _backend.load(self)
+        return self._func
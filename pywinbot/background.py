@@ -0,0 +1,85 @@
+import threading
+import time
+
+
+class Worker:
+    def __init__(self):
+        """Base class for objects that work in a background thread. It
+        owns the thread and its stop event, subclasses implement _run,
+        which has to return soon after _stop is set.
+
+        To use:
+        >>> class Printer(Worker):
+                def _run(self):
+                    while not self._stop.wait(1):
+                        print("still running")
+
+        >>> printer = Printer()
+        >>> printer.start()
+        >>> printer.stop()
+        """
+
+        self._stop = threading.Event()
+        self._thread = None
+
+    @property
+    def running(self) -> bool:
+        """Returns whether the background thread is running.
+
+        Returns:
+            bool: True if running.
+        """
+        return self._thread is not None and self._thread.is_alive()
+
+    def start(self) -> None:
+        """Starts the background thread."""
+
+        if self.running:
+            return
+
+        self._stop.clear()
+        self._thread = threading.Thread(target=self._run,
+                                        name=type(self).__name__,
+                                        daemon=True)
+        self._thread.start()
+
+    def stop(self) -> None:
+        """Stops the background thread and waits for it to finish."""
+
+        self._stop.set()
+        self._wake()
+        if self._thread is not None:
+            self._thread.join()
+            self._thread = None
+
+    def _wake(self) -> None:
+        # Called by stop after _stop is set. Subclasses that wait on
+        # something else than _stop interrupt that wait here.
+        pass
+
+    def _run(self) -> None:
+        raise NotImplementedError
+
+
+class TickWorker(Worker):
+    """Worker that calls tick() every interval seconds. Subclasses
+    implement tick and set interval."""
+
+    interval = 0.05
+
+    def tick(self):
+        raise NotImplementedError
+
+    def _run(self) -> None:
+        next_tick = time.monotonic()
+        while not self._stop.is_set():
+            self.tick()
+
+            next_tick += self.interval
+            delay = next_tick - time.monotonic()
+            if delay < 0:
+                # Fell behind, do not try to catch up
+                next_tick = time.monotonic()
+                delay = 0
+
+            self._stop.wait(delay)
@@ -1,9 +1,19 @@
+from functools import lru_cache
 from typing import Union
 
 
-class Address:
+@lru_cache(maxsize=4096)
+def _parse_hex(string: str) -> int:
+    return int(string, 16)
+
+
+class Address(int):
     """A class used to easier represent memory addresses.
 
+    Addresses are integers, so they hash, compare and format like one.
+    The hex string is only built when it is used. Addresses created from
+    a string keep that string as address_string.
+
     To use:
     >>> addr = Address("10BC4AF0")
     <Address hex=10BC4AF0 decimal=280775408>
@@ -15,36 +25,75 @@ class Address:
     <Address hex=10BC4AFE decimal=280775422>
     >>> addr += Address("10BA0170")
     <Address hex=21764C6E decimal=561400942>
+    >>> addr - Address("21764C60")
+    14
     """
-    def __init__(self, address: Union[int, str]):
-        """Initalizes Address class.
+
+    __slots__ = ()
+
+    def __new__(cls, address: Union[int, str]) -> "Address":
+        """Creates an Address.
 
         Args:
             address (Union[int, str]): the address either as a string
                 or as an integer.
         """
+        if isinstance(address, str) and cls is Address:
+            self = int.__new__(_StringAddress, _parse_hex(address))
+            self._string = address
+            return self
+
         if isinstance(address, str):
-            self.address_string = address
-            self.address_decimal = int(address, 16)
+            address = _parse_hex(address)
+
+        return int.__new__(cls, address)
+
+    @property
+    def address_decimal(self) -> int:
+        return int(self)
 
-        elif isinstance(address, int):
-            self.address_string = hex(address)
-            self.address_decimal = address
+    @property
+    def address_string(self) -> str:
+        return hex(self)
 
     def __repr__(self) -> str:
-        # Formats 0x10bc4af0 to 10BC4AF0
-        string = self.address_string.replace("0x", "").upper()
-        return f"<Address hex={string} decimal={self.address_decimal}>"
+        return f"<Address hex={int(self):X} decimal={int(self)}>"
 
     def __add__(self, other: Union["Address", str, int]) -> "Address":
         if isinstance(other, str):
-            return Address(self.address_decimal + int(other, 16))
+            other = _parse_hex(other)
+        elif not isinstance(other, int):
+            return NotImplemented
+
+        return int.__new__(Address, int.__add__(self, other))
+
+    __radd__ = __add__
+
+    def __sub__(
+        self,
+        other: Union["Address", str, int],
+    ) -> Union["Address", int]:
+        # The distance between two addresses is a plain integer
+        if isinstance(other, Address):
+            return int.__sub__(self, other)
+
+        if isinstance(other, str):
+            other = _parse_hex(other)
+        elif not isinstance(other, int):
+            return NotImplemented
+
+        return int.__new__(Address, int.__sub__(self, other))
+
+    def __mul__(self, other: int) -> "Address":
+        if not isinstance(other, int):
+            return NotImplemented
 
-        elif isinstance(other, int):
-            return Address(self.address_decimal + other)
+        return int.__new__(Address, int.__mul__(self, other))
 
-        elif isinstance(other, Address):
-            return Address(self.address_decimal + other.address_decimal)
 
-    def __mul__(self, other: int):
-        return Address(self.address_decimal * other)
+class _StringAddress(Address):
+    # Only addresses created from a string carry a __dict__ for it,
+    # results of calculations are plain Addresses again
+    @property
+    def address_string(self) -> str:
+        return self._string
@@ -0,0 +1,103 @@
+from typing import Iterable, Iterator, List, Tuple, Union
+
+import numpy as np
+
+from .address import Address
+
+
+class AddressArray:
+    __slots__ = ("_values",)
+
+    def __init__(self, addresses: Union[Iterable[int], np.ndarray]):
+        """Many addresses in a NumPy uint64 array, for offset math over
+        thousands of addresses at once. Requires numpy.
+
+        Args:
+            addresses (Union[Iterable[int], np.ndarray]): The addresses,
+                as Address, int or an array.
+
+        To use:
+        >>> entities = AddressArray(mr.read_array(list_addr, "<u8", 500))
+        >>> healths = mr.read_many((entities + "1A0").requests("i"))
+        >>> grid = entities[:, None] + [0x10, 0x14, 0x18]  # x, y, z
+        """
+
+        if isinstance(addresses, AddressArray):
+            addresses = addresses._values
+        elif not isinstance(addresses, np.ndarray):
+            addresses = list(addresses)
+
+        self._values = np.asarray(addresses, dtype=np.uint64)
+
+    @property
+    def values(self) -> np.ndarray:
+        """Returns the underlying array.
+
+        Returns:
+            np.ndarray: uint64 array of the addresses.
+        """
+        return self._values
+
+    @property
+    def shape(self) -> Tuple[int, ...]:
+        return self._values.shape
+
+    def __len__(self) -> int:
+        return len(self._values)
+
+    def __iter__(self) -> Iterator[Address]:
+        return (Address(value) for value in self._values.flat)
+
+    def __repr__(self) -> str:
+        return f"<AddressArray size={self._values.size}>"
+
+    def __getitem__(self, index) -> Union[Address, "AddressArray"]:
+        value = self._values[index]
+        if isinstance(value, np.ndarray):
+            return AddressArray(value)
+
+        return Address(int(value))
+
+    def __add__(self, other) -> "AddressArray":
+        return AddressArray(self._values + _offsets(other))
+
+    __radd__ = __add__
+
+    def __sub__(self, other) -> "AddressArray":
+        return AddressArray(self._values - _offsets(other))
+
+    def requests(
+        self,
+        unpack_type: str,
+        buffer_size: Union[int, None] = None,
+    ) -> List[Union[Tuple[Address, str], Tuple[Address, str, int]]]:
+        """Returns read requests for MemoryReader.read_many.
+
+        Args:
+            unpack_type (str): The data type to unpack for every address.
+            buffer_size (Union[int, None], optional): Needed for 'str'.
+
+        Returns:
+            List[Union[Tuple[Address, str], Tuple[Address, str, int]]]:
+                (address, unpack_type) tuples in the order of the array.
+        """
+
+        if buffer_size is None:
+            return [(Address(value), unpack_type)
+                    for value in self._values.ravel().tolist()]
+
+        return [(Address(value), unpack_type, buffer_size)
+                for value in self._values.ravel().tolist()]
+
+
+def _offsets(other) -> np.ndarray:
+    if isinstance(other, str):
+        other = int(other, 16)
+    elif isinstance(other, AddressArray):
+        return other._values
+    elif isinstance(other, (list, tuple)):
+        other = [int(offset, 16) if isinstance(offset, str) else offset
+                 for offset in other]
+
+    # Negative offsets wrap around, just like uint64 addition does
+    return np.asarray(other, dtype=np.int64).astype(np.uint64)
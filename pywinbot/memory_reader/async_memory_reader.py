@@ -0,0 +1,184 @@
+import asyncio
+from concurrent.futures import ThreadPoolExecutor
+from functools import partial
+from struct import calcsize, error
+from typing import List, Sequence, Tuple, Type, Union
+
+from .address import Address
+from .memory_reader import MemoryReader
+from .schema import Schema
+
+
+class _Failed:
+    # Marks a request of a batch that raised
+    __slots__ = ("exception",)
+
+    def __init__(self, exception: Exception):
+        self.exception = exception
+
+
+class AsyncMemoryReader:
+    def __init__(
+        self,
+        memory_reader: MemoryReader,
+        max_workers: int = 2,
+    ):
+        """asyncio front-end for a MemoryReader. Calls run on a small
+        thread pool, and all read() calls made in the same event loop
+        iteration are merged into a single read_many.
+
+        Args:
+            memory_reader (MemoryReader): The reader to use.
+            max_workers (int, optional): Number of threads reading at
+                the same time.
+
+        To use:
+        >>> amr = AsyncMemoryReader(MemoryReader(...))
+        >>> health, mana = await asyncio.gather(
+                amr.read(Address("ABC123456"), "i", 4),
+                amr.read(Address("ABC12345A"), "i", 4),
+            )  # one read_many
+        """
+
+        self._memory_reader = memory_reader
+        self._executor = ThreadPoolExecutor(max_workers,
+                                            "AsyncMemoryReader")
+        self._pending: List[Tuple[tuple, asyncio.Future]] = []
+
+    @property
+    def memory_reader(self) -> MemoryReader:
+        """Returns the wrapped MemoryReader.
+
+        Returns:
+            MemoryReader: The reader.
+        """
+        return self._memory_reader
+
+    async def read(
+        self,
+        address: Address,
+        unpack_type: str,
+        buffer_size: int,
+    ) -> Union[str, int, float, None]:
+        """See MemoryReader.read. Reads of the same event loop iteration
+        are batched. Invalid requests raise here like in MemoryReader.read
+        and are not added to the batch.
+        """
+
+        if unpack_type != "str":
+            size = calcsize(unpack_type)
+            if size > buffer_size:
+                raise error(f"unpack requires a buffer of {size} bytes")
+
+        loop = asyncio.get_running_loop()
+        future = loop.create_future()
+
+        if not self._pending:
+            loop.call_soon(self._flush, loop)
+        self._pending.append(((address, unpack_type, buffer_size), future))
+
+        return await future
+
+    async def read_many(
+        self,
+        requests: Sequence[tuple],
+        **kwargs,
+    ) -> List[Union[str, int, float, None]]:
+        """See MemoryReader.read_many."""
+        return await self._run(self._memory_reader.read_many, requests,
+                               **kwargs)
+
+    async def write(
+        self,
+        address: Address,
+        value: Union[int, float, str],
+        buffer_size: int,
+    ) -> bool:
+        """See MemoryReader.write."""
+        return await self._run(self._memory_reader.write, address, value,
+                               buffer_size)
+
+    async def write_many(self, writes: Sequence[tuple],
+                         **kwargs) -> List[bool]:
+        """See MemoryReader.write_many."""
+        return await self._run(self._memory_reader.write_many, writes,
+                               **kwargs)
+
+    async def get_final_pointer(
+        self,
+        base_pointer_addr: Union[Address, str],
+        offsets: List[str],
+    ) -> Union[Address, None]:
+        """See MemoryReader.get_final_pointer."""
+        return await self._run(self._memory_reader.get_final_pointer,
+                               base_pointer_addr, offsets)
+
+    async def resolve_pointers(
+        self,
+        chains: Sequence[Tuple[Union[Address, str], List[str]]],
+    ) -> List[Union[Address, None]]:
+        """See MemoryReader.resolve_pointers."""
+        return await self._run(self._memory_reader.resolve_pointers, chains)
+
+    async def read_struct(
+        self,
+        address: Address,
+        schema: Type[Schema],
+    ) -> Union[Tuple, None]:
+        """See MemoryReader.read_struct."""
+        return await self._run(self._memory_reader.read_struct, address,
+                               schema)
+
+    async def read_string(self, address: Address,
+                          **kwargs) -> Union[str, None]:
+        """See MemoryReader.read_string."""
+        return await self._run(self._memory_reader.read_string, address,
+                               **kwargs)
+
+    def close(self) -> None:
+        """Shuts the thread pool down. The MemoryReader stays open."""
+        self._executor.shutdown(wait=True)
+
+    async def _run(self, func, *args, **kwargs):
+        loop = asyncio.get_running_loop()
+        return await loop.run_in_executor(self._executor,
+                                          partial(func, *args, **kwargs))
+
+    def _flush(self, loop: asyncio.AbstractEventLoop) -> None:
+        pending, self._pending = self._pending, []
+        requests = [request for request, _ in pending]
+
+        def done(task: asyncio.Future) -> None:
+            error = task.exception()
+            for index, (_, future) in enumerate(pending):
+                if future.cancelled():
+                    continue
+                if error is not None:
+                    future.set_exception(error)
+                    continue
+
+                result = task.result()[index]
+                if isinstance(result, _Failed):
+                    future.set_exception(result.exception)
+                else:
+                    future.set_result(result)
+
+        task = loop.run_in_executor(self._executor, self._read_batch,
+                                    requests)
+        task.add_done_callback(done)
+
+    def _read_batch(self, requests: List[tuple]) -> list:
+        try:
+            return self._memory_reader.read_many(requests)
+        except Exception:
+            pass
+
+        # Read one by one, so only the failing requests fail
+        results = []
+        for request in requests:
+            try:
+                results.append(self._memory_reader.read(*request))
+            except Exception as exception:
+                results.append(_Failed(exception))
+
+        return results
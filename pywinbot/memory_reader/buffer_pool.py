@@ -0,0 +1,60 @@
+from ctypes import Array, c_char
+from typing import Dict, List
+
+
+class BufferPool:
+    def __init__(self, max_size: int = 0x10000):
+        """Pool of reusable ctypes buffers, so reading and writing does
+        not allocate a new buffer on every call.
+
+        Buffers are grouped in size classes of powers of two. Requests
+        bigger than max_size get a new buffer that is not pooled.
+
+        Args:
+            max_size (int, optional): Size of the largest pooled buffer.
+
+        To use:
+        >>> pool = BufferPool()
+        >>> buffer = pool.acquire(4)
+        >>> ...
+        >>> pool.release(buffer)
+        """
+
+        self.max_size = max_size
+        self._free: Dict[int, List[Array]] = {}
+
+    def acquire(self, size: int) -> Array:
+        """Returns a buffer of at least size bytes. Its content is
+        undefined.
+
+        Args:
+            size (int): Minimum size in bytes.
+
+        Returns:
+            Array: A ctypes char array.
+        """
+
+        size_class = 8
+        while size_class < size:
+            size_class <<= 1
+
+        free = self._free.get(size_class)
+        if free:
+            # list.pop is atomic, so threads never get the same buffer
+            try:
+                return free.pop()
+            except IndexError:
+                pass
+
+        return (c_char * size_class)()
+
+    def release(self, buffer: Array) -> None:
+        """Returns a buffer to the pool.
+
+        Args:
+            buffer (Array): A buffer from acquire.
+        """
+
+        size = len(buffer)
+        if size <= self.max_size:
+            self._free.setdefault(size, []).append(buffer)
@@ -0,0 +1,318 @@
+import json
+import mmap
+import struct
+from bisect import bisect_right
+from struct import calcsize, error, unpack_from
+from typing import (TYPE_CHECKING, Iterable, List, Sequence, Tuple, Union)
+
+from .address import Address
+from .flags import MEM_COMMIT, PAGE_READONLY
+from .module_map import Module, ModuleMap
+from .regions import MemoryRegion, RegionMap
+
+if TYPE_CHECKING:
+    from .memory_reader import MemoryReader
+
+MAGIC = b"PWBDUMP\x01"
+
+# magic, pointer size, offset of the region index, size of the index
+_PREAMBLE = struct.Struct("<8sIQQ")
+
+PAGE_SIZE = 0x1000
+
+
+def write_dump(
+    path: str,
+    memory_reader: "MemoryReader",
+    regions: Union[Iterable[Tuple[Union[Address, int], int]], None] = None,
+    chunk_size: int = 0x100000,
+) -> int:
+    """Writes process memory to a dump file, see MemoryReader.dump.
+
+    The file starts with a preamble pointing to a JSON region index at
+    its end. Every dumped range is stored page aligned, so it can be
+    mapped and sliced without copying. Ranges are read chunk by chunk;
+    chunks that cannot be read are left out and split the range. A range
+    that starts where the previous one ended is stored as part of it, so
+    reads can span both.
+
+    Returns:
+        int: Number of bytes dumped.
+    """
+
+    region_map = memory_reader.regions()
+    if regions is None:
+        regions = region_map.readable_ranges()
+
+    buffer = bytearray(chunk_size)
+    view = memoryview(buffer)
+    entries = []
+    dumped = 0
+
+    with open(path, "wb") as file:
+        file.write(_PREAMBLE.pack(MAGIC, memory_reader.pointer_size, 0, 0))
+
+        for start, size in regions:
+            start = int(start)
+            entry = None
+
+            for offset in range(0, size, chunk_size):
+                address = start + offset
+                length = min(chunk_size, size - offset)
+                if not memory_reader.read_into(Address(address),
+                                               view[:length]):
+                    entry = None
+                    continue
+
+                if (entry is None and entries
+                        and entries[-1][0] + entries[-1][1] == address):
+                    # Directly follows the last entry, which is also the
+                    # last data written to the file
+                    entry = entries[-1]
+
+                if entry is None:
+                    file.write(bytes(-file.tell() % PAGE_SIZE))
+                    region = region_map.region_of(address)
+                    entry = [address, 0, file.tell(),
+                             region.protect if region else PAGE_READONLY,
+                             region.type if region else 0,
+                             region.module if region else None]
+                    entries.append(entry)
+
+                file.write(view[:length])
+                entry[1] += length
+                dumped += length
+
+        index = json.dumps({
+            "module_offset": _int_or_none(memory_reader._module_offset),
+            "modules": [[module.name, int(module.base), module.size,
+                         module.path]
+                        for module in memory_reader.modules],
+            "regions": entries,
+        }).encode()
+
+        index_offset = file.tell()
+        file.write(index)
+        file.seek(0)
+        file.write(_PREAMBLE.pack(MAGIC, memory_reader.pointer_size,
+                                  index_offset, len(index)))
+
+    return dumped
+
+
+def _int_or_none(value) -> Union[int, None]:
+    return None if value is None else int(value)
+
+
+class DumpReader:
+    def __init__(self, path: str):
+        """Reads a dump written by MemoryReader.dump, with the same read
+        interface as MemoryReader. The file is memory mapped, so opening
+        it only reads the region index, reads are slices of the mapping
+        and several processes can open the same dump.
+
+        Args:
+            path (str): Path of the dump.
+
+        To use:
+        >>> mr = MemoryReader(...)
+        >>> mr.dump("game.dump")
+        >>> dump = DumpReader("game.dump")
+        >>> addr = dump.get_final_pointer("game.dll+1A2B30", ["40", "20A"])
+        >>> dump.read(addr, "i", 4)
+        """
+
+        self._file = open(path, "rb")
+        try:
+            self._mmap = mmap.mmap(self._file.fileno(), 0,
+                                   access=mmap.ACCESS_READ)
+        except ValueError:
+            # Empty files can not be mapped
+            self._file.close()
+            raise ValueError(f"{path} is not a dump file") from None
+
+        self._view = memoryview(self._mmap)
+
+        if len(self._view) < _PREAMBLE.size:
+            self.close()
+            raise ValueError(f"{path} is not a dump file")
+
+        magic, pointer_size, index_offset, index_size = \
+            _PREAMBLE.unpack_from(self._view)
+        if magic != MAGIC:
+            self.close()
+            raise ValueError(f"{path} is not a dump file")
+
+        index = json.loads(bytes(
+            self._view[index_offset:index_offset + index_size]))
+
+        self._pointer_size = pointer_size
+        self._pointer_format = "I" if pointer_size == 4 else "Q"
+
+        self._module_map = ModuleMap(0, [
+            Module(name, Address(base), size, module_path)
+            for name, base, size, module_path in index["modules"]
+        ])
+        module_offset = index["module_offset"]
+        self._module_offset = (None if module_offset is None
+                               else Address(module_offset))
+
+        self._entries = sorted(tuple(entry) for entry in index["regions"])
+        self._starts = [entry[0] for entry in self._entries]
+
+    def __enter__(self) -> "DumpReader":
+        return self
+
+    def __exit__(self, *args) -> None:
+        self.close()
+
+    def __repr__(self) -> str:
+        return f"<DumpReader regions={len(self._entries)}>"
+
+    @property
+    def pointer_size(self) -> int:
+        """Returns the pointer size of the dumped process.
+
+        Returns:
+            int: 4 or 8.
+        """
+        return self._pointer_size
+
+    @property
+    def modules(self) -> ModuleMap:
+        """Returns the modules of the dumped process.
+
+        Returns:
+            ModuleMap: The modules.
+        """
+        return self._module_map
+
+    def regions(self, refresh: bool = False) -> RegionMap:
+        """Returns the dumped ranges as a region index, like
+        MemoryReader.regions.
+
+        Args:
+            refresh (bool, optional): Ignored, a dump does not change.
+
+        Returns:
+            RegionMap: The region index.
+        """
+        return RegionMap(MemoryRegion(start, size, MEM_COMMIT, protect,
+                                      region_type, module)
+                         for start, size, _, protect, region_type, module
+                         in self._entries)
+
+    def view(self, address: Union[Address, int],
+             size: int) -> Union[memoryview, None]:
+        """Returns a view of dumped memory without copying it.
+
+        Args:
+            address (Union[Address, int]): Start of the memory.
+            size (int): Size in bytes.
+
+        Returns:
+            Union[memoryview, None]: The view or None if the memory is not
+                in the dump.
+        """
+
+        address = int(address)
+        index = bisect_right(self._starts, address) - 1
+        if index < 0:
+            return None
+
+        start, region_size, file_offset = self._entries[index][:3]
+        if address + size > start + region_size:
+            return None
+
+        offset = file_offset + address - start
+        return self._view[offset:offset + size]
+
+    def read(
+        self,
+        address: Address,
+        unpack_type: str,
+        buffer_size: int
+    ) -> Union[str, int, float, None]:
+        """Reads dumped memory, see MemoryReader.read."""
+
+        if unpack_type == "str":
+            view = self.view(address, buffer_size)
+            if view is None:
+                return None
+            from .memory_reader import MemoryReader
+            return MemoryReader._decode_string(bytes(view))
+
+        view = self.view(address, buffer_size)
+        if view is None:
+            return None
+
+        size = calcsize(unpack_type)
+        if size > buffer_size:
+            raise error(f"unpack requires a buffer of {size} bytes")
+        return unpack_from(unpack_type, view)[0]
+
+    def read_many(
+        self,
+        requests: Sequence[Union[Tuple[Address, str],
+                                 Tuple[Address, str, int]]],
+        **kwargs,
+    ) -> List[Union[str, int, float, None]]:
+        """Reads many values, see MemoryReader.read_many. Every value is
+        a slice of the mapping, so no merging is needed."""
+
+        return [self.read(request[0], request[1],
+                          request[2] if len(request) > 2
+                          else calcsize(request[1]))
+                for request in requests]
+
+    def read_into(self, address: Address, buffer) -> bool:
+        """Copies dumped memory into a buffer, see MemoryReader.read_into.
+        """
+
+        target = memoryview(buffer).cast("B")
+        view = self.view(address, target.nbytes)
+        if view is None:
+            return False
+
+        target[:] = view
+        return True
+
+    def get_final_pointer(
+        self,
+        base_pointer_addr: Union[Address, str],
+        offsets: List[str]
+    ) -> Union[Address, None]:
+        """Follows a pointer chain through the dump, see
+        MemoryReader.get_final_pointer."""
+
+        if isinstance(base_pointer_addr, str) and "+" in base_pointer_addr:
+            addr = self._module_map.resolve(base_pointer_addr)
+        else:
+            addr = self._module_offset + base_pointer_addr
+
+        for index, offset in enumerate(offsets):
+            pointer = self.read(addr, self._pointer_format,
+                                self._pointer_size)
+            if pointer is None:
+                return None
+
+            if index == len(offsets)-1:
+                return Address(pointer) + offsets[-1]
+            addr = Address(pointer) + offset
+
+    def resolve_pointers(
+        self,
+        chains: Sequence[Tuple[Union[Address, str], List[str]]],
+    ) -> List[Union[Address, None]]:
+        """Resolves many pointer chains, see
+        MemoryReader.resolve_pointers."""
+        return [self.get_final_pointer(base, offsets)
+                for base, offsets in chains]
+
+    def close(self) -> None:
+        """Unmaps and closes the file. Views returned by view must be
+        released before."""
+
+        self._view.release()
+        self._mmap.close()
+        self._file.close()
@@ -0,0 +1,147 @@
+import struct
+import threading
+import time
+from typing import TYPE_CHECKING, Dict, Hashable, Tuple, Union
+
+from ..background import TickWorker
+from .address import Address
+
+if TYPE_CHECKING:
+    from .memory_reader import MemoryReader
+
+
+class FreezeEngine(TickWorker):
+    def __init__(
+        self,
+        memory_reader: "MemoryReader",
+        interval: float = 0.05,
+    ):
+        """Keeps values locked by writing them again whenever they
+        drifted. All locked values are read with one batched read per
+        tick, and only those that changed are written back.
+
+        Args:
+            memory_reader (MemoryReader): The reader to read and write
+                with.
+            interval (float, optional): Seconds between two ticks.
+
+        To use:
+        >>> mr = MemoryReader(...)
+        >>> engine = FreezeEngine(mr, interval=0.1)
+        >>> engine.lock(Address("ABC123456"), "i", 100, name="health")
+        >>> engine.start()
+        >>> ...
+        >>> engine.write_counts["health"]
+        3
+        >>> engine.stop()
+        """
+
+        super().__init__()
+
+        self._memory_reader = memory_reader
+        self.interval = interval
+
+        self._locks: Dict[Hashable, Tuple[Address, str, bytes]] = {}
+        self._mutex = threading.Lock()
+
+        self.write_counts: Dict[Hashable, int] = {}
+        self.ticks = 0
+        self.last_latency = 0.0
+        self.max_latency = 0.0
+        self._total_latency = 0.0
+
+    def __enter__(self) -> "FreezeEngine":
+        self.start()
+        return self
+
+    def __exit__(self, *args) -> None:
+        self.stop()
+
+    @property
+    def average_latency(self) -> float:
+        """Returns the average time a tick took, in seconds.
+
+        Returns:
+            float: Average tick duration.
+        """
+        return self._total_latency / self.ticks if self.ticks else 0.0
+
+    def lock(
+        self,
+        address: Address,
+        pack_type: str,
+        value: Union[int, float, bytes],
+        name: Union[Hashable, None] = None,
+    ) -> Hashable:
+        """Locks a value. Locking the same name again replaces the lock.
+
+        Args:
+            address (Address): The address of the value.
+            pack_type (str): struct format of the value, e.g. 'i', 'f' or
+                '16s' for 16 bytes.
+            value (Union[int, float, bytes]): The value to keep.
+            name (Union[Hashable, None], optional): Name of the lock.
+                Defaults to the address.
+
+        Returns:
+            Hashable: The name of the lock.
+        """
+
+        if name is None:
+            name = address
+
+        with self._mutex:
+            self._locks[name] = (address, pack_type,
+                                 struct.pack(pack_type, value))
+            self.write_counts.setdefault(name, 0)
+
+        return name
+
+    def unlock(self, name: Hashable) -> None:
+        """Removes a lock.
+
+        Args:
+            name (Hashable): The name of the lock.
+        """
+
+        with self._mutex:
+            self._locks.pop(name, None)
+
+    def tick(self) -> int:
+        """Reads all locked values once and writes those that drifted.
+        Called by the background thread, but can be used without it.
+
+        Returns:
+            int: Number of values written.
+        """
+
+        start = time.perf_counter()
+
+        with self._mutex:
+            locks = list(self._locks.items())
+
+        current = self._memory_reader.read_many([
+            (address, f"{len(packed)}s") for _, (address, _, packed) in locks
+        ])
+
+        drifted = [(name, address, packed)
+                   for (name, (address, _, packed)), value
+                   in zip(locks, current)
+                   if value is not None and value != packed]
+
+        if drifted:
+            results = self._memory_reader.write_many([
+                (address, "str", packed) for _, address, packed in drifted
+            ])
+
+            for (name, _, _), success in zip(drifted, results):
+                if success and name in self.write_counts:
+                    self.write_counts[name] += 1
+
+        latency = time.perf_counter() - start
+        self.ticks += 1
+        self.last_latency = latency
+        self.max_latency = max(self.max_latency, latency)
+        self._total_latency += latency
+
+        return len(drifted)
@@ -1,9 +1,15 @@
-from ctypes import POINTER, c_size_t, windll
-from ctypes.wintypes import (BOOL, DWORD, HANDLE, HWND, LPCSTR, LPCVOID,
-                             LPDWORD, LPVOID)
+from ctypes import POINTER, c_size_t
+from ctypes.wintypes import (BOOL, DWORD, HANDLE, HMODULE, HWND, LPCSTR,
+                             LPCVOID, LPDWORD, LPFILETIME, LPVOID, PBOOL)
 from typing import Union
 
-from .structures import MODULEENTRY32
+from ..backend import WinFunction
+from .structures import MEMORY_BASIC_INFORMATION, MODULEENTRY32
+
+
+_OpenProcess = WinFunction("kernel32", "OpenProcess",
+                           [DWORD, BOOL, DWORD],
+                           HANDLE)
 
 
 def OpenProcess(
@@ -12,11 +18,13 @@ def OpenProcess(
     dwProcessId: DWORD,
 ) -> Union[HANDLE, None]:
     # https://docs.microsoft.com/en-us/windows/win32/api/processthreadsapi/nf-processthreadsapi-openprocess
-    func = windll.kernel32.OpenProcess
-    func.argtypes = [DWORD, BOOL, DWORD]
-    func.restype = HANDLE
+    return _OpenProcess(dwDesiredAccess, bInheritHandle, dwProcessId)
+
 
-    return func(dwDesiredAccess, bInheritHandle, dwProcessId)
+_ReadProcessMemory = WinFunction("kernel32", "ReadProcessMemory",
+                                 [HANDLE, LPCVOID, LPVOID, c_size_t,
+                                  POINTER(c_size_t)],
+                                 BOOL)
 
 
 def ReadProcessMemory(
@@ -27,14 +35,17 @@ def ReadProcessMemory(
     lpNumberOfBytesRead: POINTER(c_size_t),
 ) -> bool:
     # https://docs.microsoft.com/de-de/windows/win32/api/memoryapi/nf-memoryapi-readprocessmemory
-    func = windll.kernel32.ReadProcessMemory
-    func.argtypes = [HANDLE, LPCVOID, LPVOID, c_size_t, POINTER(c_size_t)]
-    func.restype = BOOL
-
-    res = func(hProcess, lpBaseAddress, lpBuffer, nSize, lpNumberOfBytesRead)
+    res = _ReadProcessMemory(hProcess, lpBaseAddress, lpBuffer, nSize,
+                             lpNumberOfBytesRead)
     return bool(res)
 
 
+_WriteProcessMemory = WinFunction("kernel32", "WriteProcessMemory",
+                                  [HANDLE, LPCVOID, LPVOID, c_size_t,
+                                   POINTER(c_size_t)],
+                                  BOOL)
+
+
 def WriteProcessMemory(
     hProcess: HANDLE,
     lpBaseAddress: LPCVOID,
@@ -43,37 +54,87 @@ def WriteProcessMemory(
     lpNumberOfBytesWritten: POINTER(c_size_t)
 ) -> bool:
     # https://docs.microsoft.com/en-us/windows/win32/api/memoryapi/nf-memoryapi-writeprocessmemory
-    func = windll.kernel32.WriteProcessMemory
-    func.argtypes = [HANDLE, LPCVOID, LPVOID, c_size_t, POINTER(c_size_t)]
-    func.restype = BOOL
-
-    res = func(hProcess, lpBaseAddress, lpBuffer, nSize,
-               lpNumberOfBytesWritten)
+    res = _WriteProcessMemory(hProcess, lpBaseAddress, lpBuffer, nSize,
+                              lpNumberOfBytesWritten)
     return bool(res)
 
 
+_VirtualQueryEx = WinFunction("kernel32", "VirtualQueryEx",
+                              [HANDLE, LPCVOID,
+                               POINTER(MEMORY_BASIC_INFORMATION), c_size_t],
+                              c_size_t)
+
+
+def VirtualQueryEx(
+    hProcess: HANDLE,
+    lpAddress: LPCVOID,
+    lpBuffer: POINTER(MEMORY_BASIC_INFORMATION),
+    dwLength: c_size_t,
+) -> int:
+    # https://docs.microsoft.com/en-us/windows/win32/api/memoryapi/nf-memoryapi-virtualqueryex
+    return _VirtualQueryEx(hProcess, lpAddress, lpBuffer, dwLength)
+
+
+_CloseHandle = WinFunction("kernel32", "CloseHandle", [HANDLE], BOOL)
+
+
 def CloseHandle(
     hObject: HANDLE
 ) -> bool:
     # https://docs.microsoft.com/de-de/windows/win32/api/handleapi/nf-handleapi-closehandle
-    func = windll.kernel32.CloseHandle
-    func.argtypes = [HANDLE]
-    func.restype = BOOL
+    res = _CloseHandle(hObject)
+    return bool(res)
+
+
+_IsWow64Process = WinFunction("kernel32", "IsWow64Process",
+                              [HANDLE, PBOOL],
+                              BOOL)
+
 
-    res = func(hObject)
+def IsWow64Process(
+    hProcess: HANDLE,
+    Wow64Process: PBOOL,
+) -> bool:
+    # https://docs.microsoft.com/en-us/windows/win32/api/wow64apiset/nf-wow64apiset-iswow64process
+    res = _IsWow64Process(hProcess, Wow64Process)
     return bool(res)
 
 
+_GetProcessTimes = WinFunction("kernel32", "GetProcessTimes",
+                               [HANDLE, LPFILETIME, LPFILETIME, LPFILETIME,
+                                LPFILETIME],
+                               BOOL)
+
+
+def GetProcessTimes(
+    hProcess: HANDLE,
+    lpCreationTime: LPFILETIME,
+    lpExitTime: LPFILETIME,
+    lpKernelTime: LPFILETIME,
+    lpUserTime: LPFILETIME,
+) -> bool:
+    # https://docs.microsoft.com/en-us/windows/win32/api/processthreadsapi/nf-processthreadsapi-getprocesstimes
+    res = _GetProcessTimes(hProcess, lpCreationTime, lpExitTime,
+                           lpKernelTime, lpUserTime)
+    return bool(res)
+
+
+_CreateToolhelp32Snapshot = WinFunction("kernel32", "CreateToolhelp32Snapshot",
+                                        [DWORD, DWORD],
+                                        HANDLE)
+
+
 def CreateToolhelp32Snapshot(
     dwFlags: DWORD,
     th32ProcessID: DWORD,
 ) -> HANDLE:
     # https://docs.microsoft.com/en-us/windows/win32/api/tlhelp32/nf-tlhelp32-createtoolhelp32snapshot
-    func = windll.kernel32.CreateToolhelp32Snapshot
-    func.argtypes = [DWORD, DWORD]
-    func.restype = HANDLE
+    return _CreateToolhelp32Snapshot(dwFlags, th32ProcessID)
 
-    return func(dwFlags, th32ProcessID)
+
+_Module32First = WinFunction("kernel32", "Module32First",
+                             [HANDLE, POINTER(MODULEENTRY32)],
+                             BOOL)
 
 
 def Module32First(
@@ -81,49 +142,65 @@ def Module32First(
     lpme: POINTER(MODULEENTRY32)
 ) -> bool:
     # https://docs.microsoft.com/de-de/windows/win32/api/tlhelp32/nf-tlhelp32-module32first
-    func = windll.kernel32.Module32First
-    func.argtypes = [HANDLE, POINTER(MODULEENTRY32)]
-    func.restypes = BOOL
-
-    res = func(hSnapshot, lpme)
+    res = _Module32First(hSnapshot, lpme)
     return bool(res)
 
 
+_Module32Next = WinFunction("kernel32", "Module32Next",
+                            [HANDLE, POINTER(MODULEENTRY32)],
+                            BOOL)
+
+
 def Module32Next(
     hSnapshot: HANDLE,
     lpme: POINTER(MODULEENTRY32)
 ) -> bool:
     # https://docs.microsoft.com/de-de/windows/win32/api/tlhelp32/nf-tlhelp32-module32next
-    func = windll.kernel32.Module32First
-    func.argtypes = [HANDLE, POINTER(MODULEENTRY32)]
-    func.restypes = BOOL
+    res = _Module32Next(hSnapshot, lpme)
+    return bool(res)
 
-    res = func(hSnapshot, lpme)
+
+_EnumProcessModulesEx = WinFunction("psapi", "EnumProcessModulesEx",
+                                    [HANDLE, POINTER(HMODULE), DWORD, LPDWORD,
+                                     DWORD],
+                                    BOOL)
+
+
+def EnumProcessModulesEx(
+    hProcess: HANDLE,
+    lphModule: POINTER(HMODULE),
+    cb: DWORD,
+    lpcbNeeded: LPDWORD,
+    dwFilterFlag: DWORD,
+) -> bool:
+    # https://docs.microsoft.com/en-us/windows/win32/api/psapi/nf-psapi-enumprocessmodulesex
+    res = _EnumProcessModulesEx(hProcess, lphModule, cb, lpcbNeeded,
+                                dwFilterFlag)
     return bool(res)
 
 
+_FindWindowA = WinFunction("user32", "FindWindowA", [LPCSTR, LPCSTR], HWND)
+
+
 def FindWindow(
     lpClassName: LPCSTR,
     lpWindowName: LPCSTR,
 ) -> Union[HWND, None]:
     # https://docs.microsoft.com/de-de/windows/win32/api/winuser/nf-winuser-findwindowa
-    func = windll.user32.FindWindowA
-    func.argtypes = [LPCSTR, LPCSTR]
-    func.restypes = HWND
-
-    res = func(lpClassName, lpWindowName)
-    if res == 0:
+    res = _FindWindowA(lpClassName, lpWindowName)
+    if not res:
         return None
     return res
 
 
+_GetWindowThreadProcessId = WinFunction("user32", "GetWindowThreadProcessId",
+                                        [HWND, LPDWORD],
+                                        DWORD)
+
+
 def GetWindowThreadProcessId(
     hWnd: HWND,
     lpdwProcessId: LPDWORD
 ) -> DWORD:
     # https://docs.microsoft.com/en-us/windows/win32/api/winuser/nf-winuser-getwindowthreadprocessid
-    func = windll.user32.GetWindowThreadProcessId
-    func.argtypes = [HWND, LPDWORD]
-    func.restypes = DWORD
-
-    return func(hWnd, lpdwProcessId)
+    return _GetWindowThreadProcessId(hWnd, lpdwProcessId)
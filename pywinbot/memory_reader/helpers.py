@@ -1,12 +1,10 @@
-from ctypes import addressof, byref, sizeof
-from ctypes.wintypes import DWORD, LPCSTR
-from typing import Tuple
+from ctypes import byref, c_void_p, sizeof
+from ctypes.wintypes import BOOL, DWORD, LPCSTR
+from typing import Iterable, List, Tuple
 
 from .address import Address
-from .flags import TH32CS_SNAPMODULE, TH32CS_SNAPMODULE32
-from .functions import (CloseHandle, CreateToolhelp32Snapshot, FindWindow,
-                        GetWindowThreadProcessId, Module32First, Module32Next)
-from .structures import MODULEENTRY32
+from .functions import FindWindow, GetWindowThreadProcessId, IsWow64Process
+from .module_map import ModuleMap
 
 
 def get_module_offset(
@@ -23,27 +21,9 @@ def get_module_offset(
         Address: Adress with the base offset of the process.
     """
 
-    flag = TH32CS_SNAPMODULE | TH32CS_SNAPMODULE32
-    snap = CreateToolhelp32Snapshot(flag, process_id)
-
-    me32 = MODULEENTRY32()
-    me32.dwSize = sizeof(MODULEENTRY32)
-
-    Module32First(snap, byref(me32))
-    while True:
-        name = me32.szModule.decode("ascii")
-        if process_name.lower() in name.lower():
-            base_addr = me32.modBaseAddr
-            addr = Address(addressof(base_addr.contents))
-
-            CloseHandle(snap)
-
-            return addr
-
-        if not Module32Next(snap, byref(me32)):
-            break
-
-    CloseHandle(snap)
+    module = ModuleMap.for_process(process_id).get(process_name)
+    if module is not None:
+        return module.base
 
 
 def get_process_id(
@@ -77,3 +57,71 @@ def get_process_id(
     GetWindowThreadProcessId(hwnd, byref(pid))
 
     return pid.value, hwnd
+
+
+def get_pointer_size(process_handle: int) -> int:
+    """Returns the pointer size of the process in bytes.
+
+    Args:
+        process_handle (int): Handle of the process, opened with
+            PROCESS_QUERY_INFORMATION access.
+
+    Returns:
+        int: 4 for 32-bit processes, 8 for 64-bit processes.
+    """
+
+    # A 32-bit python can only look at 32-bit processes anyway.
+    if sizeof(c_void_p) == 4:
+        return 4
+
+    wow64 = BOOL()
+    if IsWow64Process(process_handle, byref(wow64)) and wow64.value:
+        return 4
+
+    return 8
+
+
+def coalesce_ranges(
+    ranges: Iterable[Tuple[int, int]],
+    max_gap: int = 0,
+    max_size: int = None,
+) -> List[Tuple[int, int, List[int]]]:
+    """Merges (start, size) ranges that are adjacent or close to each
+    other into as few larger ranges as possible.
+
+    Args:
+        ranges (Iterable[Tuple[int, int]]): (start, size) tuples.
+        max_gap (int, optional): Maximum number of unused bytes allowed
+            between two ranges for them to still be merged.
+        max_size (int, optional): Maximum size of a merged range. A range
+            that is bigger on its own is never split.
+
+    Returns:
+        List[Tuple[int, int, List[int]]]: (start, end, indices) tuples,
+            sorted by start. indices are the positions of the merged
+            ranges in the given iterable.
+
+    To use:
+    >>> coalesce_ranges([(0x100, 4), (0x104, 4), (0x200, 8)])
+    [(256, 264, [0, 1]), (512, 520, [2])]
+    """
+
+    order = sorted(enumerate(ranges), key=lambda item: item[1][0])
+
+    merged = []
+    for index, (start, size) in order:
+        end = start + size
+
+        if merged:
+            last_start, last_end, indices = merged[-1]
+            new_end = max(last_end, end)
+            if (start - last_end <= max_gap
+                    and (max_size is None
+                         or new_end - last_start <= max_size)):
+                merged[-1] = (last_start, new_end, indices)
+                indices.append(index)
+                continue
+
+        merged.append((start, end, [index]))
+
+    return merged
@@ -1,14 +1,25 @@
 import re
 import struct
-from ctypes import create_string_buffer
-from struct import unpack
-from typing import List, Union
+from ctypes import c_char
+from struct import calcsize, error, unpack_from
+from typing import Iterable, List, Sequence, Tuple, Type, Union
 
-from .flags import PROCESS_VM_OPERATION, PROCESS_VM_READ, PROCESS_VM_WRITE
+from .flags import (PROCESS_QUERY_INFORMATION, PROCESS_VM_OPERATION,
+                    PROCESS_VM_READ, PROCESS_VM_WRITE)
 from .address import Address
+from .buffer_pool import BufferPool
+from .dump import write_dump
 from .functions import (CloseHandle, OpenProcess, ReadProcessMemory,
                         WriteProcessMemory)
-from .helpers import get_module_offset, get_process_id
+from .helpers import coalesce_ranges, get_pointer_size, get_process_id
+from .module_map import ModuleMap
+from .pointer_cache import PointerCache, make_key
+from .regions import RegionMap, query_regions
+from .schema import Schema
+from .signature import Signature
+from .snapshot import MemorySnapshot
+
+PAGE_SIZE = 0x1000
 
 
 class MemoryReader:
@@ -42,12 +53,25 @@ class MemoryReader:
         if self.pid == 0 and self.hwnd is None:
             raise Exception("Process was not found.")
 
-        self._module_offset = get_module_offset(self.pid,
-                                                process_name)
-
-        flags = PROCESS_VM_READ | PROCESS_VM_OPERATION | PROCESS_VM_WRITE
+        flags = (PROCESS_VM_READ | PROCESS_VM_OPERATION | PROCESS_VM_WRITE
+                 | PROCESS_QUERY_INFORMATION)
         self._process_handle = OpenProcess(flags, False, self.pid)
 
+        self._module_map = ModuleMap.for_process(self.pid,
+                                                 self._process_handle)
+        module = self._module_map.get(process_name)
+        if module is None:
+            self._module_offset, self._module_size = None, 0
+        else:
+            self._module_offset, self._module_size = module.base, module.size
+
+        self._pointer_size = get_pointer_size(self._process_handle)
+        self._pointer_format = "I" if self._pointer_size == 4 else "Q"
+
+        self._pointer_cache = None
+        self._region_map = None
+        self._buffer_pool = BufferPool()
+
     @property
     def pid(self) -> int:
         """Returns the process ID (PID) for the found process
@@ -66,22 +90,123 @@ class MemoryReader:
         """
         return self._hwnd
 
+    @property
+    def pointer_size(self) -> int:
+        """Returns the pointer size of the process.
+
+        Returns:
+            int: 4 for 32-bit processes, 8 for 64-bit processes.
+        """
+        return self._pointer_size
+
+    @property
+    def modules(self) -> ModuleMap:
+        """Returns the modules loaded by the process.
+
+        Returns:
+            ModuleMap: The module map, see refresh_modules.
+        """
+        return self._module_map
+
+    def refresh_modules(self) -> ModuleMap:
+        """Enumerates the modules of the process again, e.g. after it
+        loaded a DLL.
+
+        Returns:
+            ModuleMap: The refreshed module map.
+        """
+        self._module_map.refresh()
+        return self._module_map
+
+    @property
+    def pointer_cache(self) -> Union[PointerCache, None]:
+        """Returns the pointer cache used by get_final_pointer.
+
+        Returns:
+            Union[PointerCache, None]: The cache, None if disabled.
+        """
+        return self._pointer_cache
+
+    def enable_pointer_cache(
+        self,
+        ttl: Union[float, None] = None,
+        validate: bool = False,
+    ) -> PointerCache:
+        """Enables caching of resolved pointer chains in
+        get_final_pointer.
+
+        Args:
+            ttl (Union[float, None], optional): Seconds after which a chain
+                is resolved again. None keeps it until it is invalidated.
+            validate (bool, optional): If True, the last pointer of a
+                cached chain is read again on every lookup, so a lookup
+                costs one read instead of one per offset.
+
+        Returns:
+            PointerCache: The cache, to look at hits and misses.
+
+        To use:
+        >>> mr = MemoryReader(...)
+        >>> cache = mr.enable_pointer_cache(ttl=5, validate=True)
+        >>> addr = mr.get_final_pointer("ABC123456", offsets=["40", "F08"])
+        >>> cache.hits, cache.misses
+        (0, 1)
+        """
+
+        self._pointer_cache = PointerCache(ttl, validate)
+        return self._pointer_cache
+
+    def disable_pointer_cache(self) -> None:
+        """Disables and drops the pointer cache."""
+        self._pointer_cache = None
+
+    def invalidate_pointer_cache(
+        self,
+        base_pointer_addr: Union[Address, str, None] = None,
+        offsets: Union[List[str], None] = None,
+    ) -> None:
+        """Removes a chain from the pointer cache. If no chain is given,
+        the whole cache is cleared.
+
+        Args:
+            base_pointer_addr (Union[Address, str, None], optional):
+                The base pointer address of the chain.
+            offsets (Union[List[str], None], optional): The offsets
+                of the chain.
+        """
+
+        if self._pointer_cache is None:
+            return
+
+        if base_pointer_addr is None:
+            self._pointer_cache.invalidate()
+        else:
+            self._pointer_cache.invalidate(
+                make_key(self._base_address(base_pointer_addr),
+                         offsets or []))
+
     def get_final_pointer(
         self,
         base_pointer_addr: Union[Address, str],
         offsets: List[str]
-    ) -> Address:
+    ) -> Union[Address, None]:
         """Calculates the address based on offsets and base pointer
         given.
 
+        If the pointer cache is enabled (see enable_pointer_cache),
+        known chains are returned without walking them again.
+
         Args:
-            base_pointer_addr (Union[Address, str]): The base pointer address.
+            base_pointer_addr (Union[Address, str]): The base pointer address,
+                relative to the module of the process. Module relative
+                addresses like "game.dll+1A2B" are relative to that module.
             offsets (List[str]): The offsets given in a list of strings.
                 Order does matter.
 
         Returns:
-            Address: returns a new Address that points to the value
-                of the base pointer and given offsets.
+            Union[Address, None]: returns a new Address that points to the
+                value of the base pointer and given offsets. Will return
+                None if a pointer could not be read.
 
         To use:
         >>> mr = MemoryReader(...)
@@ -92,21 +217,177 @@ class MemoryReader:
         >>> value = mr.read(base_pointer, ...)
         """
 
-        addr = self._module_offset + base_pointer_addr
+        addr = self._base_address(base_pointer_addr)
+
+        cache = self._pointer_cache
+        if cache is not None:
+            key = make_key(addr, offsets)
+            entry = cache.get(key, self._is_pointer_entry_valid)
+            if entry is not None:
+                return entry.address
 
         for index, offset in enumerate(offsets):
-            addr2 = Address(self.read(addr,
-                                      "i",
-                                      4))
+            pointer = self.read(addr, self._pointer_format,
+                                self._pointer_size)
+            if pointer is None:
+                return None
+
+            addr2 = Address(pointer)
 
             if index == len(offsets)-1:
-                return addr2 + offsets[-1]
+                final_addr = addr2 + offsets[-1]
+                if cache is not None:
+                    cache.put(key, final_addr, addr, pointer)
+
+                return final_addr
             else:
                 addr = addr2 + offset
 
+    def _base_address(self, base_pointer_addr: Union[Address, str]) -> Address:
+        if isinstance(base_pointer_addr, str) and "+" in base_pointer_addr:
+            return self._module_map.resolve(base_pointer_addr)
+
+        return self._module_offset + base_pointer_addr
+
+    def _is_pointer_entry_valid(self, entry) -> bool:
+        pointer = self.read(entry.pointer_address, self._pointer_format,
+                            self._pointer_size)
+        return pointer == entry.pointer
+
+    def resolve_pointers(
+        self,
+        chains: Sequence[Tuple[Union[Address, str], List[str]]],
+    ) -> List[Union[Address, None]]:
+        """Resolves many pointer chains at once, like get_final_pointer.
+
+        The chains are merged into a prefix tree, so a pointer shared by
+        several chains is only read once, and all pointers of one level
+        are read together with read_many.
+
+        Args:
+            chains (Sequence[Tuple[Union[Address, str], List[str]]]):
+                (base_pointer_addr, offsets) tuples, see get_final_pointer.
+
+        Returns:
+            List[Union[Address, None]]: The resolved addresses in the order
+                of the chains. None if a pointer could not be read.
+
+        To use:
+        >>> mr = MemoryReader(...)
+        >>> health_addr, mana_addr = mr.resolve_pointers([
+                ("ABC123456", ["40", "F08"]),
+                ("ABC123456", ["40", "F0C"]),
+            ])
+        """
+
+        keys = [make_key(self._base_address(base), offsets)
+                for base, offsets in chains]
+
+        # Maps (base, *offsets) prefixes to the pointer read there
+        pointers = {}
+
+        depth = max((len(offsets) for _, offsets in keys), default=0)
+        for level in range(depth):
+            prefixes = []
+            requests = []
+            for base, offsets in keys:
+                if len(offsets) <= level:
+                    continue
+
+                prefix = (base,) + offsets[:level]
+                if prefix in pointers:
+                    continue
+
+                if level == 0:
+                    addr = base
+                else:
+                    parent = pointers[prefix[:-1]]
+                    if parent is None:
+                        pointers[prefix] = None
+                        continue
+                    addr = parent + prefix[-1]
+
+                # Marks the prefix as seen until it is read
+                pointers[prefix] = None
+                prefixes.append(prefix)
+                requests.append((Address(addr), self._pointer_format))
+
+            for prefix, value in zip(prefixes, self.read_many(requests)):
+                pointers[prefix] = value
+
+        results = []
+        for base, offsets in keys:
+            pointer = pointers.get((base,) + offsets[:-1])
+            if not offsets or pointer is None:
+                results.append(None)
+            else:
+                results.append(Address(pointer + offsets[-1]))
+
+        return results
+
+    def regions(self, refresh: bool = False) -> RegionMap:
+        """Returns an index of the committed memory regions of the
+        process. The index is built on first use and then cached.
+
+        Once the index exists, read_many skips values in regions known to
+        be unreadable without reading them. Memory outside the index is
+        still read, so the index does not hide new allocations.
+
+        Args:
+            refresh (bool, optional): Query all regions again.
+
+        Returns:
+            RegionMap: The region index.
+
+        To use:
+        >>> mr = MemoryReader(...)
+        >>> region = mr.regions().region_of(Address("ABC123456"))
+        >>> region.readable, region.module
+        (True, 'game.exe')
+        """
+
+        if self._region_map is None or refresh:
+            self._region_map = RegionMap(
+                query_regions(self._process_handle, modules=self._modules()))
+
+        return self._region_map
+
+    def refresh_regions(self, address: Address, size: int) -> RegionMap:
+        """Queries the regions in a range again, e.g. after the process
+        allocated or freed memory there.
+
+        Args:
+            address (Address): Start of the range.
+            size (int): Size of the range.
+
+        Returns:
+            RegionMap: The updated region index.
+        """
+
+        region_map = self.regions()
+
+        # Start at the region containing the address, so it is replaced
+        # as a whole.
+        start = address.address_decimal
+        region = region_map.region_of(start)
+        if region is not None:
+            start = region.start
+        end = address.address_decimal + size
+
+        region_map.update(start, end,
+                          query_regions(self._process_handle, start, end,
+                                        self._modules()))
+        return region_map
+
+    def _modules(self) -> List[Tuple[str, int, int]]:
+        return [(module.name, module.base.address_decimal, module.size)
+                for module in self._module_map]
+
     def close(self):
-        """Closes the process handle."""
+        """Closes the process handle and removes the cached module map of
+        the process."""
         CloseHandle(self._process_handle)
+        ModuleMap.clear_cache(self.pid)
 
     def read(
         self,
@@ -133,21 +414,578 @@ class MemoryReader:
         >>> value = mr.read(addr, "i", 4)
         """
 
-        buffer = create_string_buffer(buffer_size)
+        buffer = self._buffer_pool.acquire(buffer_size)
+
+        try:
+            if ReadProcessMemory(self._process_handle,
+                                 address.address_decimal,
+                                 buffer,
+                                 buffer_size,
+                                 None):
+
+                if unpack_type == "str":
+                    return self._decode_string(buffer[:buffer_size])
+                else:
+                    # Pooled buffers can be bigger and hold old data
+                    size = calcsize(unpack_type)
+                    if size > buffer_size:
+                        raise error(f"unpack requires a buffer of {size} "
+                                    "bytes")
+                    return unpack_from(unpack_type, buffer)[0]
+
+            return None
+        finally:
+            self._buffer_pool.release(buffer)
+
+    def read_many(
+        self,
+        requests: Sequence[Union[Tuple[Address, str],
+                                 Tuple[Address, str, int]]],
+        max_gap: int = 64,
+        max_read_size: int = 0x10000,
+    ) -> List[Union[str, int, float, None]]:
+        """Reads many values at once. Requests that are close to each
+        other in memory are merged into a single read.
+
+        Args:
+            requests (Sequence[Union[Tuple[Address, str],
+                Tuple[Address, str, int]]]): (address, unpack_type) tuples.
+                The buffer size is taken from the unpack type, strings
+                need it as a third element: (address, "str", buffer_size).
+            max_gap (int, optional): Maximum number of unused bytes
+                between two values that are still read together.
+            max_read_size (int, optional): Maximum size of a single
+                merged read.
 
-        if ReadProcessMemory(self._process_handle,
-                             address.address_decimal,
-                             buffer,
-                             buffer_size,
-                             None):
+        Returns:
+            List[Union[str, int, float, None]]: The values in the order
+                of the requests. Values that could not be read are None.
+                If the region index was built (see regions), values in
+                regions known to be unreadable are not read at all.
 
+        To use:
+        >>> mr = MemoryReader(...)
+        >>> health, mana, name = mr.read_many([
+                (Address("ABC123456"), "i"),
+                (Address("ABC12345A"), "i"),
+                (Address("ABC123500"), "str", 16),
+            ])
+        """
+
+        ranges = []
+        for request in requests:
+            address, unpack_type = request[0], request[1]
             if unpack_type == "str":
-                string = buffer.raw.decode("utf-8", errors="ignore")
-                return re.sub(r"[^A-Za-z0-9]+", "", string)
+                size = request[2]
             else:
-                return unpack(unpack_type, buffer.raw)[0]
+                size = calcsize(unpack_type)
+
+            ranges.append((address.address_decimal, size))
+
+        results = [None] * len(requests)
+
+        region_map = self._region_map
+        if region_map is not None:
+            readable = [index for index, (address, size) in enumerate(ranges)
+                        if not region_map.is_unreadable(address, size)]
+        else:
+            readable = range(len(ranges))
 
-        return None
+        merged = coalesce_ranges([ranges[index] for index in readable],
+                                 max_gap, max_read_size)
+        if not merged:
+            return results
+
+        buffer = self._buffer_pool.acquire(max(end - start
+                                               for start, end, _ in merged))
+        try:
+            for start, end, indices in merged:
+                indices = [readable[index] for index in indices]
+                self._read_merged(requests, ranges, indices, start, end,
+                                  buffer, results)
+        finally:
+            self._buffer_pool.release(buffer)
+
+        return results
+
+    def _read_merged(self, requests, ranges, indices, start, end, buffer,
+                     results) -> None:
+        if not ReadProcessMemory(self._process_handle,
+                                 start,
+                                 buffer,
+                                 end - start,
+                                 None):
+            # Part of the range is not readable, fall back to reading
+            # each value on its own so only those fail.
+            if len(indices) > 1:
+                for index in indices:
+                    address, size = ranges[index]
+                    results[index] = self.read(requests[index][0],
+                                               requests[index][1],
+                                               size)
+            return
+
+        for index in indices:
+            address, size = ranges[index]
+            offset = address - start
+            unpack_type = requests[index][1]
+
+            if unpack_type == "str":
+                raw = buffer[offset:offset+size]
+                results[index] = self._decode_string(raw)
+            else:
+                results[index] = unpack_from(unpack_type,
+                                             buffer,
+                                             offset)[0]
+
+    def read_string(
+        self,
+        address: Address,
+        encoding: str = "utf-8",
+        max_len: int = 0x1000,
+        terminator: Union[bytes, None] = None,
+        chunk_size: int = 64,
+    ) -> Union[str, None]:
+        """Reads a terminated string. The string is read in small chunks
+        that never cross a page boundary, until the terminator is found.
+
+        Args:
+            address (Address): The address to read from.
+            encoding (str, optional): Encoding of the string, e.g. 'utf-8',
+                'utf-16-le' or 'cp1252'.
+            max_len (int, optional): Maximum length in bytes.
+            terminator (Union[bytes, None], optional): Bytes that end the
+                string. Defaults to a zero character of the encoding, e.g.
+                two zero bytes for UTF-16.
+            chunk_size (int, optional): Size of the first read, a power of
+                two up to PAGE_SIZE. Later reads double in size up to a
+                page.
+
+        Returns:
+            Union[str, None]: The string without terminator. Will return
+                None if reading failed.
+
+        To use:
+        >>> mr = MemoryReader(...)
+        >>> name = mr.read_string(Address("ABC123456"))
+        >>> title = mr.read_string(Address("ABC123500"), "utf-16-le")
+        """
+
+        if (chunk_size <= 0 or chunk_size > PAGE_SIZE
+                or chunk_size & (chunk_size - 1)):
+            raise ValueError("chunk_size has to be a power of two up to "
+                             f"{PAGE_SIZE:#x}.")
+
+        unit = _code_unit_size(encoding)
+        if terminator is None:
+            terminator = bytes(unit)
+
+        result = bytearray()
+        position = address.address_decimal
+        search_from = 0
+
+        buffer = self._buffer_pool.acquire(PAGE_SIZE)
+        view = memoryview(buffer).cast("B")
+        try:
+            while len(result) < max_len:
+                # Ends at the next multiple of chunk_size, which is never
+                # behind the end of the page.
+                end = (position // chunk_size + 1) * chunk_size
+                length = min(end - position, max_len - len(result))
+
+                if not self.read_into(Address(position), view[:length]):
+                    if not result:
+                        return None
+                    break
+
+                result += view[:length]
+                position += length
+
+                index = result.find(terminator, search_from)
+                while index != -1 and index % unit:
+                    index = result.find(terminator, index + 1)
+                if index != -1:
+                    return result[:index].decode(encoding, errors="replace")
+
+                search_from = max(len(result) - len(terminator) + 1, 0)
+                chunk_size = min(chunk_size * 2, PAGE_SIZE)
+        finally:
+            self._buffer_pool.release(buffer)
+
+        del result[max_len - max_len % unit:]
+        return result.decode(encoding, errors="replace")
+
+    def read_prefixed_string(
+        self,
+        address: Address,
+        length_type: str = "I",
+        encoding: str = "utf-8",
+        max_len: int = 0x1000,
+    ) -> Union[str, None]:
+        """Reads a string that is stored after its length.
+
+        Args:
+            address (Address): Address of the length.
+            length_type (str, optional): struct type of the length, which
+                counts characters of the encoding (bytes for UTF-8, 2-byte
+                units for UTF-16).
+            encoding (str, optional): Encoding of the string.
+            max_len (int, optional): Maximum length in bytes.
+
+        Returns:
+            Union[str, None]: The string. Will return None if reading
+                failed.
+        """
+
+        length = self.read(address, length_type, calcsize(length_type))
+        if length is None:
+            return None
+
+        size = min(length * _code_unit_size(encoding), max_len)
+        return self._read_encoded(address + calcsize(length_type), size,
+                                  encoding)
+
+    def read_std_string(
+        self,
+        address: Address,
+        encoding: str = "utf-8",
+        max_len: int = 0x1000,
+    ) -> Union[str, None]:
+        """Reads an MSVC std::string or std::wstring. Short strings are
+        stored inside the object, longer ones behind a pointer.
+
+        Args:
+            address (Address): Address of the std::string object.
+            encoding (str, optional): 'utf-8' for std::string,
+                'utf-16-le' for std::wstring.
+            max_len (int, optional): Maximum length in bytes.
+
+        Returns:
+            Union[str, None]: The string. Will return None if reading
+                failed.
+
+        To use:
+        >>> mr = MemoryReader(...)
+        >>> name = mr.read_std_string(player_addr + "30")
+        """
+
+        # Layout: union { char buf[16]; char* ptr; }, size_t size,
+        # size_t capacity
+        header = bytearray(16 + 2 * self._pointer_size)
+        if not self.read_into(address, header):
+            return None
+
+        unit = _code_unit_size(encoding)
+        length, capacity = unpack_from(self._pointer_format * 2, header, 16)
+        size = min(length * unit, max_len)
+
+        # Short strings are stored in buf, so they need no second read
+        if capacity < 16 // unit:
+            size = min(size, 16)
+            return header[:size].decode(encoding, errors="replace")
+
+        pointer = unpack_from(self._pointer_format, header)[0]
+        return self._read_encoded(Address(pointer), size, encoding)
+
+    def _read_encoded(
+        self,
+        address: Address,
+        size: int,
+        encoding: str,
+    ) -> Union[str, None]:
+        if size <= 0:
+            return ""
+
+        buffer = bytearray(size)
+        if not self.read_into(address, buffer):
+            return None
+
+        return buffer.decode(encoding, errors="replace")
+
+    def snapshot(
+        self,
+        address: Address,
+        size: int,
+    ) -> MemorySnapshot:
+        """Reads a block of memory once, so that many values can be
+        decoded from it without reading each of them.
+
+        Args:
+            address (Address): Start of the block.
+            size (int): Size of the block in bytes.
+
+        Returns:
+            MemorySnapshot: The snapshot, check snapshot.valid to see
+                whether reading succeeded. Call snapshot.refresh() to
+                read the block again into the same buffer.
+
+        To use:
+        >>> mr = MemoryReader(...)
+        >>> snap = mr.snapshot(Address("ABC123456"), 0x400)
+        >>> health = snap.read(0x10, "i")
+        >>> x, y, z = snap.unpack_from("fff", 0x20)
+        >>> snap.refresh()
+        """
+
+        snapshot = MemorySnapshot(self, address, size)
+        snapshot.refresh()
+        return snapshot
+
+    def dump(
+        self,
+        path: str,
+        regions: Union[Iterable[Tuple[Union[Address, int], int]],
+                       None] = None,
+        chunk_size: int = 0x100000,
+    ) -> int:
+        """Writes process memory to a file for offline analysis. Open it
+        with DumpReader, which has the same read interface.
+
+        Args:
+            path (str): Path of the dump file.
+            regions (Union[Iterable[Tuple[Union[Address, int], int]], None],
+                optional): (start, size) ranges to dump. Defaults to all
+                readable regions of the process.
+            chunk_size (int, optional): Number of bytes read at once.
+                Chunks that can not be read are left out.
+
+        Returns:
+            int: Number of bytes dumped.
+
+        To use:
+        >>> mr = MemoryReader(...)
+        >>> mr.dump("game.dump")
+        >>> dump = DumpReader("game.dump")
+        >>> dump.read(Address("ABC123456"), "i", 4)
+        """
+        return write_dump(path, self, regions, chunk_size)
+
+    def read_struct(
+        self,
+        address: Address,
+        schema: Type[Schema],
+    ) -> Union[Tuple, None]:
+        """Reads a whole record described by a Schema with a single read.
+        Pointers declared with a schema are followed and read as well.
+
+        Args:
+            address (Address): Start of the record.
+            schema (Type[Schema]): The layout of the record.
+
+        Returns:
+            Union[Tuple, None]: A schema.Record namedtuple. Will return
+                None if reading failed. Nested records that could not be
+                read, or null pointers, are None.
+
+        To use:
+        >>> class Player(Schema):
+                health = Field(0x10, "i")
+                position = Field(0x20, "f", count=3)
+
+        >>> mr = MemoryReader(...)
+        >>> player = mr.read_struct(Address("ABC123456"), Player)
+        >>> x, y, z = player.position
+        """
+
+        compiled = schema.compile(self._pointer_size)
+        size = compiled.struct.size
+        buffer = self._buffer_pool.acquire(size)
+
+        try:
+            if not ReadProcessMemory(self._process_handle,
+                                     address.address_decimal,
+                                     buffer,
+                                     size,
+                                     None):
+                return None
+
+            record = schema.unpack_from(buffer, 0, self._pointer_size)
+        finally:
+            self._buffer_pool.release(buffer)
+
+        if compiled.nested:
+            nested = {}
+            for name, nested_schema in compiled.nested:
+                pointer = getattr(record, name)
+                if pointer.address_decimal == 0:
+                    nested[name] = None
+                else:
+                    nested[name] = self.read_struct(pointer, nested_schema)
+
+            record = record._replace(**nested)
+
+        return record
+
+    def read_array(
+        self,
+        address: Address,
+        dtype,
+        count: int,
+        stride: Union[int, None] = None,
+    ):
+        """Reads an array of records with a single read and returns it as
+        a NumPy array without copying. Requires numpy.
+
+        Args:
+            address (Address): Start of the first record.
+            dtype: NumPy dtype of a record, usually a structured dtype.
+            count (int): Number of records.
+            stride (Union[int, None], optional): Distance in bytes between
+                two records. Defaults to the size of the dtype. Use a
+                larger stride to only read a part of bigger records.
+
+        Returns:
+            numpy.ndarray: Array with count records. Will return None if
+                reading failed.
+
+        To use:
+        >>> import numpy as np
+        >>> entity = np.dtype({"names": ["id", "x", "y"],
+                               "formats": ["<u4", "<f4", "<f4"],
+                               "offsets": [0x0, 0x30, 0x34]})
+        >>> mr = MemoryReader(...)
+        >>> entities = mr.read_array(Address("ABC123456"), entity, 1000,
+                                     stride=0x200)
+        >>> close = entities[np.hypot(entities["x"], entities["y"]) < 50]
+        """
+
+        import numpy as np
+
+        dtype = np.dtype(dtype)
+        if stride is None:
+            stride = dtype.itemsize
+
+        if count <= 0:
+            return np.empty(0, dtype)
+
+        buffer = bytearray(stride * (count - 1) + dtype.itemsize)
+        if not self.read_into(address, buffer):
+            return None
+
+        if stride == dtype.itemsize:
+            return np.frombuffer(buffer, dtype, count)
+
+        return np.ndarray((count,), dtype, buffer=buffer, strides=(stride,))
+
+    def scan_signature(
+        self,
+        pattern: Union[Signature, str],
+        start: Union[Address, None] = None,
+        size: Union[int, None] = None,
+        rip_relative: Union[Tuple[int, int], None] = None,
+        first_only: bool = False,
+        chunk_size: int = 0x400000,
+    ) -> List[Address]:
+        """Searches memory for a byte signature, by default in the module
+        of the process.
+
+        Args:
+            pattern (Union[Signature, str]): The signature, e.g.
+                "48 8B 05 ?? ?? ?? ?? 48 85 C0". '??' matches any byte.
+            start (Union[Address, None], optional): Start of the range to
+                search. Defaults to the module base.
+            size (Union[int, None], optional): Size of the range to
+                search. Defaults to the module size.
+            rip_relative (Union[Tuple[int, int], None], optional):
+                (displacement offset, instruction length). If given, the
+                match is decoded as a RIP-relative instruction and the
+                address it refers to is returned instead of the match.
+            first_only (bool, optional): Stop after the first match.
+            chunk_size (int, optional): Number of bytes read at once.
+
+        Returns:
+            List[Address]: The addresses of all matches. Unreadable
+                regions are skipped.
+
+        To use:
+        >>> mr = MemoryReader(...)
+        >>> # mov rax, [rip+????????]; test rax, rax
+        >>> player_base, = mr.scan_signature("48 8B 05 ?? ?? ?? ?? 48 85 C0",
+                                             rip_relative=(3, 7),
+                                             first_only=True)
+        """
+
+        if not isinstance(pattern, Signature):
+            pattern = Signature(pattern)
+
+        if start is None:
+            start = self._module_offset
+        if size is None:
+            size = self._module_size
+
+        overlap = len(pattern) - 1
+        buffer = bytearray(chunk_size + overlap)
+        view = memoryview(buffer)
+
+        start = start.address_decimal
+        ranges = self.regions().readable_ranges(start, start + size)
+
+        results = []
+        for range_start, range_size in ranges:
+            end = range_start + range_size
+            for position in range(range_start, end, chunk_size):
+                length = min(chunk_size + overlap, end - position)
+                if not self.read_into(Address(position), view[:length]):
+                    continue
+
+                for match in pattern.find_all(buffer, 0, length):
+                    if rip_relative is None:
+                        results.append(Address(position + match))
+                    else:
+                        displacement_offset, instruction_length = \
+                            rip_relative
+                        offset = match + displacement_offset
+                        if offset + 4 <= length:
+                            displacement = unpack_from("<i", buffer,
+                                                       offset)[0]
+                        else:
+                            displacement = self.read(
+                                Address(position + offset), "<i", 4)
+                            if displacement is None:
+                                continue
+
+                        results.append(Address(position + match
+                                               + instruction_length
+                                               + displacement))
+
+                    if first_only:
+                        return results
+
+        return results
+
+    def read_into(self, address: Address, buffer) -> bool:
+        """Reads process memory directly into an existing buffer, filling
+        it completely.
+
+        Args:
+            address (Address): The address to read from.
+            buffer: Any writable, contiguous buffer, e.g. a bytearray,
+                memoryview, ctypes array or NumPy array.
+
+        Returns:
+            bool: True means success, False means reading failed.
+
+        To use:
+        >>> mr = MemoryReader(...)
+        >>> buffer = bytearray(0x100)
+        >>> if mr.read_into(Address("ABC123456"), buffer):
+                health = struct.unpack_from("i", buffer, 0x10)[0]
+        """
+
+        view = memoryview(buffer).cast("B")
+        size = view.nbytes
+        c_buffer = (c_char * size).from_buffer(view)
+
+        return ReadProcessMemory(self._process_handle,
+                                 address.address_decimal,
+                                 c_buffer,
+                                 size,
+                                 None)
+
+    @staticmethod
+    def _decode_string(raw: bytes) -> str:
+        string = raw.decode("utf-8", errors="ignore")
+        return re.sub(r"[^A-Za-z0-9]+", "", string)
 
     def write(
         self,
@@ -172,20 +1010,138 @@ class MemoryReader:
         >>> to_write = "foobar"
         >>> mr.write(addr, to_write, len(to_write))
         """
-        if isinstance(value, str):
-            buffer = create_string_buffer(bytes(value, "ascii"),
-                                          buffer_size)
+        buffer = self._buffer_pool.acquire(buffer_size)
+
+        try:
+            if isinstance(value, str):
+                data = bytes(value, "ascii")
+                size = len(data)
+                buffer[:size] = data
+
+            elif isinstance(value, float):
+                size = 4
+                struct.pack_into("f", buffer, 0, value)
+
+            elif isinstance(value, int):
+                size = 4
+                struct.pack_into("i", buffer, 0, value)
 
-        elif isinstance(value, float):
-            buffer = create_string_buffer(struct.pack("f", value),
-                                          buffer_size)
+            # Same error create_string_buffer raised
+            if size > buffer_size:
+                raise ValueError("byte string too long")
 
-        elif isinstance(value, int):
-            buffer = create_string_buffer(struct.pack("i", value),
-                                          buffer_size)
+            # Pooled buffers are not zeroed
+            if buffer_size > size:
+                buffer[size:buffer_size] = bytes(buffer_size - size)
+
+            return WriteProcessMemory(self._process_handle,
+                                      address.address_decimal,
+                                      buffer,
+                                      buffer_size,
+                                      None)
+        finally:
+            self._buffer_pool.release(buffer)
+
+    def write_many(
+        self,
+        writes: Sequence[Tuple[Address, str, Union[int, float, str, bytes]]],
+        verify: bool = False,
+    ) -> List[bool]:
+        """Writes many values at once. Adjacent or overlapping writes are
+        merged into a single write, later writes win where they overlap.
+
+        Args:
+            writes (Sequence[Tuple[Address, str, Union[int, float, str,
+                bytes]]]): (address, pack_type, value) tuples. pack_type
+                is a struct format like 'i' or 'f', or 'str' to write a
+                string or bytes as they are.
+            verify (bool, optional): Read the memory back after writing
+                and report writes whose bytes differ as failed.
+
+        Returns:
+            List[bool]: For every write, True means success, False means
+                writing failed.
+
+        To use:
+        >>> mr = MemoryReader(...)
+        >>> mr.write_many([
+                (Address("ABC123456"), "i", 100),
+                (Address("ABC12345A"), "f", 2.5),
+                (Address("ABC123500"), "str", "foobar"),
+            ], verify=True)
+        [True, True, True]
+        """
+
+        data = []
+        for address, pack_type, value in writes:
+            if pack_type == "str":
+                if isinstance(value, str):
+                    value = bytes(value, "ascii")
+                data.append(value)
+            else:
+                data.append(struct.pack(pack_type, value))
+
+        ranges = [(int(write[0]), len(packed))
+                  for write, packed in zip(writes, data)]
+
+        results = [False] * len(writes)
+        for start, end, indices in coalesce_ranges(ranges):
+            buffer = bytearray(end - start)
+            # Apply in the given order, so later writes win
+            for index in sorted(indices):
+                offset = ranges[index][0] - start
+                buffer[offset:offset+len(data[index])] = data[index]
+
+            if self._write_bytes(start, buffer):
+                for index in indices:
+                    results[index] = True
+            else:
+                # Write each value on its own, so only those fail
+                for index in indices:
+                    results[index] = self._write_bytes(ranges[index][0],
+                                                       data[index])
+
+        if verify:
+            read_back = self.read_many([
+                (Address(start), f"{size}s")
+                for start, size in ranges
+            ], max_gap=0)
+
+            for index, value in enumerate(read_back):
+                if results[index] and value != data[index]:
+                    # Overlapped by a later write, so the bytes differ
+                    if not _is_overwritten(ranges, index):
+                        results[index] = False
+
+        return results
+
+    def _write_bytes(self, address: int, data: Union[bytes, bytearray]
+                     ) -> bool:
+        if not isinstance(data, bytearray):
+            data = bytearray(data)
+
+        size = len(data)
+        buffer = (c_char * size).from_buffer(data)
 
         return WriteProcessMemory(self._process_handle,
-                                  address.address_decimal,
+                                  address,
                                   buffer,
-                                  buffer_size,
+                                  size,
                                   None)
+
+
+def _code_unit_size(encoding: str) -> int:
+    encoding = encoding.lower().replace("_", "-")
+    if encoding.startswith(("utf-16", "utf16")):
+        return 2
+    if encoding.startswith(("utf-32", "utf32")):
+        return 4
+    return 1
+
+
+def _is_overwritten(ranges: List[Tuple[int, int]], index: int) -> bool:
+    start, size = ranges[index]
+    for later_start, later_size in ranges[index+1:]:
+        if later_start < start + size and start < later_start + later_size:
+            return True
+    return False
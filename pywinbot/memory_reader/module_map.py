@@ -0,0 +1,292 @@
+from bisect import bisect_right
+from collections import namedtuple
+from ctypes import byref, c_void_p, cast, sizeof
+from ctypes.wintypes import DWORD, FILETIME, HMODULE
+from typing import Dict, Iterable, Iterator, Tuple, Union
+
+from .address import Address
+from .flags import LIST_MODULES_ALL, TH32CS_SNAPMODULE, TH32CS_SNAPMODULE32
+from .functions import (CloseHandle, CreateToolhelp32Snapshot,
+                        EnumProcessModulesEx, GetProcessTimes, Module32First,
+                        Module32Next)
+from .structures import MODULEENTRY32
+
+Module = namedtuple("Module", ["name", "base", "size", "path"])
+
+
+def normalize_name(name: str) -> str:
+    return name.strip().lower()
+
+
+class ModuleMap:
+    # Maps (PID, creation time) to module maps, see ModuleMap.for_process.
+    # PIDs alone are reused by Windows once a process ended.
+    _cache: Dict[Tuple[int, int], "ModuleMap"] = {}
+
+    def __init__(
+        self,
+        process_id: int,
+        modules: Union[Iterable[Module], None] = None,
+    ):
+        """All modules loaded by a process, keyed by their lowercase name.
+
+        Several modules can share a name, e.g. the 64-bit and the 32-bit
+        ntdll.dll of a WOW64 process. Lookups by name then return the one
+        enumerated first. All of them are kept, iterated, counted by len
+        and found by module_of.
+
+        Args:
+            process_id (int): PID
+            modules (Union[Iterable[Module], None], optional): The modules.
+                If not given, they are enumerated with a Toolhelp snapshot.
+
+        To use:
+        >>> modules = ModuleMap.for_process(mr.pid)
+        >>> modules["game.dll"].base
+        <Address hex=7FF6A0000000 decimal=140696227954688>
+        >>> modules.resolve("game.dll+0x1234")
+        <Address hex=7FF6A0001234 decimal=140696227959348>
+        """
+
+        self._process_id = process_id
+        self._set(enumerate_modules(process_id) if modules is None
+                  else modules)
+
+    @classmethod
+    def for_process(
+        cls,
+        process_id: int,
+        process_handle: Union[int, None] = None,
+        refresh: bool = False,
+    ) -> "ModuleMap":
+        """Returns the cached module map of a process, enumerating the
+        modules only on first use. Maps are cached by PID and creation
+        time of the process, so a new process with a reused PID gets a
+        new map. Entries stay cached until clear_cache is called, e.g.
+        by MemoryReader.close.
+
+        Args:
+            process_id (int): PID
+            process_handle (Union[int, None], optional): Handle of the
+                process, opened with PROCESS_QUERY_INFORMATION access. The
+                map is refreshed when the number of loaded modules
+                changed. Without a handle, the modules are enumerated and
+                not cached.
+            refresh (bool, optional): Enumerate the modules again.
+
+        Returns:
+            ModuleMap: The module map.
+        """
+
+        created = (None if process_handle is None
+                   else process_creation_time(process_handle))
+        if created is None:
+            return cls(process_id)
+
+        key = (process_id, created)
+        module_map = cls._cache.get(key)
+
+        if module_map is None:
+            # Maps of an ended process with the same PID are stale
+            cls.clear_cache(process_id)
+            module_map = cls._cache[key] = cls(process_id)
+        elif refresh:
+            module_map.refresh()
+        else:
+            module_map.refresh_if_changed(process_handle)
+
+        return module_map
+
+    @classmethod
+    def clear_cache(cls, process_id: Union[int, None] = None) -> None:
+        """Removes cached module maps, see for_process.
+
+        Args:
+            process_id (Union[int, None], optional): Only remove the maps
+                of this PID. Defaults to all maps.
+        """
+
+        if process_id is None:
+            cls._cache.clear()
+            return
+
+        for key in [key for key in cls._cache if key[0] == process_id]:
+            cls._cache.pop(key, None)
+
+    def __len__(self) -> int:
+        return len(self._all)
+
+    def __iter__(self) -> Iterator[Module]:
+        return iter(self._all)
+
+    def __contains__(self, name: str) -> bool:
+        return normalize_name(name) in self._modules
+
+    def __getitem__(self, name: str) -> Module:
+        return self._modules[normalize_name(name)]
+
+    def __repr__(self) -> str:
+        return f"<ModuleMap pid={self._process_id} modules={len(self)}>"
+
+    def get(self, name: str) -> Union[Module, None]:
+        """Returns a module by name. Case does not matter.
+
+        Args:
+            name (str): Name of the module, e.g. "game.dll".
+
+        Returns:
+            Union[Module, None]: The module or None if it is not loaded.
+        """
+        return self._modules.get(normalize_name(name))
+
+    def module_of(self, address: Union[Address, int]) -> Union[Module, None]:
+        """Returns the module containing address.
+
+        Args:
+            address (Union[Address, int]): The address.
+
+        Returns:
+            Union[Module, None]: The module or None.
+        """
+
+        if isinstance(address, Address):
+            address = address.address_decimal
+
+        index = bisect_right(self._bases, address) - 1
+        if index >= 0:
+            module = self._sorted[index]
+            if address < module.base.address_decimal + module.size:
+                return module
+
+        return None
+
+    def resolve(self, address: str) -> Address:
+        """Resolves a module relative address like "game.dll+0x1234".
+        The offset is hexadecimal, with or without 0x.
+
+        Args:
+            address (str): "module+offset" or just "module".
+
+        Returns:
+            Address: The absolute address.
+
+        Raises:
+            KeyError: The module is not loaded.
+        """
+
+        name, _, offset = address.partition("+")
+        base = self[name].base
+
+        if not offset.strip():
+            return base
+        return base + int(offset, 16)
+
+    def refresh(self) -> None:
+        """Enumerates the modules again."""
+        self._set(enumerate_modules(self._process_id))
+
+    def refresh_if_changed(self, process_handle: int) -> bool:
+        """Enumerates the modules again if the number of loaded modules
+        changed.
+
+        Args:
+            process_handle (int): Handle of the process, opened with
+                PROCESS_QUERY_INFORMATION access.
+
+        Returns:
+            bool: True if the modules were enumerated again.
+        """
+
+        count = module_count(process_handle)
+        if count is None or count == len(self._all):
+            return False
+
+        self.refresh()
+        return True
+
+    def _set(self, modules: Iterable[Module]) -> None:
+        # Every enumerated module, so len matches module_count
+        self._all = list(modules)
+
+        # The first module wins if several share a name
+        self._modules = {}
+        for module in self._all:
+            self._modules.setdefault(normalize_name(module.name), module)
+
+        self._sorted = sorted(self._all,
+                              key=lambda module: module.base.address_decimal)
+        self._bases = [module.base.address_decimal
+                       for module in self._sorted]
+
+
+def enumerate_modules(process_id: int) -> Iterator[Module]:
+    """Yields all modules of a process using a Toolhelp snapshot.
+
+    Args:
+        process_id (int): PID
+
+    Yields:
+        Module: (name, base, size, path) of each module.
+    """
+
+    flag = TH32CS_SNAPMODULE | TH32CS_SNAPMODULE32
+    snap = CreateToolhelp32Snapshot(flag, process_id)
+
+    me32 = MODULEENTRY32()
+    me32.dwSize = sizeof(MODULEENTRY32)
+
+    try:
+        found = Module32First(snap, byref(me32))
+        while found:
+            base = cast(me32.modBaseAddr, c_void_p).value or 0
+            yield Module(me32.szModule.decode("ascii", errors="replace"),
+                         Address(base),
+                         me32.modBaseSize,
+                         me32.szExePath.decode("ascii", errors="replace"))
+
+            found = Module32Next(snap, byref(me32))
+    finally:
+        CloseHandle(snap)
+
+
+def process_creation_time(process_handle: int) -> Union[int, None]:
+    """Returns when a process was created. Together with the PID it
+    identifies a process, as PIDs are reused.
+
+    Args:
+        process_handle (int): Handle of the process, opened with
+            PROCESS_QUERY_INFORMATION access.
+
+    Returns:
+        Union[int, None]: Creation time as FILETIME, in 100 ns intervals
+            since 1601. None if the call failed.
+    """
+
+    creation, exit_time, kernel_time, user_time = (FILETIME(), FILETIME(),
+                                                   FILETIME(), FILETIME())
+    if not GetProcessTimes(process_handle, byref(creation),
+                           byref(exit_time), byref(kernel_time),
+                           byref(user_time)):
+        return None
+
+    return (creation.dwHighDateTime << 32) | creation.dwLowDateTime
+
+
+def module_count(process_handle: int) -> Union[int, None]:
+    """Returns the number of modules loaded by a process without
+    enumerating them.
+
+    Args:
+        process_handle (int): Handle of the process, opened with
+            PROCESS_QUERY_INFORMATION access.
+
+    Returns:
+        Union[int, None]: Number of modules, None if the call failed.
+    """
+
+    needed = DWORD()
+    if not EnumProcessModulesEx(process_handle, None, 0, byref(needed),
+                                LIST_MODULES_ALL):
+        return None
+
+    return needed.value // sizeof(HMODULE)
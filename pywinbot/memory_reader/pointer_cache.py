@@ -0,0 +1,134 @@
+import time
+from collections import namedtuple
+from typing import Callable, Hashable, List, Tuple, Union
+
+from .address import Address
+
+CacheEntry = namedtuple("CacheEntry", ["address", "pointer_address",
+                                       "pointer", "timestamp"])
+
+
+def make_key(
+    base_pointer_addr: Union[Address, str, int],
+    offsets: List[Union[str, int]],
+) -> Tuple[int, Tuple[int, ...]]:
+    """Returns a hashable key for a pointer chain.
+
+    Args:
+        base_pointer_addr (Union[Address, str, int]): The base pointer
+            address.
+        offsets (List[Union[str, int]]): The offsets of the chain.
+
+    Returns:
+        Tuple[int, Tuple[int, ...]]: (base, offsets) as integers.
+    """
+
+    if not isinstance(base_pointer_addr, Address):
+        base_pointer_addr = Address(base_pointer_addr)
+
+    return (base_pointer_addr.address_decimal,
+            tuple(int(offset, 16) if isinstance(offset, str) else offset
+                  for offset in offsets))
+
+
+class PointerCache:
+    def __init__(
+        self,
+        ttl: Union[float, None] = None,
+        validate: bool = False,
+    ):
+        """Cache for resolved pointer chains.
+
+        Args:
+            ttl (Union[float, None], optional): Seconds after which an
+                entry is resolved again. None keeps entries until they are
+                invalidated.
+            validate (bool, optional): If True, the last pointer of a
+                chain is read again on every lookup and the entry is only
+                used if it did not change.
+        """
+
+        self.ttl = ttl
+        self.validate = validate
+
+        self.hits = 0
+        self.misses = 0
+
+        self._entries = {}
+
+    def __len__(self) -> int:
+        return len(self._entries)
+
+    def get(
+        self,
+        key: Hashable,
+        validator: Union[Callable[[CacheEntry], bool], None] = None,
+    ) -> Union[CacheEntry, None]:
+        """Returns the entry for key if it is still valid.
+
+        Args:
+            key (Hashable): Key as returned by make_key.
+            validator (Union[Callable[[CacheEntry], bool], None], optional):
+                Called with the entry if validation is enabled, has to
+                return whether the entry is still valid.
+
+        Returns:
+            Union[CacheEntry, None]: The entry or None on a miss.
+        """
+
+        entry = self._entries.get(key)
+
+        if entry is not None:
+            expired = (self.ttl is not None
+                       and time.monotonic() - entry.timestamp > self.ttl)
+
+            if expired or (self.validate and validator is not None
+                           and not validator(entry)):
+                # Another thread may have removed it already
+                self._entries.pop(key, None)
+                entry = None
+
+        if entry is None:
+            self.misses += 1
+        else:
+            self.hits += 1
+
+        return entry
+
+    def put(
+        self,
+        key: Hashable,
+        address: Address,
+        pointer_address: Address,
+        pointer: int,
+    ) -> None:
+        """Stores a resolved chain.
+
+        Args:
+            key (Hashable): Key as returned by make_key.
+            address (Address): The resolved address.
+            pointer_address (Address): Address of the last pointer
+                in the chain.
+            pointer (int): Value of the last pointer in the chain.
+        """
+
+        self._entries[key] = CacheEntry(address, pointer_address,
+                                        pointer, time.monotonic())
+
+    def invalidate(self, key: Union[Hashable, None] = None) -> None:
+        """Removes an entry, or all entries if key is None.
+
+        Args:
+            key (Union[Hashable, None], optional): Key as returned
+                by make_key.
+        """
+
+        if key is None:
+            self._entries.clear()
+        else:
+            self._entries.pop(key, None)
+
+    def reset_stats(self) -> None:
+        """Resets the hit and miss counters."""
+        self.hits = 0
+        self.misses = 0
@@ -0,0 +1,464 @@
+import json
+import struct
+from concurrent.futures import ProcessPoolExecutor
+from typing import (TYPE_CHECKING, Iterable, Iterator, List, Sequence, Tuple,
+                    Union)
+
+import numpy as np
+
+from .address import Address
+from .module_map import Module
+
+if TYPE_CHECKING:
+    from .memory_reader import MemoryReader
+
+MAGIC = b"PWBPTRS\x01"
+
+
+def _index_chunk(
+    start: int,
+    data: bytes,
+    pointer_size: int,
+    alignment: int,
+    range_starts: np.ndarray,
+    range_ends: np.ndarray,
+) -> Tuple[np.ndarray, np.ndarray]:
+    # Returns (values, locations) of every aligned value in data that
+    # points into one of the ranges. Top level so it can run in a worker
+    # process.
+    dtype = np.dtype("<u4" if pointer_size == 4 else "<u8")
+    count = (len(data) - pointer_size) // alignment + 1
+    if count <= 0:
+        return np.empty(0, np.uint64), np.empty(0, np.uint64)
+
+    values = np.ndarray((count,), dtype, buffer=data,
+                        strides=(alignment,)).astype(np.uint64)
+
+    index = np.searchsorted(range_starts, values, side="right") - 1
+    valid = (index >= 0) & (values < range_ends[np.maximum(index, 0)])
+
+    positions = np.flatnonzero(valid).astype(np.uint64)
+    return values[valid], np.uint64(start) + positions * np.uint64(alignment)
+
+
+class PointerPaths:
+    def __init__(self, records: np.ndarray, modules: Sequence[str]):
+        """Pointer paths found by a PointerScanner, stored as a NumPy
+        structured array. Every record holds the index of its module,
+        the offset of the base pointer in that module, the number of
+        offsets and the offsets themselves, from the base outwards.
+
+        Args:
+            records (np.ndarray): The records, see PointerPaths.dtype.
+            modules (Sequence[str]): Names of the modules the records
+                refer to.
+
+        To use:
+        >>> paths = scanner.scan(Address("ABC123456"))
+        >>> base, offsets = paths[0]
+        >>> base, offsets
+        ('game.dll+1A2B30', ['10', '2C8'])
+        >>> mr.get_final_pointer(base, offsets)
+        """
+
+        self.records = records
+        self.modules = list(modules)
+
+    @staticmethod
+    def dtype(max_depth: int) -> np.dtype:
+        """Returns the record dtype for paths with up to max_depth
+        offsets.
+
+        Args:
+            max_depth (int): Maximum number of offsets.
+
+        Returns:
+            np.dtype: The packed record dtype.
+        """
+        return np.dtype([("module", "<u2"), ("base", "<u4"),
+                         ("depth", "u1"), ("offsets", "<u4", (max_depth,))])
+
+    @property
+    def max_depth(self) -> int:
+        return self.records.dtype["offsets"].shape[0]
+
+    def __len__(self) -> int:
+        return len(self.records)
+
+    def __getitem__(self, index: int) -> Tuple[str, List[str]]:
+        record = self.records[index]
+        base = f"{self.modules[record['module']]}+{int(record['base']):X}"
+        offsets = [f"{int(offset):X}"
+                   for offset in record["offsets"][:record["depth"]]]
+        return base, offsets
+
+    def __iter__(self) -> Iterator[Tuple[str, List[str]]]:
+        for index in range(len(self)):
+            yield self[index]
+
+    def __repr__(self) -> str:
+        return f"<PointerPaths paths={len(self)}>"
+
+    def save(self, path: str) -> None:
+        """Writes the paths to a file: a magic number, a JSON header with
+        the module names and the raw records.
+
+        Args:
+            path (str): The file path.
+        """
+
+        header = json.dumps({"modules": self.modules,
+                             "max_depth": self.max_depth,
+                             "count": len(self)}).encode()
+
+        with open(path, "wb") as file:
+            file.write(MAGIC)
+            file.write(struct.pack("<I", len(header)))
+            file.write(header)
+            file.write(self.records.tobytes())
+
+    @classmethod
+    def load(cls, path: str) -> "PointerPaths":
+        """Reads paths written by save.
+
+        Args:
+            path (str): The file path.
+
+        Returns:
+            PointerPaths: The paths.
+        """
+
+        with open(path, "rb") as file:
+            if file.read(len(MAGIC)) != MAGIC:
+                raise ValueError(f"{path} is not a pointer path file")
+
+            size, = struct.unpack("<I", file.read(4))
+            header = json.loads(file.read(size))
+            records = np.fromfile(file, cls.dtype(header["max_depth"]),
+                                  count=header["count"])
+
+        return cls(records, header["modules"])
+
+    def intersect(self, other: "PointerPaths") -> "PointerPaths":
+        """Keeps the paths that are in other as well, e.g. the results of
+        a scan after restarting the game.
+
+        Args:
+            other (PointerPaths): The other paths.
+
+        Returns:
+            PointerPaths: The paths found in both.
+        """
+
+        # Move other's module indices onto ours and drop unknown modules
+        lookup = {name: index for index, name in enumerate(self.modules)}
+        mapping = np.array([lookup.get(name, -1) for name in other.modules]
+                           or [-1], dtype=np.int64)
+
+        theirs = other._with_depth(self.max_depth)
+        module = mapping[theirs["module"]]
+        theirs = theirs[module >= 0]
+        theirs["module"] = module[module >= 0]
+
+        mask = np.isin(self._keys(self.records), self._keys(theirs))
+        return PointerPaths(self.records[mask], self.modules)
+
+    def filter(
+        self,
+        memory_reader: "MemoryReader",
+        target: Union[Address, int],
+    ) -> "PointerPaths":
+        """Keeps the paths that still lead to target.
+
+        Args:
+            memory_reader (MemoryReader): The reader to resolve with.
+            target (Union[Address, int]): The address the paths should
+                lead to.
+
+        Returns:
+            PointerPaths: The paths leading to target.
+        """
+
+        resolved = memory_reader.resolve_pointers(list(self))
+        mask = np.array([address is not None and address == target
+                         for address in resolved], dtype=np.bool_)
+        return PointerPaths(self.records[mask], self.modules)
+
+    def _with_depth(self, max_depth: int) -> np.ndarray:
+        if max_depth == self.max_depth:
+            return self.records.copy()
+
+        records = np.zeros(len(self), self.dtype(max_depth))
+        keep = self.records["depth"] <= max_depth
+        for name in ("module", "base", "depth"):
+            records[name] = self.records[name]
+        depth = min(max_depth, self.max_depth)
+        records["offsets"][:, :depth] = self.records["offsets"][:, :depth]
+        return records[keep]
+
+    @staticmethod
+    def _keys(records: np.ndarray) -> np.ndarray:
+        records = np.ascontiguousarray(records)
+        return records.view(np.dtype((np.void, records.dtype.itemsize)))
+
+
+class PointerScanner:
+    def __init__(
+        self,
+        images: Iterable[Tuple[Union[Address, int], bytes]],
+        modules: Iterable[Module],
+        pointer_size: int = 8,
+        alignment: Union[int, None] = None,
+        processes: int = 1,
+        chunk_size: int = 0x1000000,
+    ):
+        """Finds pointer paths from static module memory to an address.
+        All pointer sized values that point into the images are indexed
+        once, sorted by value. A scan then walks backwards from the target
+        and looks up which locations point a bit before it, level by
+        level, until it reaches memory inside a module. Requires numpy.
+
+        Args:
+            images (Iterable[Tuple[Union[Address, int], bytes]]): (start,
+                data) pairs of process memory. Any buffer works as data.
+            modules (Iterable[Module]): The modules whose memory counts as
+                static.
+            pointer_size (int, optional): 4 or 8.
+            alignment (Union[int, None], optional): Distance between two
+                possible pointer locations. Defaults to pointer_size.
+            processes (int, optional): Number of worker processes used to
+                build the index. 1 builds it in this process.
+            chunk_size (int, optional): Bytes indexed per worker task.
+
+        To use:
+        >>> scanner = PointerScanner.from_reader(mr, processes=4)
+        >>> paths = scanner.scan(Address("ABC123456"), max_depth=4,
+                                 max_offset=0x1000)
+        >>> paths.save("health.ptrs")
+        >>> # ... restart the game and scan again ...
+        >>> stable = PointerPaths.load("health.ptrs").intersect(paths)
+        """
+
+        self.pointer_size = pointer_size
+        self.alignment = alignment or pointer_size
+
+        self._images = [(int(start), memoryview(data).cast("B"))
+                        for start, data in images]
+        self._images.sort(key=lambda image: image[0])
+
+        self._modules = sorted(modules, key=lambda module: module.base)
+        self._module_starts = np.array([int(module.base)
+                                        for module in self._modules],
+                                       dtype=np.uint64)
+        self._module_ends = np.array([int(module.base) + module.size
+                                      for module in self._modules],
+                                     dtype=np.uint64)
+
+        self._values, self._locations = self._build_index(processes,
+                                                          chunk_size)
+
+    @classmethod
+    def from_reader(
+        cls,
+        memory_reader: "MemoryReader",
+        regions: Union[Iterable[Tuple[Union[Address, int], int]],
+                       None] = None,
+        **kwargs,
+    ) -> "PointerScanner":
+        """Reads the memory of a process and builds a scanner for it.
+
+        Args:
+            memory_reader (MemoryReader): The reader to read with.
+            regions (Union[Iterable[Tuple[Union[Address, int], int]], None],
+                optional): (start, size) ranges to read. Defaults to all
+                readable regions of the process.
+            kwargs: Passed on to PointerScanner.
+
+        Returns:
+            PointerScanner: The scanner.
+        """
+
+        if regions is None:
+            regions = memory_reader.regions().readable_ranges()
+
+        images = []
+        for start, size in regions:
+            data = bytearray(size)
+            if memory_reader.read_into(Address(start), data):
+                images.append((int(start), data))
+
+        return cls(images, memory_reader.modules,
+                   pointer_size=memory_reader.pointer_size, **kwargs)
+
+    def __len__(self) -> int:
+        return len(self._values)
+
+    def scan(
+        self,
+        target: Union[Address, int],
+        max_depth: int = 4,
+        max_offset: int = 0x1000,
+        max_results: int = 100000,
+    ) -> PointerPaths:
+        """Finds pointer paths to target.
+
+        Every address on a path is only expanded at the lowest level it
+        was reached, so paths that pass the same address twice or only
+        add a detour are skipped.
+
+        Args:
+            target (Union[Address, int]): The address to find paths to.
+            max_depth (int, optional): Maximum number of offsets.
+            max_offset (int, optional): Maximum offset after a pointer.
+            max_results (int, optional): Stop after this many paths.
+
+        Returns:
+            PointerPaths: The paths found.
+        """
+
+        targets = np.array([int(target)], dtype=np.uint64)
+        visited = targets
+        levels = []
+        seeds = []
+
+        for depth in range(max_depth):
+            if not len(targets):
+                break
+
+            locations, target_index, offsets = self._pointers_to(targets,
+                                                                 max_offset)
+
+            module = self._module_index(locations)
+            static = module >= 0
+
+            seeds.extend((depth, location, index, offset, module_index)
+                         for location, index, offset, module_index
+                         in zip(locations[static].tolist(),
+                                target_index[static].tolist(),
+                                offsets[static].tolist(),
+                                module[static].tolist()))
+
+            # Group edges by location for walking down again
+            order = np.argsort(locations, kind="stable")
+            levels.append((targets, locations[order], target_index[order],
+                           offsets[order]))
+
+            next_targets = np.unique(locations[~static])
+            targets = np.setdiff1d(next_targets, visited,
+                                   assume_unique=True)
+            visited = np.union1d(visited, targets)
+
+        return self._paths(levels, seeds, max_depth, max_results)
+
+    def _pointers_to(
+        self,
+        targets: np.ndarray,
+        max_offset: int,
+    ) -> Tuple[np.ndarray, np.ndarray, np.ndarray]:
+        # All (location, target index, offset) with target - max_offset <=
+        # value <= target
+        low = np.where(targets > max_offset, targets - np.uint64(max_offset),
+                       np.uint64(0))
+        first = np.searchsorted(self._values, low, side="left")
+        last = np.searchsorted(self._values, targets, side="right")
+        counts = last - first
+
+        total = int(counts.sum())
+        target_index = np.repeat(np.arange(len(targets)), counts)
+        starts = np.repeat(first - (np.cumsum(counts) - counts), counts)
+        positions = starts + np.arange(total)
+
+        offsets = targets[target_index] - self._values[positions]
+        return self._locations[positions], target_index, offsets
+
+    def _module_index(self, locations: np.ndarray) -> np.ndarray:
+        index = np.searchsorted(self._module_starts, locations,
+                                side="right") - 1
+        if not len(self._modules):
+            return np.full(len(locations), -1)
+
+        inside = (index >= 0) & (
+            locations < self._module_ends[np.maximum(index, 0)])
+        return np.where(inside, index, -1)
+
+    def _paths(
+        self,
+        levels: List[tuple],
+        seeds: List[tuple],
+        max_depth: int,
+        max_results: int,
+    ) -> PointerPaths:
+        rows = []
+
+        def walk(depth: int, index: int, offsets: List[int], base: tuple):
+            if len(rows) >= max_results:
+                return
+
+            if depth < 0:
+                rows.append(base + (len(offsets), offsets))
+                return
+
+            # targets of level depth + 1 are locations of level depth
+            _, locations, target_index, edge_offsets = levels[depth]
+            location = levels[depth + 1][0][index]
+            first = np.searchsorted(locations, location, side="left")
+            last = np.searchsorted(locations, location, side="right")
+
+            for edge in range(first, last):
+                walk(depth - 1, int(target_index[edge]),
+                     offsets + [int(edge_offsets[edge])], base)
+
+        for depth, location, index, offset, module_index in seeds:
+            if len(rows) >= max_results:
+                break
+
+            module = self._modules[module_index]
+            walk(depth - 1, index, [offset],
+                 (module_index, location - int(module.base)))
+
+        records = np.zeros(len(rows), PointerPaths.dtype(max_depth))
+        for row, (module_index, base, depth, offsets) in zip(records, rows):
+            row["module"] = module_index
+            row["base"] = base
+            row["depth"] = depth
+            row["offsets"][:depth] = offsets
+
+        return PointerPaths(records, [module.name
+                                      for module in self._modules])
+
+    def _build_index(self, processes: int,
+                     chunk_size: int) -> Tuple[np.ndarray, np.ndarray]:
+        range_starts = np.array([start for start, _ in self._images],
+                                dtype=np.uint64)
+        range_ends = np.array([start + len(data)
+                               for start, data in self._images],
+                              dtype=np.uint64)
+
+        # Chunks overlap by one pointer so no value is cut in half
+        chunk_size -= chunk_size % self.alignment
+        tasks = []
+        for start, data in self._images:
+            for offset in range(0, len(data), chunk_size):
+                end = min(offset + chunk_size + self.pointer_size
+                          - self.alignment, len(data))
+                tasks.append((start + offset, data[offset:end]))
+
+        args = (self.pointer_size, self.alignment, range_starts, range_ends)
+        if processes > 1 and len(tasks) > 1:
+            with ProcessPoolExecutor(processes) as executor:
+                futures = [executor.submit(_index_chunk, start, bytes(data),
+                                           *args)
+                           for start, data in tasks]
+                parts = [future.result() for future in futures]
+        else:
+            parts = [_index_chunk(start, data, *args)
+                     for start, data in tasks]
+
+        if not parts:
+            return np.empty(0, np.uint64), np.empty(0, np.uint64)
+
+        values = np.concatenate([part[0] for part in parts])
+        locations = np.concatenate([part[1] for part in parts])
+
+        order = np.argsort(values, kind="stable")
+        return values[order], locations[order]
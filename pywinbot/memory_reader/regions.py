@@ -0,0 +1,288 @@
+from bisect import bisect_right
+from collections import namedtuple
+from ctypes import byref, sizeof
+from typing import Iterable, Iterator, List, Sequence, Tuple, Union
+
+from .flags import (MEM_COMMIT, PAGE_EXECUTE_READ, PAGE_EXECUTE_READWRITE,
+                    PAGE_EXECUTE_WRITECOPY, PAGE_GUARD, PAGE_NOACCESS,
+                    PAGE_READONLY, PAGE_READWRITE, PAGE_WRITECOPY)
+from .functions import VirtualQueryEx
+from .structures import MEMORY_BASIC_INFORMATION
+
+READABLE = (PAGE_READONLY | PAGE_READWRITE | PAGE_WRITECOPY
+            | PAGE_EXECUTE_READ | PAGE_EXECUTE_READWRITE
+            | PAGE_EXECUTE_WRITECOPY)
+WRITABLE = (PAGE_READWRITE | PAGE_WRITECOPY | PAGE_EXECUTE_READWRITE
+            | PAGE_EXECUTE_WRITECOPY)
+
+
+class MemoryRegion(namedtuple("MemoryRegion", ["start", "size", "state",
+                                               "protect", "type",
+                                               "module"])):
+    """A region of process memory as returned by VirtualQueryEx.
+
+    start and size are integers, state, protect and type are the
+    MEM_* / PAGE_* flags and module is the name of the module the region
+    belongs to, or None.
+    """
+
+    __slots__ = ()
+
+    @property
+    def end(self) -> int:
+        return self.start + self.size
+
+    @property
+    def readable(self) -> bool:
+        return (self.state == MEM_COMMIT
+                and not self.protect & (PAGE_NOACCESS | PAGE_GUARD)
+                and bool(self.protect & READABLE))
+
+    @property
+    def writable(self) -> bool:
+        return self.readable and bool(self.protect & WRITABLE)
+
+
+class RegionMap:
+    def __init__(self, regions: Iterable[MemoryRegion]):
+        """Sorted index of committed memory regions.
+
+        Args:
+            regions (Iterable[MemoryRegion]): The regions, in any order.
+                Regions that are not committed are ignored.
+
+        To use:
+        >>> region_map = mr.regions()
+        >>> region_map.region_of(Address("ABC123456"))
+        MemoryRegion(start=..., size=4096, ...)
+        """
+
+        self._set(regions)
+
+    def __len__(self) -> int:
+        return len(self._regions)
+
+    def __iter__(self) -> Iterator[MemoryRegion]:
+        return iter(self._regions)
+
+    def __repr__(self) -> str:
+        return f"<RegionMap regions={len(self)}>"
+
+    def region_of(self, address: int) -> Union[MemoryRegion, None]:
+        """Returns the region containing address.
+
+        Args:
+            address (int): The address, an Address works as well.
+
+        Returns:
+            Union[MemoryRegion, None]: The region or None if the address
+                is not in a committed region.
+        """
+
+        address = int(address)
+        index = bisect_right(self._starts, address) - 1
+        if index >= 0 and address < self._regions[index].end:
+            return self._regions[index]
+
+        return None
+
+    def is_readable(self, address: int, size: int) -> bool:
+        """Returns whether all bytes of a range can be read.
+
+        Args:
+            address (int): Start of the range.
+            size (int): Size of the range.
+
+        Returns:
+            bool: True if the whole range is in readable regions.
+        """
+
+        address = int(address)
+        end = address + size
+
+        index = bisect_right(self._starts, address) - 1
+        if index < 0:
+            return False
+
+        while index < len(self._regions):
+            region = self._regions[index]
+            if region.start > address or not region.readable:
+                return False
+            if region.end >= end:
+                return True
+
+            address = region.end
+            index += 1
+
+        return False
+
+    def is_unreadable(self, address: int, size: int) -> bool:
+        """Returns whether a range overlaps a known region that can not be
+        read. Parts that are not in the index, e.g. memory allocated after
+        it was built, do not count as unreadable.
+
+        Args:
+            address (int): Start of the range.
+            size (int): Size of the range.
+
+        Returns:
+            bool: True if reading the range is known to fail.
+        """
+
+        address = int(address)
+        end = address + size
+
+        index = max(bisect_right(self._starts, address) - 1, 0)
+        while index < len(self._regions):
+            region = self._regions[index]
+            if region.start >= end:
+                break
+            if region.end > address and not region.readable:
+                return True
+            index += 1
+
+        return False
+
+    def readable_ranges(
+        self,
+        start: int = 0,
+        end: Union[int, None] = None,
+    ) -> List[Tuple[int, int]]:
+        """Returns the readable parts of a range. Adjacent readable
+        regions are merged.
+
+        Args:
+            start (int, optional): Start of the range.
+            end (Union[int, None], optional): End of the range, exclusive.
+                Defaults to the end of the last region.
+
+        Returns:
+            List[Tuple[int, int]]: (start, size) tuples.
+        """
+
+        start = int(start)
+        if end is None:
+            end = self._regions[-1].end if self._regions else start
+        end = int(end)
+
+        ranges = []
+        index = max(bisect_right(self._starts, start) - 1, 0)
+        for region in self._regions[index:]:
+            if region.start >= end:
+                break
+            if region.end <= start or not region.readable:
+                continue
+
+            range_start = max(region.start, start)
+            range_end = min(region.end, end)
+
+            if ranges and ranges[-1][0] + ranges[-1][1] == range_start:
+                ranges[-1] = (ranges[-1][0], range_end - ranges[-1][0])
+            else:
+                ranges.append((range_start, range_end - range_start))
+
+        return ranges
+
+    def update(
+        self,
+        start: int,
+        end: int,
+        regions: Iterable[MemoryRegion],
+    ) -> None:
+        """Replaces the regions in [start, end) with the given regions,
+        e.g. after querying that range again. The new regions may extend
+        past the range, old regions are trimmed wherever a new region or
+        the range covers them.
+
+        Args:
+            start (int): Start of the range.
+            end (int): End of the range, exclusive.
+            regions (Iterable[MemoryRegion]): The new regions of the range.
+        """
+
+        regions = list(regions)
+        covered = sorted([(int(start), int(end))]
+                         + [(region.start, region.end) for region in regions])
+
+        kept = []
+        for region in self._regions:
+            kept.extend(_uncovered(region, covered))
+        self._set(kept + regions)
+
+    def _set(self, regions: Iterable[MemoryRegion]) -> None:
+        self._regions: List[MemoryRegion] = sorted(
+            (region for region in regions if region.state == MEM_COMMIT),
+            key=lambda region: region.start)
+        self._starts = [region.start for region in self._regions]
+
+
+def _uncovered(
+    region: MemoryRegion,
+    covered: Sequence[Tuple[int, int]],
+) -> List[MemoryRegion]:
+    # The parts of region outside the (start, end) ranges, which are
+    # sorted by start
+    parts = []
+    position = region.start
+    for cover_start, cover_end in covered:
+        if cover_end <= position or cover_start >= region.end:
+            continue
+        if cover_start > position:
+            parts.append(region._replace(start=position,
+                                         size=cover_start - position))
+        position = max(position, cover_end)
+
+    if position < region.end:
+        parts.append(region._replace(start=position,
+                                     size=region.end - position))
+    return parts
+
+
+def query_regions(
+    process_handle: int,
+    start: int = 0,
+    end: Union[int, None] = None,
+    modules: Sequence[Tuple[str, int, int]] = (),
+) -> List[MemoryRegion]:
+    """Walks the memory of a process with VirtualQueryEx.
+
+    Args:
+        process_handle (int): Handle of the process, opened with
+            PROCESS_QUERY_INFORMATION access.
+        start (int, optional): Address to start at.
+        end (Union[int, None], optional): Address to stop at, exclusive.
+            Defaults to the end of the address space.
+        modules (Sequence[Tuple[str, int, int]], optional): (name, base,
+            size) of known modules, used to fill MemoryRegion.module.
+
+    Returns:
+        List[MemoryRegion]: The regions, including free and reserved ones.
+    """
+
+    modules = sorted(modules, key=lambda module: module[1])
+    module_bases = [module[1] for module in modules]
+
+    mbi = MEMORY_BASIC_INFORMATION()
+    regions = []
+
+    address = start
+    while end is None or address < end:
+        if not VirtualQueryEx(process_handle, address, byref(mbi),
+                              sizeof(mbi)):
+            break
+
+        base = mbi.BaseAddress or 0
+        size = mbi.RegionSize
+        if size == 0:
+            break
+
+        module = None
+        index = bisect_right(module_bases, base) - 1
+        if index >= 0 and base < module_bases[index] + modules[index][2]:
+            module = modules[index][0]
+
+        regions.append(MemoryRegion(base, size, mbi.State, mbi.Protect,
+                                    mbi.Type, module))
+        address = base + size
+
+    return regions
@@ -0,0 +1,185 @@
+import struct
+from collections import namedtuple
+from typing import Dict, Tuple, Type
+
+from .address import Address
+
+CompiledSchema = namedtuple("CompiledSchema", ["struct", "layout", "nested"])
+
+
+class Field:
+    def __init__(self, offset: int, unpack_type: str, count: int = 1):
+        """A value in a Schema.
+
+        Args:
+            offset (int): Offset of the value from the start of the record.
+            unpack_type (str): The data type to unpack, without byte order
+                prefix. 'i' integer, 'f' float, '16s' 16 bytes, ...
+                (See struct unpacks).
+            count (int, optional): Number of consecutive values. If greater
+                than 1, the field is read as a tuple.
+        """
+
+        if unpack_type[:1] in "@=<>!":
+            raise ValueError("Field unpack types can not have a byte order "
+                             "prefix.")
+
+        self.offset = offset
+        self.unpack_type = unpack_type
+        self.count = count
+
+    def _format(self, pointer_size: int) -> str:
+        return self.unpack_type * self.count
+
+
+class Pointer(Field):
+    def __init__(self, offset: int, schema: Type["Schema"] = None):
+        """A pointer in a Schema. Pointers have the size of the target's
+        pointers and are read as Address.
+
+        Args:
+            offset (int): Offset of the pointer from the start of the record.
+            schema (Type[Schema], optional): If given, MemoryReader.read_struct
+                follows the pointer and reads a record of that schema.
+        """
+
+        super().__init__(offset, "P")
+        self.schema = schema
+
+    def _format(self, pointer_size: int) -> str:
+        return "I" if pointer_size == 4 else "Q"
+
+
+class Schema:
+    """Base class to describe the layout of a record in memory. Each
+    layout is compiled into a single struct.Struct once, so the whole
+    record is decoded with one call.
+
+    To use:
+    >>> class Item(Schema):
+            item_id = Field(0x0, "I")
+            amount = Field(0x4, "H")
+
+    >>> class Player(Schema):
+            health = Field(0x10, "i")
+            position = Field(0x20, "f", count=3)
+            name = Field(0x40, "16s")
+            weapon = Pointer(0x50, Item)
+
+    >>> mr = MemoryReader(...)
+    >>> player = mr.read_struct(Address("ABC123456"), Player)
+    >>> player.health, player.weapon.item_id
+    """
+
+    _fields: Dict[str, Field] = {}
+    _compiled: Dict[int, CompiledSchema] = {}
+    Record: Type[tuple] = None
+
+    def __init_subclass__(cls, **kwargs):
+        super().__init_subclass__(**kwargs)
+
+        fields = dict(cls._fields)
+        for name, value in vars(cls).items():
+            if isinstance(value, Field):
+                fields[name] = value
+
+        cls._fields = fields
+        cls._compiled = {}
+        cls.Record = namedtuple(cls.__name__, list(fields))
+
+    @classmethod
+    def compile(cls, pointer_size: int = 4) -> CompiledSchema:
+        """Returns the compiled layout for the given pointer size.
+        Layouts are compiled on first use and then cached.
+
+        Args:
+            pointer_size (int, optional): Pointer size of the target.
+
+        Returns:
+            CompiledSchema: (struct, layout, nested) of the schema.
+        """
+
+        compiled = cls._compiled.get(pointer_size)
+        if compiled is not None:
+            return compiled
+
+        fmt = "<"
+        position = 0
+        index = 0
+        layout = {}
+        nested = []
+
+        fields = sorted(cls._fields.items(), key=lambda item: item[1].offset)
+        for name, field in fields:
+            if field.offset < position:
+                raise ValueError(f"Field '{name}' of {cls.__name__} "
+                                 "overlaps the previous field.")
+
+            field_fmt = field._format(pointer_size)
+            if field.offset > position:
+                fmt += f"{field.offset - position}x"
+
+            size = struct.calcsize("<" + field_fmt)
+            items = len(struct.unpack("<" + field_fmt, bytes(size)))
+
+            fmt += field_fmt
+            position = field.offset + size
+
+            is_pointer = isinstance(field, Pointer)
+            layout[name] = (index, items, field.count > 1 or items > 1,
+                            is_pointer)
+            index += items
+
+            if is_pointer and field.schema is not None:
+                nested.append((name, field.schema))
+
+        compiled = CompiledSchema(struct.Struct(fmt),
+                                  tuple(layout[name] for name in cls._fields),
+                                  tuple(nested))
+        cls._compiled[pointer_size] = compiled
+        return compiled
+
+    @classmethod
+    def size(cls, pointer_size: int = 4) -> int:
+        """Returns the number of bytes to read for a record.
+
+        Args:
+            pointer_size (int, optional): Pointer size of the target.
+
+        Returns:
+            int: Size in bytes, up to the end of the last field.
+        """
+        return cls.compile(pointer_size).struct.size
+
+    @classmethod
+    def unpack_from(
+        cls,
+        buffer,
+        offset: int = 0,
+        pointer_size: int = 4,
+    ) -> Tuple:
+        """Decodes a record from a buffer. Pointers are returned as
+        Address and are not followed.
+
+        Args:
+            buffer: Any object supporting the buffer protocol.
+            offset (int, optional): Offset of the record in the buffer.
+            pointer_size (int, optional): Pointer size of the target.
+
+        Returns:
+            Tuple: A Record namedtuple of the schema.
+        """
+
+        compiled = cls.compile(pointer_size)
+        values = compiled.struct.unpack_from(buffer, offset)
+
+        record = []
+        for index, items, is_tuple, is_pointer in compiled.layout:
+            if is_pointer:
+                record.append(Address(values[index]))
+            elif is_tuple:
+                record.append(values[index:index+items])
+            else:
+                record.append(values[index])
+
+        return cls.Record._make(record)
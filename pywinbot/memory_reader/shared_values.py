@@ -0,0 +1,334 @@
+import json
+import os
+import struct
+import time
+from collections import namedtuple
+from multiprocessing import shared_memory
+from typing import TYPE_CHECKING, Dict, List, Tuple, Union
+
+from ..background import TickWorker
+from .address import Address
+
+if TYPE_CHECKING:
+    from .memory_reader import MemoryReader
+
+MAGIC = b"PWBSHM\x00\x01"
+
+Target = Union[Address, Tuple[Union[Address, str], List[str]]]
+
+# magic, size of the JSON layout that follows
+_HEADER = struct.Struct("<8sI")
+# sequence, then time.time() and number of the tick
+_SEQUENCE = struct.Struct("<Q")
+_TICK = struct.Struct("<dQ")
+
+# Names of the blocks created by publishers of this process
+_published = set()
+
+
+def _layout(formats: List[str]) -> Tuple[int, List[int], int]:
+    # Returns (valid flags offset, value offsets, size) of the control
+    # block: sequence, tick, one valid flag per value, then the values.
+    valid_offset = _SEQUENCE.size + _TICK.size
+    offset = valid_offset + len(formats)
+
+    offsets = []
+    for fmt in formats:
+        offset += -offset % _alignment(fmt)
+        offsets.append(offset)
+        offset += struct.calcsize("<" + fmt)
+
+    return valid_offset, offsets, offset
+
+
+def _alignment(fmt: str) -> int:
+    # Natural alignment of the largest type in the format, e.g. 4 for
+    # "3f" and 1 for "12s"
+    return max((struct.calcsize("<" + char) for char in fmt
+                if not char.isdigit()), default=1)
+
+
+class ValuePublisher(TickWorker):
+    def __init__(
+        self,
+        memory_reader: "MemoryReader",
+        values: Dict[str, Tuple[Target, str]],
+        name: Union[str, None] = None,
+        interval: float = 0.05,
+    ):
+        """Reads a fixed set of values once per tick and publishes them in
+        a shared memory block, so any number of worker processes can use
+        them without reading process memory themselves. Subscribers
+        attach by the block's name, see ValueSubscriber.
+
+        The block is guarded by a sequence number that is odd while a
+        tick is written (a seqlock), so readers never block the
+        publisher and retry if they raced a write.
+
+        Args:
+            memory_reader (MemoryReader): The reader to read with.
+            values (Dict[str, Tuple[Target, str]]): Maps value names to
+                (target, pack_type). A target is an Address, or a
+                (base_pointer_addr, offsets) tuple for a pointer chain,
+                resolved on every tick. pack_type is a struct format of
+                fixed size, e.g. 'i', 'f' or '16s'.
+            name (Union[str, None], optional): Name of the shared memory
+                block. Defaults to a random name.
+            interval (float, optional): Seconds between two ticks.
+
+        To use:
+        >>> publisher = ValuePublisher(mr, {
+                "health": (Address("ABC123456"), "i"),
+                "x": (("ABC123500", ["40", "F08"]), "f"),
+            })
+        >>> publisher.start()
+        >>> # in a worker process
+        >>> subscriber = ValueSubscriber(publisher.name)
+        >>> subscriber.read().health
+        100
+        """
+
+        super().__init__()
+
+        self._memory_reader = memory_reader
+        self.interval = interval
+
+        self._names = list(values)
+        self._targets = [target if isinstance(target, tuple)
+                         else Address(target)
+                         for target, _ in values.values()]
+        self._formats = [values[key][1] for key in self._names]
+        self._structs = [struct.Struct("<" + fmt) for fmt in self._formats]
+
+        layout = json.dumps({"names": self._names,
+                             "formats": self._formats}).encode()
+        self._control = _HEADER.size + len(layout)
+        self._control += -self._control % 64
+
+        valid_offset, self._offsets, size = _layout(self._formats)
+        self._valid_offset = valid_offset
+
+        self._shm = shared_memory.SharedMemory(name, create=True,
+                                               size=self._control + size)
+        self._buffer = self._shm.buf
+        _published.add(self._shm.name)
+        _HEADER.pack_into(self._buffer, 0, MAGIC, len(layout))
+        self._buffer[_HEADER.size:_HEADER.size + len(layout)] = layout
+
+        # Ticks are prepared here and copied into the block at once
+        self._staging = bytearray(size - _SEQUENCE.size)
+        self._sequence = 0
+
+        self.ticks = 0
+        self.last_latency = 0.0
+
+    def __enter__(self) -> "ValuePublisher":
+        self.start()
+        return self
+
+    def __exit__(self, *args) -> None:
+        self.close()
+
+    @property
+    def name(self) -> str:
+        """Returns the name subscribers attach to.
+
+        Returns:
+            str: Name of the shared memory block.
+        """
+        return self._shm.name
+
+    def tick(self) -> None:
+        """Reads all values once and publishes them. Called by the
+        background thread, but can be used without it."""
+
+        start = time.perf_counter()
+        memory_reader = self._memory_reader
+
+        targets = list(self._targets)
+        chains = [index for index, target in enumerate(targets)
+                  if isinstance(target, tuple)]
+        if chains:
+            resolved = memory_reader.resolve_pointers(
+                [targets[index] for index in chains])
+            for index, address in zip(chains, resolved):
+                targets[index] = address
+
+        requests = [(target, f"{packer.size}s")
+                    for target, packer in zip(targets, self._structs)
+                    if target is not None]
+        values = iter(memory_reader.read_many(requests))
+
+        self.ticks += 1
+        staging = self._staging
+        base = _SEQUENCE.size
+        _TICK.pack_into(staging, 0, time.time(), self.ticks)
+
+        for index, (target, offset) in enumerate(zip(targets,
+                                                     self._offsets)):
+            value = next(values) if target is not None else None
+            valid = value is not None
+            staging[self._valid_offset - base + index] = valid
+            if valid:
+                staging[offset - base:offset - base + len(value)] = value
+
+        # Odd while writing, readers retry until it is even and unchanged
+        control = self._control
+        self._sequence += 1
+        _SEQUENCE.pack_into(self._buffer, control, self._sequence)
+        self._buffer[control + base:control + base + len(staging)] = staging
+        self._sequence += 1
+        _SEQUENCE.pack_into(self._buffer, control, self._sequence)
+
+        self.last_latency = time.perf_counter() - start
+
+    def close(self) -> None:
+        """Stops publishing and removes the shared memory block."""
+
+        self.stop()
+        self._buffer.release()
+        self._shm.close()
+        self._shm.unlink()
+        _published.discard(self._shm.name)
+
+
+class ValueSubscriber:
+    def __init__(self, name: str):
+        """Reads the values published by a ValuePublisher.
+
+        Args:
+            name (str): Name of the publisher's shared memory block, see
+                ValuePublisher.name.
+
+        To use:
+        >>> subscriber = ValueSubscriber(name)
+        >>> values = subscriber.read()
+        >>> values.health, values.x
+        (100, 12.5)
+        >>> subscriber.timestamp, subscriber.tick
+        (1700000000.25, 381)
+        """
+
+        self._shm = _attach(name)
+        self._buffer = self._shm.buf
+
+        magic, size = _HEADER.unpack_from(self._buffer)
+        if magic != MAGIC:
+            self._buffer.release()
+            self._shm.close()
+            raise ValueError(f"{name} is not a ValuePublisher block")
+
+        layout = json.loads(bytes(self._buffer[_HEADER.size:
+                                               _HEADER.size + size]))
+        self._names = layout["names"]
+        self._formats = layout["formats"]
+
+        self._control = _HEADER.size + size
+        self._control += -self._control % 64
+        self._valid_offset, self._offsets, size = _layout(self._formats)
+        self._structs = [struct.Struct("<" + fmt) for fmt in self._formats]
+
+        self._data = self._buffer[self._control:self._control + size]
+        self._record = namedtuple("Values", self._names, rename=True)
+
+        self.timestamp = 0.0
+        self.tick = 0
+        self.retries = 0
+
+    def __enter__(self) -> "ValueSubscriber":
+        return self
+
+    def __exit__(self, *args) -> None:
+        self.close()
+
+    @property
+    def names(self) -> List[str]:
+        """Returns the names of the published values.
+
+        Returns:
+            List[str]: The names, in the order of read().
+        """
+        return list(self._names)
+
+    @property
+    def view(self) -> memoryview:
+        """Returns a view of the published block without copying it.
+        Unlike read, it is not checked for consistency, so values can
+        be from a tick that is only partly written. Compare sequence
+        before and after using it to detect that.
+
+        Returns:
+            memoryview: The values area of the block.
+        """
+        return self._data
+
+    @property
+    def sequence(self) -> int:
+        """Returns the current sequence number. It grows by two per tick,
+        so it can be used to check for new values cheaply.
+
+        Returns:
+            int: The sequence number.
+        """
+        return _SEQUENCE.unpack_from(self._data)[0]
+
+    def read(self, max_retries: int = 1000) -> Union[Tuple, None]:
+        """Returns a consistent copy of the last published values. The
+        values area is copied once per call, then decoded from the copy,
+        so the values never mix two ticks. Use view to avoid the copy.
+
+        Args:
+            max_retries (int, optional): How often to retry when the
+                publisher was writing at the same time.
+
+        Returns:
+            Union[Tuple, None]: A namedtuple of the values, a value is None
+                if it could not be read. None if the publisher kept
+                writing for all retries or did not publish yet.
+        """
+
+        data = self._data
+        for _ in range(max_retries + 1):
+            before = _SEQUENCE.unpack_from(data)[0]
+            if before & 1:
+                self.retries += 1
+                continue
+
+            copy = bytes(data)
+            if _SEQUENCE.unpack_from(data)[0] != before:
+                self.retries += 1
+                continue
+
+            if before == 0:
+                return None
+
+            self.timestamp, self.tick = _TICK.unpack_from(copy,
+                                                          _SEQUENCE.size)
+            return self._record(*[
+                packer.unpack_from(copy, offset)[0]
+                if copy[self._valid_offset + index] else None
+                for index, (packer, offset)
+                in enumerate(zip(self._structs, self._offsets))
+            ])
+
+        return None
+
+    def close(self) -> None:
+        """Detaches from the shared memory block."""
+
+        self._data.release()
+        self._buffer.release()
+        self._shm.close()
+
+
+def _attach(name: str) -> shared_memory.SharedMemory:
+    try:
+        return shared_memory.SharedMemory(name, track=False)
+    except TypeError:
+        # Before Python 3.13 attaching registers the block with the
+        # resource tracker, which would remove it when this process ends
+        shm = shared_memory.SharedMemory(name)
+        if os.name == "posix" and shm.name not in _published:
+            from multiprocessing import resource_tracker
+            resource_tracker.unregister(shm._name, "shared_memory")
+        return shm
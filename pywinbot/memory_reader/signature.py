@@ -0,0 +1,97 @@
+from typing import Iterator, List, Tuple, Union
+
+
+class Signature:
+    def __init__(self, pattern: str):
+        """A byte signature with wildcards, e.g. "48 8B 05 ?? ?? ?? ??".
+
+        The longest run of fixed bytes is used as anchor and searched
+        with bytes.find, the remaining fixed bytes are only compared
+        where the anchor was found.
+
+        Args:
+            pattern (str): Hex bytes separated by spaces. '?' or '??'
+                matches any byte.
+
+        To use:
+        >>> sig = Signature("48 8B 05 ?? ?? ?? ?? 48 85 C0")
+        >>> list(sig.find_all(data))
+        [4096]
+        """
+
+        tokens = pattern.split()
+        if not tokens:
+            raise ValueError("Signature pattern is empty.")
+
+        self.pattern = pattern
+        self.mask = tuple(token not in ("?", "??") for token in tokens)
+        self.bytes = bytes(int(token, 16) if fixed else 0
+                           for token, fixed in zip(tokens, self.mask))
+
+        # Runs of fixed bytes as (offset, bytes)
+        runs: List[Tuple[int, bytes]] = []
+        start = None
+        for index, fixed in enumerate(self.mask + (False,)):
+            if fixed and start is None:
+                start = index
+            elif not fixed and start is not None:
+                runs.append((start, self.bytes[start:index]))
+                start = None
+
+        if not runs:
+            raise ValueError("Signature pattern only consists of wildcards.")
+
+        anchor = max(runs, key=lambda run: len(run[1]))
+        runs.remove(anchor)
+
+        self._anchor_offset, self._anchor = anchor
+        self._checks = runs
+
+    def __len__(self) -> int:
+        return len(self.mask)
+
+    def __repr__(self) -> str:
+        return f"<Signature pattern={self.pattern}>"
+
+    def find_all(
+        self,
+        data: Union[bytes, bytearray],
+        start: int = 0,
+        end: Union[int, None] = None,
+    ) -> Iterator[int]:
+        """Yields the offsets of all matches in data[start:end].
+
+        Args:
+            data (Union[bytes, bytearray]): The data to search.
+            start (int, optional): Offset to start searching at.
+            end (Union[int, None], optional): Offset to stop searching at.
+                Matches have to end before it.
+
+        Yields:
+            int: Offset of a match in data.
+        """
+
+        if end is None:
+            end = len(data)
+
+        anchor = self._anchor
+        anchor_offset = self._anchor_offset
+        checks = self._checks
+        length = len(self.mask)
+
+        find = data.find
+        last_start = end - length
+
+        position = find(anchor, start + anchor_offset, end)
+        while position != -1:
+            match = position - anchor_offset
+            if match > last_start:
+                break
+
+            for offset, fixed in checks:
+                if data[match+offset:match+offset+len(fixed)] != fixed:
+                    break
+            else:
+                yield match
+
+            position = find(anchor, position + 1, end)
@@ -0,0 +1,116 @@
+from struct import unpack_from
+from typing import TYPE_CHECKING, Tuple, Union
+
+from .address import Address
+
+if TYPE_CHECKING:
+    from .memory_reader import MemoryReader
+
+
+class MemorySnapshot:
+    def __init__(
+        self,
+        memory_reader: "MemoryReader",
+        address: Address,
+        size: int,
+    ):
+        """A copy of a block of process memory that is read with a single
+        call and decoded locally. Use MemoryReader.snapshot to create one.
+
+        Args:
+            memory_reader (MemoryReader): The reader to read with.
+            address (Address): Start of the block.
+            size (int): Size of the block in bytes.
+        """
+
+        self._memory_reader = memory_reader
+        self._address = address
+        self._buffer = bytearray(size)
+        self._view = memoryview(self._buffer)
+        self._valid = False
+
+    def __len__(self) -> int:
+        return len(self._buffer)
+
+    def __repr__(self) -> str:
+        return (f"<MemorySnapshot address={self._address!r} "
+                f"size={len(self)} valid={self._valid}>")
+
+    @property
+    def address(self) -> Address:
+        """Returns the start address of the block.
+
+        Returns:
+            Address: Start address
+        """
+        return self._address
+
+    @property
+    def valid(self) -> bool:
+        """Returns whether the last refresh succeeded.
+
+        Returns:
+            bool: True if the buffer holds the current memory.
+        """
+        return self._valid
+
+    @property
+    def view(self) -> memoryview:
+        """Returns a memoryview of the buffer. It stays valid across
+        refreshes, as the same buffer is reused.
+
+        Returns:
+            memoryview: View of the whole block.
+        """
+        return self._view
+
+    def refresh(self) -> bool:
+        """Reads the block again into the existing buffer.
+
+        Returns:
+            bool: True means success, False means reading failed.
+        """
+
+        self._valid = self._memory_reader.read_into(self._address,
+                                                    self._buffer)
+        return self._valid
+
+    def unpack_from(self, fmt: str, offset: int = 0) -> Tuple:
+        """Unpacks values at offset, see struct.unpack_from.
+
+        Args:
+            fmt (str): struct format string.
+            offset (int, optional): Offset into the block.
+
+        Returns:
+            Tuple: The unpacked values.
+        """
+        return unpack_from(fmt, self._buffer, offset)
+
+    def read(
+        self,
+        offset: int,
+        unpack_type: str,
+    ) -> Union[int, float, bytes]:
+        """Reads a single value at offset, like MemoryReader.read but
+        without reading process memory.
+
+        Args:
+            offset (int): Offset into the block.
+            unpack_type (str): The data type to unpack (see struct).
+
+        Returns:
+            Union[int, float, bytes]: The unpacked value.
+        """
+        return unpack_from(unpack_type, self._buffer, offset)[0]
+
+    def address_of(self, offset: int) -> Address:
+        """Returns the process address of an offset into the block.
+
+        Args:
+            offset (int): Offset into the block.
+
+        Returns:
+            Address: The address in the process.
+        """
+        return self._address + offset
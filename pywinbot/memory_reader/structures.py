@@ -1,5 +1,5 @@
-from ctypes import POINTER, Structure, c_char
-from ctypes.wintypes import BYTE, DWORD, HMODULE
+from ctypes import POINTER, Structure, c_char, c_size_t
+from ctypes.wintypes import BYTE, DWORD, HMODULE, LPVOID
 
 
 class MODULEENTRY32(Structure):
@@ -15,3 +15,17 @@ class MODULEENTRY32(Structure):
         ("szModule", c_char * 256),
         ("szExePath", c_char * 260),
     ]
+
+
+class MEMORY_BASIC_INFORMATION(Structure):
+    # PartitionId (WORD) after AllocationProtect only exists on 64-bit,
+    # where it fits into the padding before RegionSize.
+    _fields_ = [
+        ("BaseAddress", LPVOID),
+        ("AllocationBase", LPVOID),
+        ("AllocationProtect", DWORD),
+        ("RegionSize", c_size_t),
+        ("State", DWORD),
+        ("Protect", DWORD),
+        ("Type", DWORD),
+    ]
@@ -0,0 +1,287 @@
+from typing import TYPE_CHECKING, Iterable, List, Tuple, Union
+
+import numpy as np
+
+from .address import Address
+from .address_array import AddressArray
+
+if TYPE_CHECKING:
+    from .memory_reader import MemoryReader
+
+COMPARISONS = ("changed", "unchanged", "increased", "decreased", "equal")
+
+
+class _Block:
+    # A part of a region whose candidates are stored either as all
+    # positions, a packed bitmap or an array of position indices.
+    __slots__ = ("start", "positions", "kind", "data", "values")
+
+    def __init__(self, start: int, positions: int):
+        self.start = start
+        self.positions = positions
+        self.kind = "all"
+        self.data = None
+        self.values = None
+
+    def indices(self) -> np.ndarray:
+        if self.kind == "all":
+            return np.arange(self.positions, dtype=np.uint32)
+        elif self.kind == "bitmap":
+            bits = np.unpackbits(self.data, count=self.positions)
+            return np.flatnonzero(bits).astype(np.uint32)
+        return self.data
+
+    def store(self, mask: np.ndarray, indices: Union[np.ndarray, None],
+              values: np.ndarray) -> int:
+        if indices is not None:
+            indices = indices[mask]
+        else:
+            indices = np.flatnonzero(mask).astype(np.uint32)
+
+        count = len(indices)
+        if count == self.positions:
+            self.kind, self.data = "all", None
+        elif count * 32 < self.positions:
+            # An index costs 32 bits, a bitmap 1 bit per position
+            self.kind, self.data = "offsets", indices
+        else:
+            bits = np.zeros(self.positions, dtype=np.bool_)
+            bits[indices] = True
+            self.kind, self.data = "bitmap", np.packbits(bits)
+
+        self.values = np.array(values[mask])
+        return count
+
+
+class ValueScanner:
+    def __init__(
+        self,
+        memory_reader: "MemoryReader",
+        dtype,
+        regions: Union[Iterable[Tuple[Union[Address, int], int]],
+                       None] = None,
+        alignment: Union[int, None] = None,
+        chunk_size: int = 0x1000000,
+    ):
+        """Finds addresses by their value, like Cheat Engine does. A first
+        scan collects all candidates, next scans narrow them down by how
+        their value changed. Requires numpy.
+
+        Candidates are kept per chunk as a bitmap or as an array of
+        offsets, whichever is smaller, together with their last values.
+
+        Args:
+            memory_reader (MemoryReader): The reader to scan with.
+            dtype: Type of the value, a NumPy dtype or struct character
+                like 'i', 'f' or 'd'.
+            regions (Union[Iterable[Tuple[Union[Address, int], int]], None],
+                optional): (start, size) ranges to scan. Defaults to all
+                readable regions of the process.
+            alignment (Union[int, None], optional): Distance between two
+                candidate positions. Defaults to the size of the value.
+            chunk_size (int, optional): Number of bytes read at once.
+
+        To use:
+        >>> mr = MemoryReader(...)
+        >>> scanner = ValueScanner(mr, "i")
+        >>> scanner.first_scan(100)
+        52311
+        >>> # ... lose some health ...
+        >>> scanner.next_scan("decreased")
+        12
+        >>> scanner.next_scan("equal", 93)
+        1
+        >>> addr, value = scanner.results()[0]
+        """
+
+        self._memory_reader = memory_reader
+        self._dtype = np.dtype(dtype)
+        self._alignment = alignment or self._dtype.itemsize
+        self._chunk_size = chunk_size - chunk_size % self._alignment
+
+        if regions is None:
+            regions = memory_reader.regions().readable_ranges()
+        self._regions = [(int(start), size) for start, size in regions]
+
+        self._blocks: List[_Block] = []
+        self._buffer = None
+
+    @property
+    def count(self) -> int:
+        """Returns the number of candidates.
+
+        Returns:
+            int: Number of candidates.
+        """
+        return sum(len(block.values) for block in self._blocks)
+
+    def first_scan(
+        self,
+        value: Union[int, float, None] = None,
+        between: Union[Tuple[Union[int, float], Union[int, float]],
+                       None] = None,
+    ) -> int:
+        """Scans all regions and keeps every position as candidate whose
+        value matches. Without value or between, all positions are kept
+        (unknown initial value).
+
+        Args:
+            value (Union[int, float, None], optional): Exact value.
+            between (Union[Tuple, None], optional): (min, max) range,
+                both inclusive.
+
+        Returns:
+            int: Number of candidates.
+        """
+
+        itemsize = self._dtype.itemsize
+        alignment = self._alignment
+        chunk_positions = self._chunk_size // alignment
+
+        self._blocks = []
+        for region_start, region_size in self._regions:
+            region_positions = (region_size - itemsize) // alignment + 1
+
+            for first in range(0, region_positions, chunk_positions):
+                positions = min(chunk_positions, region_positions - first)
+                block = _Block(region_start + first * alignment, positions)
+
+                current = self._read(block.start, positions)
+                if current is None:
+                    continue
+
+                if value is not None:
+                    mask = current == value
+                elif between is not None:
+                    mask = (current >= between[0]) & (current <= between[1])
+                else:
+                    mask = np.ones(positions, dtype=np.bool_)
+
+                if block.store(mask, None, current):
+                    self._blocks.append(block)
+
+        return self.count
+
+    def next_scan(
+        self,
+        compare: str,
+        value: Union[int, float, None] = None,
+    ) -> int:
+        """Reads the candidates again and keeps those whose value passed
+        the comparison with their previous value.
+
+        Args:
+            compare (str): One of 'changed', 'unchanged', 'increased',
+                'decreased' or 'equal'.
+            value (Union[int, float, None], optional): The value to compare
+                to for 'equal'.
+
+        Returns:
+            int: Number of candidates.
+        """
+
+        if compare not in COMPARISONS:
+            raise ValueError(f"compare has to be one of {COMPARISONS}.")
+
+        if compare == "equal" and value is None:
+            raise ValueError("'equal' needs a value to compare to.")
+
+        blocks = []
+        for block in self._blocks:
+            indices = block.indices()
+
+            # Only read the span that still holds candidates
+            first = int(indices[0])
+            current = self._read(block.start + first * self._alignment,
+                                 int(indices[-1]) - first + 1)
+            if current is None:
+                continue
+
+            current = current[indices - first]
+            previous = block.values
+
+            if compare == "changed":
+                mask = current != previous
+            elif compare == "unchanged":
+                mask = current == previous
+            elif compare == "increased":
+                mask = current > previous
+            elif compare == "decreased":
+                mask = current < previous
+            else:
+                mask = current == value
+
+            if block.store(mask, indices, current):
+                blocks.append(block)
+
+        self._blocks = blocks
+        return self.count
+
+    def addresses(self) -> AddressArray:
+        """Returns the addresses of all candidates.
+
+        Returns:
+            AddressArray: The addresses.
+        """
+
+        if not self._blocks:
+            return AddressArray(np.empty(0, dtype=np.uint64))
+
+        return AddressArray(np.concatenate([
+            block.start + block.indices().astype(np.uint64) * self._alignment
+            for block in self._blocks
+        ]))
+
+    def values(self) -> np.ndarray:
+        """Returns the last read values of all candidates, in the order
+        of addresses().
+
+        Returns:
+            np.ndarray: Array of values.
+        """
+
+        if not self._blocks:
+            return np.empty(0, dtype=self._dtype)
+
+        return np.concatenate([block.values for block in self._blocks])
+
+    def results(
+        self,
+        limit: int = 100,
+    ) -> List[Tuple[Address, Union[int, float]]]:
+        """Returns the first candidates as (Address, value) tuples.
+
+        Args:
+            limit (int, optional): Maximum number of results.
+
+        Returns:
+            List[Tuple[Address, Union[int, float]]]: Candidates.
+        """
+
+        results = []
+        for block in self._blocks:
+            indices = block.indices()[:limit - len(results)]
+            for index, value in zip(indices, block.values):
+                results.append((Address(block.start
+                                        + int(index) * self._alignment),
+                                value.item()))
+
+            if len(results) >= limit:
+                break
+
+        return results
+
+    def _read(self, start: int, positions: int) -> Union[np.ndarray, None]:
+        size = (positions - 1) * self._alignment + self._dtype.itemsize
+
+        if self._buffer is None or len(self._buffer) < size:
+            self._buffer = np.empty(max(size, self._chunk_size
+                                        + self._dtype.itemsize),
+                                    dtype=np.uint8)
+
+        if not self._memory_reader.read_into(Address(start),
+                                             self._buffer[:size]):
+            return None
+
+        return np.ndarray((positions,), self._dtype, buffer=self._buffer,
+                          strides=(self._alignment,))
@@ -0,0 +1,271 @@
+import logging
+import queue
+import threading
+import time
+from collections import namedtuple
+from typing import (TYPE_CHECKING, Any, Callable, Dict, Hashable, List,
+                    Tuple, Union)
+
+from ..background import Worker
+from .address import Address
+
+if TYPE_CHECKING:
+    from .memory_reader import MemoryReader
+
+_logger = logging.getLogger(__name__)
+
+WatchEvent = namedtuple("WatchEvent", ["name", "old", "new", "timestamp"])
+
+Target = Union[Address, Tuple[Union[Address, str], List[str]]]
+
+
+class _Watch:
+    __slots__ = ("name", "target", "unpack_type", "buffer_size",
+                 "callback", "min_interval", "max_interval", "interval",
+                 "next_due", "value", "has_value", "polls", "changes")
+
+    def __init__(self, name, target, unpack_type, buffer_size, callback,
+                 min_interval, max_interval):
+        self.name = name
+        self.target = target
+        self.unpack_type = unpack_type
+        self.buffer_size = buffer_size
+        self.callback = callback
+        self.min_interval = min_interval
+        self.max_interval = max_interval
+        self.interval = min_interval
+        self.next_due = 0.0
+        self.value = None
+        self.has_value = False
+        self.polls = 0
+        self.changes = 0
+
+
+class Watcher(Worker):
+    def __init__(
+        self,
+        memory_reader: "MemoryReader",
+        max_interval: float = 1.0,
+        backoff: float = 1.5,
+    ):
+        """Polls many addresses from one thread and reports changes.
+        All watches that are due are read with one batched read. Watches
+        whose value did not change are polled less often, up to
+        max_interval, and go back to their own interval once they change.
+
+        Args:
+            memory_reader (MemoryReader): The reader to read with.
+            max_interval (float, optional): Longest interval in seconds a
+                watch is slowed down to.
+            backoff (float, optional): Factor the interval of an unchanged
+                watch grows by after each poll.
+
+        To use:
+        >>> mr = MemoryReader(...)
+        >>> watcher = Watcher(mr)
+        >>> watcher.watch(Address("ABC123456"), "i", interval=0.05,
+                          callback=lambda event: print(event.new),
+                          name="health")
+        >>> watcher.watch(("ABC123500", ["40", "F08"]), "f", name="x")
+        >>> watcher.start()
+        >>> event = watcher.events.get()  # watches without callback
+        """
+
+        super().__init__()
+
+        self._memory_reader = memory_reader
+        self.max_interval = max_interval
+        self.backoff = backoff
+
+        self.events: "queue.Queue[WatchEvent]" = queue.Queue()
+
+        self._watches: Dict[Hashable, _Watch] = {}
+        self._mutex = threading.Lock()
+        self._wakeup = threading.Event()
+
+        self.reads = 0
+        self.callback_errors = 0
+
+    def __enter__(self) -> "Watcher":
+        self.start()
+        return self
+
+    def __exit__(self, *args) -> None:
+        self.stop()
+
+    def watch(
+        self,
+        target: Target,
+        unpack_type: str,
+        interval: float = 0.1,
+        callback: Union[Callable[[WatchEvent], Any], None] = None,
+        name: Union[Hashable, None] = None,
+        buffer_size: Union[int, None] = None,
+        max_interval: Union[float, None] = None,
+    ) -> Hashable:
+        """Adds a watch. Watching the same name again replaces it.
+
+        Args:
+            target (Target): An Address, or a (base_pointer_addr, offsets)
+                tuple for a pointer chain as for get_final_pointer,
+                resolved on every poll.
+            unpack_type (str): The data type to unpack, see read.
+            interval (float, optional): Seconds between two polls while the
+                value is changing.
+            callback (Union[Callable[[WatchEvent], Any], None], optional):
+                Called from the watcher thread when the value changed. If
+                not given, events are put into Watcher.events. Exceptions
+                are logged and counted in callback_errors.
+            name (Union[Hashable, None], optional): Name of the watch.
+                Defaults to the target.
+            buffer_size (Union[int, None], optional): Needed for 'str'.
+            max_interval (Union[float, None], optional): Longest interval
+                of this watch. Defaults to the watcher's max_interval.
+
+        Returns:
+            Hashable: The name of the watch.
+        """
+
+        if not isinstance(target, tuple):
+            target = Address(target)
+
+        if name is None:
+            name = target if isinstance(target, Address) else \
+                (target[0], tuple(target[1]))
+
+        watch = _Watch(name, target, unpack_type, buffer_size, callback,
+                       interval, max(interval, max_interval
+                                     or self.max_interval))
+
+        with self._mutex:
+            self._watches[name] = watch
+
+        self._wakeup.set()
+        return name
+
+    def unwatch(self, name: Hashable) -> None:
+        """Removes a watch.
+
+        Args:
+            name (Hashable): The name of the watch.
+        """
+
+        with self._mutex:
+            self._watches.pop(name, None)
+
+    def value(self, name: Hashable) -> Any:
+        """Returns the last read value of a watch.
+
+        Args:
+            name (Hashable): The name of the watch.
+
+        Returns:
+            Any: The value, None if it was not read yet.
+        """
+        return self._watches[name].value
+
+    def stats(self, name: Hashable) -> Tuple[int, int, float]:
+        """Returns how often a watch was polled, how often its value
+        changed, and its current interval.
+
+        Args:
+            name (Hashable): The name of the watch.
+
+        Returns:
+            Tuple[int, int, float]: (polls, changes, interval)
+        """
+
+        watch = self._watches[name]
+        return watch.polls, watch.changes, watch.interval
+
+    def poll(self) -> float:
+        """Reads all watches that are due and reports changes. Called by
+        the background thread, but can be used without it.
+
+        Returns:
+            float: Monotonic time the next watch is due at.
+        """
+
+        now = time.monotonic()
+        with self._mutex:
+            due = [watch for watch in self._watches.values()
+                   if watch.next_due <= now]
+
+        if due:
+            self._poll(due, now)
+
+        with self._mutex:
+            return min((watch.next_due for watch in self._watches.values()),
+                       default=now + self.max_interval)
+
+    def _poll(self, due: List[_Watch], now: float) -> None:
+        memory_reader = self._memory_reader
+
+        chains = [watch for watch in due
+                  if isinstance(watch.target, tuple)]
+        addresses = {}
+        if chains:
+            resolved = memory_reader.resolve_pointers(
+                [watch.target for watch in chains])
+            addresses = dict(zip(map(id, chains), resolved))
+
+        requests = []
+        polled = []
+        for watch in due:
+            address = addresses.get(id(watch), watch.target)
+            if address is None:
+                self._update(watch, None, now)
+                continue
+
+            if watch.unpack_type == "str":
+                requests.append((address, "str", watch.buffer_size))
+            else:
+                requests.append((address, watch.unpack_type))
+            polled.append(watch)
+
+        if requests:
+            self.reads += 1
+            for watch, value in zip(polled,
+                                    memory_reader.read_many(requests)):
+                self._update(watch, value, now)
+
+    def _update(self, watch: _Watch, value: Any, now: float) -> None:
+        watch.polls += 1
+
+        if not watch.has_value:
+            watch.value, watch.has_value = value, True
+
+        elif value != watch.value:
+            event = WatchEvent(watch.name, watch.value, value, now)
+            watch.value = value
+            watch.changes += 1
+            watch.interval = watch.min_interval
+
+            if watch.callback is not None:
+                try:
+                    watch.callback(event)
+                except Exception:
+                    # A failing callback must not stop the other watches
+                    self.callback_errors += 1
+                    _logger.exception("Callback of watch %r failed",
+                                      watch.name)
+            else:
+                self.events.put(event)
+
+        else:
+            watch.interval = min(watch.interval * self.backoff,
+                                 watch.max_interval)
+
+        watch.next_due = now + watch.interval
+
+    def _wake(self) -> None:
+        self._wakeup.set()
+
+    def _run(self) -> None:
+        while not self._stop.is_set():
+            # Cleared before polling, so a watch added during the poll
+            # wakes the wait below instead of being missed
+            self._wakeup.clear()
+            next_due = self.poll()
+
+            self._wakeup.wait(max(next_due - time.monotonic(), 0))
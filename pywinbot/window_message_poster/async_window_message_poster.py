@@ -0,0 +1,92 @@
+import asyncio
+from typing import Sequence, Union
+
+from .functions import PostMessage
+from .keys import VIRTUAL_KEY_CODES as KEYS
+from .macro import CompiledMacro, PlaybackStats
+from .window_message_poster import WindowMessagePoster
+
+
+class AsyncWindowMessagePoster(WindowMessagePoster):
+    """WindowMessagePoster for asyncio. Key presses and clicks wait with
+    asyncio.sleep instead of time.sleep, so many bots can share one
+    event loop and thread.
+
+    With an InputScheduler (see set_scheduler), their events are posted
+    by the scheduler instead and awaiting them waits for its Future,
+    which resolves to the PostMessage results.
+
+    To use:
+    >>> wmp = AsyncWindowMessagePoster.by_window(window_class="Notepad")
+    >>> await wmp.send_key_press("F1")
+    >>> await wmp.send_left_click((100, 200))
+    >>> await wmp.send_drag((100, 200), (300, 200), duration=0.25)
+    """
+
+    async def _click(self, click_type: str,
+                     position: tuple) -> Union[bool, None]:
+        if self._scheduler is not None:
+            return await asyncio.wrap_future(super()._click(click_type,
+                                                            position))
+
+        down_message, up_message, pos = self._click_messages(click_type,
+                                                             position)
+
+        # Post message
+        PostMessage(self.hwnd, down_message, 0, pos)
+        await asyncio.sleep(self._key_press_delay)
+        PostMessage(self.hwnd, up_message, 0, pos)
+
+    async def send_key_press(self, key: str) -> Union[bool, None]:
+        assert key in KEYS
+
+        if self._scheduler is not None:
+            return await asyncio.wrap_future(super().send_key_press(key))
+
+        self._keydown(key)
+        await asyncio.sleep(self._key_press_delay)
+        self._keyup(key)
+
+    async def send_enter(self) -> Union[bool, None]:
+        return await self.send_key_press("enter")
+
+    async def send_left_click(self, position: tuple) -> Union[bool, None]:
+        return await self._click("left", position)
+
+    async def send_right_click(self, position: tuple) -> Union[bool, None]:
+        return await self._click("right", position)
+
+    async def send_mouse_path(
+        self,
+        path: Sequence[tuple],
+        duration: float = 0.2,
+        rate: float = 120,
+        button: Union[str, None] = None,
+    ) -> Union[PlaybackStats, bool]:
+        """See WindowMessagePoster.send_mouse_path."""
+        return await self._post_gesture(*self._move_records(path, duration,
+                                                            rate, button))
+
+    async def send_drag(
+        self,
+        start: tuple,
+        end: tuple,
+        duration: float = 0.2,
+        rate: float = 120,
+        button: str = "left",
+        path: Union[Sequence[tuple], None] = None,
+    ) -> Union[PlaybackStats, bool]:
+        """See WindowMessagePoster.send_drag."""
+        return await self._post_gesture(self._drag_records(
+            start, end, duration, rate, button, path))
+
+    async def _post_gesture(
+        self,
+        records: list,
+        trailing_delay: float = 0.0,
+    ) -> Union[PlaybackStats, bool]:
+        if self._scheduler is not None:
+            return await asyncio.wrap_future(self._schedule(records))
+
+        return await CompiledMacro(self.hwnd, records,
+                                   trailing_delay).play_async()
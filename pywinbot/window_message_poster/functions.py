@@ -1,6 +1,13 @@
-from ctypes import windll, POINTER
+from ctypes import POINTER
 from ctypes.wintypes import HWND, UINT, WPARAM, LPARAM, BOOL, POINT, RECT
 
+from ..backend import WinFunction
+
+
+_PostMessageA = WinFunction("user32", "PostMessageA",
+                            [HWND, UINT, WPARAM, LPARAM],
+                            BOOL)
+
 
 def PostMessage(
     hWnd: HWND,
@@ -9,41 +16,40 @@ def PostMessage(
     lParam: LPARAM
 ) -> bool:
     # https://docs.microsoft.com/en-us/windows/win32/api/winuser/nf-winuser-postmessagea
-    func = windll.user32.PostMessageA
-    func.argtypes = [HWND, UINT, WPARAM, LPARAM]
-    func.restype = BOOL
-
-    res = func(hWnd, Msg, wParam, lParam)
+    res = _PostMessageA(hWnd, Msg, wParam, lParam)
     return bool(res)
 
 
+_ScreenToClient = WinFunction("user32", "ScreenToClient",
+                              [HWND, POINTER(POINT)],
+                              BOOL)
+
+
 def ScreenToClient(
     hWnd: HWND,
     lpPoint: POINTER(POINT),
 ) -> bool:
     # https://docs.microsoft.com/en-us/windows/win32/api/winuser/nf-winuser-screentoclient
-    func = windll.user32.ScreenToClient
-    func.argtypes = [HWND, POINTER(POINT)]
-    func.restype = BOOL
-
-    res = func(hWnd, lpPoint)
+    res = _ScreenToClient(hWnd, lpPoint)
     return bool(res)
 
 
+_GetWindowRect = WinFunction("user32", "GetWindowRect",
+                             [HWND, POINTER(RECT)],
+                             BOOL)
+
+
 def GetWindowRect(
     hWnd: HWND,
     lpRect: POINTER(RECT)
 ) -> bool:
     # https://docs.microsoft.com/en-us/windows/win32/api/winuser/nf-winuser-getwindowrect
-    func = windll.user32.GetWindowRect
-    func.argtypes = [HWND, POINTER(RECT)]
-    func.restype = BOOL
-
-    res = func(hWnd, lpRect)
+    res = _GetWindowRect(hWnd, lpRect)
     return bool(res)
 
 
-def GetForegroundWindow() -> HWND:
-    func = windll.user32.GetForegroundWindow
+_GetForegroundWindow = WinFunction("user32", "GetForegroundWindow", [], HWND)
+
 
-    return func()
+def GetForegroundWindow() -> HWND:
+    return _GetForegroundWindow()
@@ -0,0 +1,303 @@
+import heapq
+import itertools
+import threading
+import time
+from collections import deque
+from concurrent.futures import Future
+from typing import Deque, Dict, List, Sequence, Tuple, Union
+
+from ..background import Worker
+from .functions import PostMessage
+
+# (msg, wParam, lParam, delay in seconds after the previous event)
+Event = Tuple[int, int, int, float]
+
+
+class _Sequence:
+    __slots__ = ("future", "remaining", "started", "cancelled", "success")
+
+    def __init__(self, count: int):
+        self.future = Future()
+        self.remaining = count
+        self.started = False
+        self.cancelled = False
+        self.success = True
+
+
+class InputScheduler(Worker):
+    def __init__(self, spin: float = 0.002, history: int = 1000):
+        """Posts window messages from a background thread at given
+        monotonic timestamps. Callers enqueue events and return right
+        away. Waiting and jitter use time.perf_counter(), like
+        CompiledMacro.play, since time.monotonic() only ticks every
+        15.6 ms on Windows before Python 3.13.
+
+        Events of the same window are always posted in the order they
+        were scheduled. An event scheduled before an earlier scheduled
+        event of the same window is moved behind it.
+
+        Args:
+            spin (float, optional): Seconds before a deadline at which the
+                thread stops sleeping and busy waits. Sleeping alone is
+                only accurate to a few milliseconds on Windows.
+            history (int, optional): Number of recent jitter values kept
+                for jitter_percentile.
+
+        To use:
+        >>> scheduler = InputScheduler()
+        >>> scheduler.start()
+        >>> wmp = WindowMessagePoster(hwnd)
+        >>> wmp.set_scheduler(scheduler)
+        >>> future = wmp.send_key_press("F1")  # returns right away
+        >>> future.result()
+        True
+        >>> scheduler.max_jitter
+        0.00004
+        """
+
+        super().__init__()
+
+        self.spin = spin
+
+        # Deadlines in the queue are time.perf_counter() timestamps
+        self._queue: List[tuple] = []
+        self._counter = itertools.count()
+        self._last_deadline: Dict[int, float] = {}
+        self._condition = threading.Condition()
+
+        self.posted = 0
+        self.last_jitter = 0.0
+        self.max_jitter = 0.0
+        self._total_jitter = 0.0
+        self.recent_jitter: Deque[float] = deque(maxlen=history)
+
+    def __enter__(self) -> "InputScheduler":
+        self.start()
+        return self
+
+    def __exit__(self, *args) -> None:
+        self.stop(drain=True)
+
+    @property
+    def pending(self) -> int:
+        """Returns the number of events not posted yet.
+
+        Returns:
+            int: Number of queued events.
+        """
+        return len(self._queue)
+
+    @property
+    def average_jitter(self) -> float:
+        """Returns how late events were posted on average, in seconds.
+
+        Returns:
+            float: Average delay between deadline and post.
+        """
+        return self._total_jitter / self.posted if self.posted else 0.0
+
+    def jitter_percentile(self, percentile: float) -> float:
+        """Returns a percentile of the recent jitter values.
+
+        Args:
+            percentile (float): Percentile between 0 and 100.
+
+        Returns:
+            float: Jitter in seconds.
+        """
+
+        values = sorted(self.recent_jitter)
+        if not values:
+            return 0.0
+
+        index = round(percentile / 100 * (len(values) - 1))
+        return values[min(max(index, 0), len(values) - 1)]
+
+    def post(
+        self,
+        hwnd: int,
+        msg: int,
+        wparam: int,
+        lparam: int,
+        at: Union[float, None] = None,
+    ) -> Future:
+        """Schedules a single message.
+
+        Args:
+            hwnd (int): Window handle.
+            msg (int): Window message.
+            wparam (int): wParam of the message.
+            lparam (int): lParam of the message.
+            at (Union[float, None], optional): time.monotonic() timestamp
+                to post at. Defaults to now.
+
+        Returns:
+            Future: Resolves to the PostMessage result.
+        """
+
+        return self.post_sequence(hwnd, [(msg, wparam, lparam, 0.0)], at)
+
+    def post_sequence(
+        self,
+        hwnd: int,
+        events: Sequence[Event],
+        at: Union[float, None] = None,
+    ) -> Future:
+        """Schedules a sequence of messages, e.g. a key down and up. The
+        sequence can only be cancelled as a whole before its first event
+        was posted, so a key is never left pressed.
+
+        Args:
+            hwnd (int): Window handle.
+            events (Sequence[Event]): (msg, wParam, lParam, delay) tuples.
+                delay is the time in seconds after the previous event.
+            at (Union[float, None], optional): time.monotonic() timestamp
+                of the first event. Defaults to now.
+
+        Returns:
+            Future: Resolves to True once every event was posted
+                successfully.
+        """
+
+        sequence = _Sequence(len(events))
+        if not events:
+            sequence.future.set_result(True)
+            return sequence.future
+
+        deadline = time.perf_counter()
+        if at is not None:
+            deadline += at - time.monotonic()
+
+        with self._condition:
+            deadline = max(deadline, self._last_deadline.get(hwnd, deadline))
+
+            for msg, wparam, lparam, delay in events:
+                deadline += delay
+                heapq.heappush(self._queue, (deadline, next(self._counter),
+                                             hwnd, msg, wparam, lparam,
+                                             sequence))
+
+            self._last_deadline[hwnd] = deadline
+            self._condition.notify()
+
+        return sequence.future
+
+    def cancel(self, hwnd: Union[int, None] = None) -> int:
+        """Cancels all sequences whose first event was not posted yet.
+
+        Args:
+            hwnd (Union[int, None], optional): Only cancel sequences of
+                this window. Defaults to all windows.
+
+        Returns:
+            int: Number of cancelled sequences.
+        """
+
+        cancelled = 0
+
+        with self._condition:
+            for entry in self._queue:
+                sequence = entry[6]
+                if hwnd is not None and entry[2] != hwnd:
+                    continue
+                if not sequence.started and not sequence.cancelled:
+                    sequence.cancelled = sequence.future.cancel()
+                    cancelled += sequence.cancelled
+
+            self._queue = [entry for entry in self._queue
+                           if not entry[6].cancelled]
+            heapq.heapify(self._queue)
+
+            self._last_deadline = {}
+            for entry in self._queue:
+                self._last_deadline[entry[2]] = max(
+                    entry[0], self._last_deadline.get(entry[2], entry[0]))
+            self._condition.notify()
+
+        return cancelled
+
+    def stop(self, drain: bool = False) -> None:
+        """Stops the background thread and waits for it to finish.
+
+        Args:
+            drain (bool, optional): Post all queued events on time before
+                stopping. Otherwise sequences that did not start are
+                cancelled and started ones are finished right away.
+        """
+
+        with self._condition:
+            if drain:
+                while self._queue and self.running:
+                    self._condition.wait(0.01)
+
+            # Set under the lock, so the thread posts nothing more
+            self._stop.set()
+            remaining, self._queue = sorted(self._queue), []
+
+        super().stop()
+
+        for entry in remaining:
+            sequence = entry[6]
+            if sequence.started:
+                self._post(entry, time.perf_counter())
+            elif not sequence.cancelled:
+                sequence.cancelled = True
+                sequence.future.cancel()
+
+    def _wake(self) -> None:
+        with self._condition:
+            self._condition.notify()
+
+    def _run(self) -> None:
+        while True:
+            with self._condition:
+                while not self._stop.is_set() and not self._queue:
+                    self._condition.wait()
+
+                if self._stop.is_set():
+                    return
+
+                deadline = self._queue[0][0]
+                remaining = deadline - time.perf_counter()
+                if remaining > self.spin:
+                    self._condition.wait(remaining - self.spin)
+                    continue
+
+            # Busy wait the last part, new earlier events are picked up
+            # below since they are due as well
+            while time.perf_counter() < deadline:
+                pass
+
+            with self._condition:
+                now = time.perf_counter()
+                due = []
+                while self._queue and self._queue[0][0] <= now:
+                    due.append(heapq.heappop(self._queue))
+
+            for entry in due:
+                self._post(entry, time.perf_counter())
+
+    def _post(self, entry: tuple, now: float) -> None:
+        deadline, _, hwnd, msg, wparam, lparam, sequence = entry
+
+        if sequence.cancelled:
+            return
+
+        if not sequence.started:
+            sequence.started = True
+            if not sequence.future.set_running_or_notify_cancel():
+                sequence.cancelled = True
+                return
+
+        sequence.success &= PostMessage(hwnd, msg, wparam, lparam)
+
+        jitter = max(now - deadline, 0.0)
+        self.posted += 1
+        self.last_jitter = jitter
+        self.max_jitter = max(self.max_jitter, jitter)
+        self._total_jitter += jitter
+        self.recent_jitter.append(jitter)
+
+        sequence.remaining -= 1
+        if sequence.remaining == 0:
+            sequence.future.set_result(sequence.success)
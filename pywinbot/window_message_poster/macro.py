@@ -0,0 +1,350 @@
+import asyncio
+import time
+from collections import namedtuple
+from concurrent.futures import Future
+from typing import TYPE_CHECKING, List, Sequence, Tuple, Union
+
+from .functions import PostMessage
+from .input_scheduler import Event, InputScheduler
+from .keys import VIRTUAL_KEY_CODES as KEYS
+from .messages import (WM_CHAR, WM_KEYDOWN, WM_KEYUP, WM_LBUTTONDOWN,
+                       WM_LBUTTONUP, WM_MOUSEWHEEL, WM_RBUTTONDOWN,
+                       WM_RBUTTONUP)
+
+if TYPE_CHECKING:
+    from .window_message_poster import WindowMessagePoster
+
+PlaybackStats = namedtuple("PlaybackStats", ["events", "duration",
+                                             "average_drift", "max_drift"])
+
+_BUTTONS = {
+    "left": (WM_LBUTTONDOWN, WM_LBUTTONUP),
+    "right": (WM_RBUTTONDOWN, WM_RBUTTONUP),
+}
+
+
+class Macro:
+    def __init__(self, hold: float = 0.05):
+        """Describes a sequence of inputs. Compiling it resolves key
+        codes and click positions once, so playing it back only posts
+        precomputed messages.
+
+        Args:
+            hold (float, optional): Default seconds a key or button is held.
+
+        To use:
+        >>> macro = (Macro()
+                     .key("F1").wait(0.2)
+                     .chord("ctrl", "a")
+                     .click((100, 200))
+                     .text("gg"))
+        >>> compiled = macro.compile(wmp)
+        >>> compiled.play()
+        PlaybackStats(events=10, duration=0.45, average_drift=2e-06, ...)
+        """
+
+        self.hold = hold
+        self._steps: List[tuple] = []
+
+    def __len__(self) -> int:
+        return len(self._steps)
+
+    def key(self, key: str, hold: Union[float, None] = None) -> "Macro":
+        """Presses a key.
+
+        Args:
+            key (str): Key name, see WindowMessagePoster.key_names().
+            hold (Union[float, None], optional): Seconds the key is held.
+
+        Returns:
+            Macro: self, to chain calls.
+        """
+
+        return self.chord(key, hold=hold)
+
+    def chord(self, *keys: str, hold: Union[float, None] = None) -> "Macro":
+        """Presses several keys together and releases them in reverse
+        order.
+
+        Args:
+            keys (str): Key names.
+            hold (Union[float, None], optional): Seconds the keys are held.
+
+        Returns:
+            Macro: self, to chain calls.
+        """
+
+        for key in keys:
+            if key not in KEYS:
+                raise ValueError(f"Unknown key {key!r}")
+
+        self._steps.append(("chord", keys, self._hold(hold)))
+        return self
+
+    def click(
+        self,
+        position: tuple,
+        button: str = "left",
+        hold: Union[float, None] = None,
+    ) -> "Macro":
+        """Clicks at a position relative to the top left of the window.
+
+        Args:
+            position (tuple): (x, y) position.
+            button (str, optional): 'left' or 'right'.
+            hold (Union[float, None], optional): Seconds the button is
+                held.
+
+        Returns:
+            Macro: self, to chain calls.
+        """
+
+        if button not in _BUTTONS:
+            raise ValueError(f"Unknown button {button!r}")
+
+        self._steps.append(("click", tuple(position), button,
+                            self._hold(hold)))
+        return self
+
+    def scroll(
+        self,
+        position: tuple,
+        direction: int,
+        multiplier: int = 1,
+    ) -> "Macro":
+        """Scrolls at a position, see WindowMessagePoster.send_mouse_scroll.
+
+        Returns:
+            Macro: self, to chain calls.
+        """
+
+        self._steps.append(("scroll", tuple(position), direction,
+                            multiplier))
+        return self
+
+    def text(self, string: str) -> "Macro":
+        """Sends characters as WM_CHAR messages.
+
+        Args:
+            string (str): The characters.
+
+        Returns:
+            Macro: self, to chain calls.
+        """
+
+        self._steps.append(("text", string))
+        return self
+
+    def wait(self, seconds: float) -> "Macro":
+        """Waits before the next step.
+
+        Args:
+            seconds (float): Seconds to wait.
+
+        Returns:
+            Macro: self, to chain calls.
+        """
+
+        self._steps.append(("wait", seconds))
+        return self
+
+    def compile(self, window_message_poster: "WindowMessagePoster",
+                ) -> "CompiledMacro":
+        """Turns the steps into (msg, wParam, lParam, delay) records.
+        Click positions are converted with the window position at this
+        time, so compile again if the window moved.
+
+        Args:
+            window_message_poster (WindowMessagePoster): Target window.
+
+        Returns:
+            CompiledMacro: The compiled macro.
+        """
+
+        wmp = window_message_poster
+        records: List[Event] = []
+        delay = 0.0
+
+        def add(msg: int, wparam: int, lparam: int) -> None:
+            nonlocal delay
+            records.append((msg, wparam, lparam, delay))
+            delay = 0.0
+
+        for step in self._steps:
+            kind = step[0]
+
+            if kind == "chord":
+                _, keys, hold = step
+                for key in keys:
+                    add(WM_KEYDOWN, KEYS[key], 0)
+                delay += hold
+                for key in reversed(keys):
+                    add(WM_KEYUP, KEYS[key], 0)
+
+            elif kind == "click":
+                _, position, button, hold = step
+                down_message, up_message = _BUTTONS[button]
+                pos = wmp._get_pos_from_tuple(position)
+                add(down_message, 0, pos)
+                delay += hold
+                add(up_message, 0, pos)
+
+            elif kind == "scroll":
+                _, position, direction, multiplier = step
+                pos = wmp._get_pos_from_tuple(position)
+                add(WM_MOUSEWHEEL, int(120 * direction * multiplier) << 16,
+                    pos)
+
+            elif kind == "text":
+                for char in step[1]:
+                    add(WM_CHAR, ord(char), 0)
+
+            elif kind == "wait":
+                delay += step[1]
+
+        return CompiledMacro(wmp.hwnd, records, delay)
+
+    def _hold(self, hold: Union[float, None]) -> float:
+        return self.hold if hold is None else hold
+
+
+class CompiledMacro:
+    def __init__(
+        self,
+        hwnd: int,
+        records: Sequence[Event],
+        trailing_delay: float = 0.0,
+    ):
+        """A macro as flat (msg, wParam, lParam, delay) records, delay
+        being the seconds after the previous record. Created by
+        Macro.compile.
+
+        Args:
+            hwnd (int): Window Handle
+            records (Sequence[Event]): The records.
+            trailing_delay (float, optional): Seconds waited after the last
+                record, from a trailing Macro.wait.
+        """
+
+        self.hwnd = hwnd
+        self.records: Tuple[Event, ...] = tuple(records)
+        self.trailing_delay = trailing_delay
+
+        # Offsets from the start, so playback does not accumulate drift
+        self._offsets = []
+        offset = 0.0
+        for record in self.records:
+            offset += record[3]
+            self._offsets.append(offset)
+        self.duration = offset + trailing_delay
+
+    def __len__(self) -> int:
+        return len(self.records)
+
+    def play(self, speed: float = 1.0, spin: float = 0.002) -> PlaybackStats:
+        """Posts all records, blocking until done. Sleeps until shortly
+        before each record and busy waits the rest.
+
+        Args:
+            speed (float, optional): Playback speed, 2 is twice as fast.
+            spin (float, optional): Seconds busy waited before each record.
+
+        Returns:
+            PlaybackStats: Number of events, duration and how late the
+                events were posted on average and at most, in seconds.
+        """
+
+        hwnd = self.hwnd
+        clock = time.perf_counter
+        sleep = time.sleep
+        total_drift = 0.0
+        max_drift = 0.0
+
+        start = clock()
+        for (msg, wparam, lparam, _), offset in zip(self.records,
+                                                    self._offsets):
+            target = start + offset / speed
+
+            remaining = target - clock()
+            if remaining > spin:
+                sleep(remaining - spin)
+            now = clock()
+            while now < target:
+                now = clock()
+
+            PostMessage(hwnd, msg, wparam, lparam)
+
+            drift = now - target
+            total_drift += drift
+            max_drift = max(max_drift, drift)
+
+        end = start + self.duration / speed
+        remaining = end - clock()
+        if remaining > 0:
+            sleep(remaining)
+
+        count = len(self.records)
+        return PlaybackStats(count, clock() - start,
+                             total_drift / count if count else 0.0,
+                             max_drift)
+
+    async def play_async(self, speed: float = 1.0) -> PlaybackStats:
+        """Posts all records like play, but waits with asyncio.sleep so
+        other tasks run in between. Without the busy wait, records are
+        posted up to one event loop wakeup late.
+
+        Args:
+            speed (float, optional): Playback speed, 2 is twice as fast.
+
+        Returns:
+            PlaybackStats: Number of events, duration and how late the
+                events were posted on average and at most, in seconds.
+        """
+
+        hwnd = self.hwnd
+        clock = time.perf_counter
+        total_drift = 0.0
+        max_drift = 0.0
+
+        start = clock()
+        for (msg, wparam, lparam, _), offset in zip(self.records,
+                                                    self._offsets):
+            target = start + offset / speed
+
+            remaining = target - clock()
+            if remaining > 0:
+                await asyncio.sleep(remaining)
+
+            PostMessage(hwnd, msg, wparam, lparam)
+
+            # The loop may wake up a clock tick early
+            drift = max(clock() - target, 0.0)
+            total_drift += drift
+            max_drift = max(max_drift, drift)
+
+        remaining = start + self.duration / speed - clock()
+        if remaining > 0:
+            await asyncio.sleep(remaining)
+
+        count = len(self.records)
+        return PlaybackStats(count, clock() - start,
+                             total_drift / count if count else 0.0,
+                             max_drift)
+
+    def schedule(
+        self,
+        scheduler: InputScheduler,
+        at: Union[float, None] = None,
+    ) -> Future:
+        """Plays the macro on an InputScheduler instead of blocking.
+
+        Args:
+            scheduler (InputScheduler): The scheduler.
+            at (Union[float, None], optional): time.monotonic() timestamp
+                to start at. Defaults to now.
+
+        Returns:
+            Future: Resolves once every record was posted.
+        """
+
+        return scheduler.post_sequence(self.hwnd, self.records, at)
@@ -3,6 +3,8 @@ WM_KEYUP = 0x0101
 
 WM_CHAR = 0x0102
 
+WM_MOUSEMOVE = 0x0200
+
 WM_LBUTTONDOWN = 0x0201
 WM_LBUTTONUP = 0x0202
 
@@ -10,3 +12,6 @@ WM_RBUTTONDOWN = 0x0204
 WM_RBUTTONUP = 0x0205
 
 WM_MOUSEWHEEL = 0x020A
+
+MK_LBUTTON = 0x0001
+MK_RBUTTON = 0x0002
@@ -0,0 +1,138 @@
+import math
+from typing import List, Sequence, Tuple
+
+Point = Tuple[float, float]
+
+
+def line(start: Point, end: Point) -> List[Point]:
+    """Returns a straight path from start to end.
+
+    Args:
+        start (Point): (x, y) start.
+        end (Point): (x, y) end.
+
+    Returns:
+        List[Point]: The path as a polyline.
+    """
+    return [tuple(start), tuple(end)]
+
+
+def bezier(
+    start: Point,
+    end: Point,
+    *controls: Point,
+    segments: int = 32,
+) -> List[Point]:
+    """Returns a Bezier curve from start to end, bent towards the control
+    points.
+
+    Args:
+        start (Point): (x, y) start.
+        end (Point): (x, y) end.
+        controls (Point): Control points, one for a quadratic curve, two
+            for a cubic one, ...
+        segments (int, optional): Number of straight segments the curve is
+            approximated with.
+
+    Returns:
+        List[Point]: The path as a polyline.
+
+    To use:
+    >>> path = bezier((100, 200), (400, 220), (250, 100))
+    >>> wmp.send_mouse_path(path, duration=0.3)
+    """
+
+    points = [tuple(start), *map(tuple, controls), tuple(end)]
+    degree = len(points) - 1
+    weights = [math.comb(degree, index) for index in range(degree + 1)]
+
+    path = []
+    for segment in range(segments + 1):
+        t = segment / segments
+        x = y = 0.0
+        for index, (point_x, point_y) in enumerate(points):
+            factor = weights[index] * t**index * (1 - t)**(degree - index)
+            x += factor * point_x
+            y += factor * point_y
+        path.append((x, y))
+
+    return path
+
+
+def resample(path: Sequence[Point], count: int) -> List[Point]:
+    """Returns count points spread evenly along a polyline, by distance.
+
+    Args:
+        path (Sequence[Point]): The polyline.
+        count (int): Number of points, at least 2. The first and last
+            point of the path are always included.
+
+    Returns:
+        List[Point]: The points.
+    """
+
+    if len(path) < 2 or count < 2:
+        return [tuple(point) for point in path[-1:]]
+
+    lengths = [0.0]
+    for (x1, y1), (x2, y2) in zip(path, path[1:]):
+        lengths.append(lengths[-1] + math.hypot(x2 - x1, y2 - y1))
+
+    total = lengths[-1]
+    if total == 0:
+        return [tuple(path[-1])]
+
+    points = []
+    segment = 0
+    for index in range(count):
+        distance = total * index / (count - 1)
+        while segment < len(path) - 2 and lengths[segment + 1] < distance:
+            segment += 1
+
+        length = lengths[segment + 1] - lengths[segment]
+        t = (distance - lengths[segment]) / length if length else 0.0
+        (x1, y1), (x2, y2) = path[segment], path[segment + 1]
+        points.append((x1 + (x2 - x1) * t, y1 + (y2 - y1) * t))
+
+    return points
+
+
+def moves(
+    path: Sequence[Point],
+    duration: float,
+    rate: float = 120,
+) -> List[Tuple[float, int, int]]:
+    """Turns a path into timed mouse moves. The path is sampled rate times
+    a second, so a gesture has at most duration * rate + 1 moves no
+    matter how long the path is. Moves to the pixel of the previous move
+    are dropped, their time is added to the next move.
+
+    Args:
+        path (Sequence[Point]): The polyline, see line and bezier.
+        duration (float): Seconds the gesture takes.
+        rate (float, optional): Moves per second.
+
+    Returns:
+        List[Tuple[float, int, int]]: (delay, x, y) moves, delay being the
+            seconds after the previous move.
+    """
+
+    count = max(int(math.ceil(duration * rate)), 1) + 1
+    interval = duration / (count - 1)
+
+    result = []
+    delay = 0.0
+    previous = None
+    for index, (x, y) in enumerate(resample(path, count)):
+        pixel = (int(round(x)), int(round(y)))
+        if index:
+            delay += interval
+
+        if pixel == previous:
+            continue
+
+        result.append((delay, *pixel))
+        delay = 0.0
+        previous = pixel
+
+    return result
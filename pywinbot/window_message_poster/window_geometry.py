@@ -0,0 +1,90 @@
+import time
+from ctypes import byref
+from ctypes.wintypes import POINT, RECT
+from typing import Tuple, Union
+
+from .functions import GetWindowRect, ScreenToClient
+
+
+class WindowGeometry:
+    def __init__(
+        self,
+        hwnd: int,
+        ttl: Union[float, None] = None,
+        detect_moves: bool = False,
+    ):
+        """Caches the offset between window positions (relative to the
+        top left of the window) and client positions. Positions relative
+        to the window are turned into client positions by adding the
+        offset, without any Win32 call.
+
+        Args:
+            hwnd (int): Window Handle
+            ttl (Union[float, None], optional): Seconds after which the
+                offset is queried again. None keeps it until it is
+                invalidated.
+            detect_moves (bool, optional): If True, the window rect is
+                polled on every lookup and the offset is queried again if
+                the window moved or was resized. A lookup then costs one
+                GetWindowRect instead of GetWindowRect and ScreenToClient.
+        """
+
+        self.hwnd = hwnd
+        self.ttl = ttl
+        self.detect_moves = detect_moves
+
+        self._rect = None
+        self._offset = None
+        self._expires = 0.0
+
+        self.refreshes = 0
+
+    @property
+    def rect(self) -> Union[Tuple[int, int, int, int], None]:
+        """Returns the window rect from the last query.
+
+        Returns:
+            Union[Tuple[int, int, int, int], None]: (left, top, right,
+                bottom) or None if never queried.
+        """
+        return self._rect
+
+    def invalidate(self) -> None:
+        """Queries the offset again on the next lookup."""
+        self._offset = None
+
+    def offset(self) -> Tuple[int, int]:
+        """Returns the offset to add to window positions.
+
+        Returns:
+            Tuple[int, int]: (x, y) offset.
+        """
+
+        if self._offset is not None:
+            if self.detect_moves:
+                if self._query_rect() != self._rect:
+                    self._offset = None
+            elif self.ttl is not None and time.monotonic() >= self._expires:
+                self._offset = None
+
+        if self._offset is None:
+            self._rect = self._query_rect()
+            self._offset = self._query_offset(self._rect)
+            if self.ttl is not None:
+                self._expires = time.monotonic() + self.ttl
+
+        return self._offset
+
+    def _query_rect(self) -> Tuple[int, int, int, int]:
+        rect = RECT()
+        GetWindowRect(self.hwnd, byref(rect))
+        return rect.left, rect.top, rect.right, rect.bottom
+
+    def _query_offset(self, rect: Tuple[int, int, int, int],
+                      ) -> Tuple[int, int]:
+        self.refreshes += 1
+
+        # The top left of the window in client coordinates
+        point = POINT(rect[0], rect[1])
+        ScreenToClient(self.hwnd, byref(point))
+        return point.x, point.y
@@ -0,0 +1,153 @@
+import time
+from typing import Dict, List, Sequence, Tuple, Union
+
+from .functions import PostMessage
+from .keys import VIRTUAL_KEY_CODES as KEYS
+from .messages import (WM_CHAR, WM_KEYDOWN, WM_KEYUP, WM_LBUTTONDOWN,
+                       WM_LBUTTONUP, WM_MOUSEWHEEL, WM_RBUTTONDOWN,
+                       WM_RBUTTONUP)
+from .window_geometry import WindowGeometry
+
+
+class WindowGroup:
+    def __init__(
+        self,
+        hwnds: Sequence[int],
+        stagger: float = 0.0,
+        geometry_ttl: Union[float, None] = None,
+        detect_moves: bool = False,
+    ):
+        """Sends the same input to several windows. Down events are posted
+        to every window, then the group waits once and posts all up
+        events, so a key press takes one key press delay no matter how
+        many windows there are.
+
+        Args:
+            hwnds (Sequence[int]): Window Handles
+            stagger (float, optional): Seconds between posting to two
+                windows, so the clients do not act on the exact same tick.
+            geometry_ttl (Union[float, None], optional): Seconds after
+                which the window positions used for clicks are queried
+                again. None keeps them until invalidate_geometry is
+                called.
+            detect_moves (bool, optional): Poll the window rects on every
+                click and refresh moved windows, see WindowGeometry.
+
+        To use:
+        >>> group = WindowGroup([hwnd_1, hwnd_2, hwnd_3])
+        >>> group.send_key_press("F1")  # 50 ms for all three windows
+        [True, True, True]
+        >>> group.send_left_click((100, 200))
+        [True, True, True]
+        """
+
+        self._hwnds = list(hwnds)
+        self._key_press_delay = 0.05
+        self.stagger = stagger
+
+        self._geometries: Dict[int, WindowGeometry] = {
+            hwnd: WindowGeometry(hwnd, geometry_ttl, detect_moves)
+            for hwnd in self._hwnds
+        }
+
+    def __len__(self) -> int:
+        return len(self._hwnds)
+
+    @property
+    def hwnds(self) -> List[int]:
+        """Returns the window handles of the group.
+
+        Returns:
+            List[int]: Window Handles
+        """
+        return list(self._hwnds)
+
+    def invalidate_geometry(self) -> None:
+        """Queries all window positions again on the next click."""
+        for geometry in self._geometries.values():
+            geometry.invalidate()
+
+    def to_lparams(self, position: tuple) -> List[int]:
+        """Converts a position relative to the top left of each window to
+        a click lParam per window.
+
+        Args:
+            position (tuple): (x, y) position.
+
+        Returns:
+            List[int]: One lParam per window, in group order.
+        """
+
+        lparams = []
+        for hwnd in self._hwnds:
+            x_offset, y_offset = self._geometries[hwnd].offset()
+            lparams.append((position[0] + x_offset)
+                           | ((position[1] + y_offset) * 2**16))
+
+        return lparams
+
+    def send_key_press(self, key: str) -> List[bool]:
+        assert key in KEYS
+
+        code = KEYS[key]
+        return self._press([(WM_KEYDOWN, code, 0)] * len(self._hwnds),
+                           [(WM_KEYUP, code, 0)] * len(self._hwnds))
+
+    def send_enter(self) -> List[bool]:
+        return self.send_key_press("enter")
+
+    def send_char(self, char: str) -> List[bool]:
+        return self._post_all([(WM_CHAR, ord(char), 0)] * len(self._hwnds))
+
+    def send_string(self, string: str) -> List[bool]:
+        results = [True] * len(self._hwnds)
+        for char in string:
+            results = [a and b for a, b in zip(results,
+                                               self.send_char(char))]
+
+        return results
+
+    def send_left_click(self, position: tuple) -> List[bool]:
+        return self._click(WM_LBUTTONDOWN, WM_LBUTTONUP, position)
+
+    def send_right_click(self, position: tuple) -> List[bool]:
+        return self._click(WM_RBUTTONDOWN, WM_RBUTTONUP, position)
+
+    def send_mouse_scroll(
+        self,
+        position: tuple,
+        direction: int,
+        multiplier: int = 1
+    ) -> List[bool]:
+        """Sends a mouse scroll event to every window, see
+        WindowMessagePoster.send_mouse_scroll.
+        """
+
+        wparam = int(120 * direction * multiplier) << 16
+        return self._post_all([(WM_MOUSEWHEEL, wparam, lparam)
+                               for lparam in self.to_lparams(position)])
+
+    def _click(self, down_message: int, up_message: int,
+               position: tuple) -> List[bool]:
+        lparams = self.to_lparams(position)
+        return self._press([(down_message, 0, lparam) for lparam in lparams],
+                           [(up_message, 0, lparam) for lparam in lparams])
+
+    def _press(
+        self,
+        down: List[Tuple[int, int, int]],
+        up: List[Tuple[int, int, int]],
+    ) -> List[bool]:
+        results = self._post_all(down)
+        time.sleep(self._key_press_delay)
+        return [a and b for a, b in zip(results, self._post_all(up))]
+
+    def _post_all(self, messages: List[Tuple[int, int, int]]) -> List[bool]:
+        results = []
+        for index, (hwnd, (msg, wparam, lparam)) in enumerate(
+                zip(self._hwnds, messages)):
+            if self.stagger and index:
+                time.sleep(self.stagger)
+            results.append(PostMessage(hwnd, msg, wparam, lparam))
+
+        return results
@@ -1,15 +1,20 @@
 import time
 from ctypes import byref
 from ctypes.wintypes import POINT, RECT
-from typing import List, Union
+from concurrent.futures import Future
+from typing import List, Sequence, Union
 
 from ..memory_reader.helpers import get_process_id
 from .functions import (GetForegroundWindow, GetWindowRect, PostMessage,
                         ScreenToClient)
+from .input_scheduler import Event, InputScheduler
+from .window_geometry import WindowGeometry
 from .keys import VIRTUAL_KEY_CODES as KEYS
-from .messages import (WM_CHAR, WM_KEYDOWN, WM_KEYUP, WM_LBUTTONDOWN,
-                       WM_LBUTTONUP, WM_MOUSEWHEEL, WM_RBUTTONDOWN,
-                       WM_RBUTTONUP)
+from .macro import _BUTTONS, CompiledMacro, PlaybackStats
+from .messages import (MK_LBUTTON, MK_RBUTTON, WM_CHAR, WM_KEYDOWN, WM_KEYUP,
+                       WM_LBUTTONDOWN, WM_LBUTTONUP, WM_MOUSEMOVE,
+                       WM_MOUSEWHEEL, WM_RBUTTONDOWN, WM_RBUTTONUP)
+from .mouse_path import line, moves
 
 
 class WindowMessagePoster:
@@ -23,6 +28,8 @@ class WindowMessagePoster:
         self._hwnd = hwnd
         self._ignore_focus = False
         self._key_press_delay = 0.05
+        self._scheduler = None
+        self._geometry = None
 
     @property
     def hwnd(self) -> int:
@@ -80,8 +87,9 @@ class WindowMessagePoster:
         """
         return list(KEYS.keys())
 
-    @staticmethod
+    @classmethod
     def by_window(
+        cls,
         window_class: Union[str, None] = None,
         window_title: Union[str, None] = None,
     ) -> "WindowMessagePoster":
@@ -94,12 +102,91 @@ class WindowMessagePoster:
         _, hwnd = get_process_id(window_class,
                                  window_title)
 
-        return WindowMessagePoster(hwnd)
+        return cls(hwnd)
 
     def set_ignore_focus(self, ignore_focus: bool) -> None:
         self._ignore_focus = ignore_focus
 
+    def set_scheduler(self, scheduler: Union[InputScheduler, None]) -> None:
+        """Hands all following events to an InputScheduler. The send_*
+        methods then return right away with a Future instead of blocking.
+        Pass None to post directly again.
+
+        Args:
+            scheduler (Union[InputScheduler, None]): The scheduler to use.
+        """
+        self._scheduler = scheduler
+
+    def enable_geometry_cache(
+        self,
+        ttl: Union[float, None] = None,
+        detect_moves: bool = False,
+    ) -> WindowGeometry:
+        """Caches the window position used to convert click and scroll
+        positions, so they do not cost a GetWindowRect and ScreenToClient
+        call each.
+
+        Args:
+            ttl (Union[float, None], optional): Seconds after which the
+                position is queried again. None keeps it until
+                invalidate_geometry_cache is called.
+            detect_moves (bool, optional): If True, only GetWindowRect is
+                called per position and the cache is refreshed when the
+                window moved or was resized.
+
+        Returns:
+            WindowGeometry: The cache, to look at its refreshes.
+
+        To use:
+        >>> wmp = WindowMessagePoster(hwnd)
+        >>> geometry = wmp.enable_geometry_cache(ttl=1)
+        >>> wmp.send_left_click((100, 200))
+        >>> wmp.send_left_click((120, 200))
+        >>> geometry.refreshes
+        1
+        """
+
+        self._geometry = WindowGeometry(self.hwnd, ttl, detect_moves)
+        return self._geometry
+
+    def disable_geometry_cache(self) -> None:
+        """Disables and drops the geometry cache."""
+        self._geometry = None
+
+    def invalidate_geometry_cache(self) -> None:
+        """Queries the window position again on the next click, e.g. after
+        moving the window."""
+        if self._geometry is not None:
+            self._geometry.invalidate()
+
+    def to_lparams(self, positions: Sequence[tuple]) -> List[int]:
+        """Converts many positions relative to the top left of the window
+        to click lParams, querying the window position at most once.
+
+        Args:
+            positions (Sequence[tuple]): (x, y) positions.
+
+        Returns:
+            List[int]: The lParams.
+        """
+
+        if self._geometry is not None:
+            x_offset, y_offset = self._geometry.offset()
+        else:
+            x_offset, y_offset = WindowGeometry(self.hwnd).offset()
+
+        return [(x + x_offset) | ((y + y_offset) * 2**16)
+                for x, y in positions]
+
+    def _schedule(self, events: Sequence[Event]) -> Future:
+        return self._scheduler.post_sequence(self.hwnd, events)
+
     def _get_pos_from_tuple(self, position: tuple):
+        if self._geometry is not None:
+            x_offset, y_offset = self._geometry.offset()
+            return ((position[0] + x_offset)
+                    | ((position[1] + y_offset) * 2**16))
+
         rect = self.window_rect
 
         # Adjust point to window client area
@@ -116,7 +203,7 @@ class WindowMessagePoster:
     def _keyup(self, key: str) -> None:
         PostMessage(self.hwnd, WM_KEYUP, KEYS[key], 0)
 
-    def _click(self, click_type: str, position: tuple):
+    def _click_messages(self, click_type: str, position: tuple) -> tuple:
         if click_type == "left":
             down_message = WM_LBUTTONDOWN
             up_message = WM_LBUTTONUP
@@ -124,35 +211,58 @@ class WindowMessagePoster:
             down_message = WM_RBUTTONDOWN
             up_message = WM_RBUTTONUP
 
-        pos = self._get_pos_from_tuple(position)
+        return down_message, up_message, self._get_pos_from_tuple(position)
+
+    def _click(self, click_type: str, position: tuple):
+        down_message, up_message, pos = self._click_messages(click_type,
+                                                             position)
+
+        if self._scheduler is not None:
+            return self._schedule([
+                (down_message, 0, pos, 0.0),
+                (up_message, 0, pos, self._key_press_delay),
+            ])
 
         # Post message
         PostMessage(self.hwnd, down_message, 0, pos)
         time.sleep(self._key_press_delay)
         PostMessage(self.hwnd, up_message, 0, pos)
 
-    def send_key_press(self, key: str) -> None:
-        assert key in WindowMessagePoster.key_names()
+    def send_key_press(self, key: str) -> Union[Future, None]:
+        assert key in KEYS
+
+        if self._scheduler is not None:
+            return self._schedule([
+                (WM_KEYDOWN, KEYS[key], 0, 0.0),
+                (WM_KEYUP, KEYS[key], 0, self._key_press_delay),
+            ])
 
         self._keydown(key)
         time.sleep(self._key_press_delay)
         self._keyup(key)
 
-    def send_enter(self) -> None:
-        self.send_key_press("enter")
+    def send_enter(self) -> Union[Future, None]:
+        return self.send_key_press("enter")
+
+    def send_char(self, char: str) -> Union[Future, None]:
+        if self._scheduler is not None:
+            return self._schedule([(WM_CHAR, ord(char), 0, 0.0)])
 
-    def send_char(self, char: str) -> None:
         PostMessage(self.hwnd, WM_CHAR, ord(char), 0)
 
-    def send_string(self, string: str) -> None:
+    def send_string(self, string: str) -> Union[Future, None]:
+        if self._scheduler is not None:
+            return self._schedule([(WM_CHAR, ord(char), 0, 0.0)
+                                   for char in string])
+
         for char in string:
             self.send_char(char)
 
-    def send_left_click(self, position: tuple) -> None:
-        self._click("left", position)
+    def send_left_click(self, position: tuple) -> Union[Future, None]:
+        return self._click("left", position)
 
-    def send_right_click(self, position: tuple) -> None:
-        self._click("right", position)
+    def send_right_click(self, position: tuple) -> Union[Future, None]:
+        return self._click("right", position)
 
     def send_mouse_scroll(
         self,
@@ -173,5 +283,155 @@ class WindowMessagePoster:
         delta = (120 * direction) * multiplier
         lParam = delta << 16
 
+        if self._scheduler is not None:
+            return self._schedule([(WM_MOUSEWHEEL, lParam, pos, 0.0)])
+
         # Post message
         PostMessage(self.hwnd, WM_MOUSEWHEEL, lParam, pos)
+
+    def send_mouse_move(
+        self,
+        position: tuple,
+        button: Union[str, None] = None,
+    ) -> Union[Future, None]:
+        """Moves the mouse to a position.
+
+        Args:
+            position (tuple): Position relative to the top left of the
+                window.
+            button (Union[str, None], optional): 'left' or 'right' if the
+                button is held during the move.
+        """
+
+        wparam = _BUTTON_FLAGS[button]
+        pos = self._get_pos_from_tuple(position)
+
+        if self._scheduler is not None:
+            return self._schedule([(WM_MOUSEMOVE, wparam, pos, 0.0)])
+
+        PostMessage(self.hwnd, WM_MOUSEMOVE, wparam, pos)
+
+    def send_mouse_path(
+        self,
+        path: Sequence[tuple],
+        duration: float = 0.2,
+        rate: float = 120,
+        button: Union[str, None] = None,
+    ) -> Union[Future, PlaybackStats]:
+        """Moves the mouse along a path, see mouse_path.line and
+        mouse_path.bezier. At most duration * rate + 1 moves are posted,
+        moves to the same pixel as the one before are left out.
+
+        Args:
+            path (Sequence[tuple]): Positions relative to the top left of
+                the window, connected by straight lines.
+            duration (float, optional): Seconds the move takes.
+            rate (float, optional): Moves per second.
+            button (Union[str, None], optional): 'left' or 'right' if the
+                button is held during the move.
+
+        Returns:
+            Union[Future, PlaybackStats]: The number of messages and their
+                timing, or a Future if a scheduler is set.
+
+        To use:
+        >>> wmp.send_mouse_path(bezier((100, 200), (400, 220), (250, 100)),
+                                duration=0.3)
+        PlaybackStats(events=37, duration=0.3, ...)
+        """
+
+        return self._post_gesture(*self._move_records(path, duration, rate,
+                                                      button))
+
+    def send_drag(
+        self,
+        start: tuple,
+        end: tuple,
+        duration: float = 0.2,
+        rate: float = 120,
+        button: str = "left",
+        path: Union[Sequence[tuple], None] = None,
+    ) -> Union[Future, PlaybackStats]:
+        """Presses a mouse button at start, moves to end and releases it.
+
+        Args:
+            start (tuple): Position to press the button at.
+            end (tuple): Position to release the button at.
+            duration (float, optional): Seconds the move takes.
+            rate (float, optional): Moves per second.
+            button (str, optional): 'left' or 'right'.
+            path (Union[Sequence[tuple], None], optional): Path from start
+                to end. Defaults to a straight line.
+
+        Returns:
+            Union[Future, PlaybackStats]: The number of messages and their
+                timing, or a Future if a scheduler is set.
+
+        To use:
+        >>> wmp.send_drag((100, 200), (300, 200), duration=0.25)
+        """
+
+        return self._post_gesture(self._drag_records(start, end, duration,
+                                                     rate, button, path))
+
+    def _drag_records(
+        self,
+        start: tuple,
+        end: tuple,
+        duration: float,
+        rate: float,
+        button: str,
+        path: Union[Sequence[tuple], None],
+    ) -> list:
+        down_message, up_message = _BUTTONS[button]
+        path = path or line(start, end)
+        records, trailing_delay = self._move_records(path, duration, rate,
+                                                     button)
+
+        # Press at the first move and release after the last one, at the
+        # lParams of the moves so the window is looked up only once
+        _, wparam, start_pos, _ = records[0]
+        _, _, end_pos, _ = records[-1]
+        records.insert(0, (down_message, wparam, start_pos, 0.0))
+        records.append((up_message, 0, end_pos,
+                        trailing_delay + self._key_press_delay))
+
+        return records
+
+    def _move_records(
+        self,
+        path: Sequence[tuple],
+        duration: float,
+        rate: float,
+        button: Union[str, None],
+    ) -> tuple:
+        timed = moves(path, duration, rate)
+
+        # One geometry lookup for the whole gesture
+        lparams = self.to_lparams([(x, y) for _, x, y in timed])
+        wparam = _BUTTON_FLAGS[button]
+
+        records = [(WM_MOUSEMOVE, wparam, lparam, delay)
+                   for (delay, _, _), lparam in zip(timed, lparams)]
+
+        # Time of the moves left out at the end of the path
+        trailing_delay = max(duration - sum(delay for delay, _, _ in timed),
+                             0.0)
+        return records, trailing_delay
+
+    def _post_gesture(
+        self,
+        records: list,
+        trailing_delay: float = 0.0,
+    ) -> Union[Future, PlaybackStats]:
+        if self._scheduler is not None:
+            return self._schedule(records)
+
+        return CompiledMacro(self.hwnd, records, trailing_delay).play()
+
+
+_BUTTON_FLAGS = {
+    None: 0,
+    "left": MK_LBUTTON,
+    "right": MK_RBUTTON,
+}
@@ -0,0 +1,23 @@
+import pytest
+
+from fake_process import FakeProcess
+from pywinbot import MemoryReader
+from pywinbot.backend import FakeBackend, WindllBackend, set_backend
+from pywinbot.memory_reader.module_map import ModuleMap
+
+
+@pytest.fixture
+def process():
+    process = FakeProcess()
+    process.add_module("game.exe", 0x400000, 0x1000)
+    set_backend(FakeBackend(process.functions()))
+
+    yield process
+
+    set_backend(WindllBackend())
+    ModuleMap.clear_cache()
+
+
+@pytest.fixture
+def memory_reader(process):
+    return MemoryReader("game.exe", window_class="Game")
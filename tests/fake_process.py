@@ -0,0 +1,231 @@
+import ctypes
+import time
+from bisect import bisect_right
+from collections import Counter
+from typing import Callable, Dict, List, Tuple
+
+from pywinbot.memory_reader.flags import (MEM_COMMIT, MEM_FREE, MEM_PRIVATE,
+                                          PAGE_NOACCESS, PAGE_READWRITE)
+
+PID = 1234
+HWND = 42
+HANDLE = 99
+
+
+def _value(pointer):
+    # byref() objects hold the ctypes instance they point to in _obj
+    return getattr(pointer, "_obj", pointer)
+
+
+def _int(address) -> int:
+    return getattr(address, "value", address) or 0
+
+
+class FakeProcess:
+    def __init__(self, pointer_size: int = 8):
+        """A simulated process and window for FakeBackend. Memory is a set
+        of mapped bytearrays, posted window messages are recorded in
+        messages and every Win32 call is counted in calls.
+
+        Args:
+            pointer_size (int, optional): 4 to look like a 32-bit process.
+
+        To use:
+        >>> process = FakeProcess()
+        >>> process.map(0x10000, bytes(0x1000))
+        >>> set_backend(FakeBackend(process.functions()))
+        >>> mr = MemoryReader("game.exe", window_class="Game")
+        """
+
+        self.pointer_size = pointer_size
+        self.calls = Counter()
+
+        self._starts: List[int] = []
+        self._memory: Dict[int, bytearray] = {}
+        self._protect: Dict[int, int] = {}
+        self.modules: List[Tuple[str, int, int, str]] = []
+
+        self._module_index = 0
+        # FILETIME of the process start, change it to simulate a new
+        # process with the same PID
+        self.creation_time = 133000000000000000
+
+        # (hwnd, msg, wparam, lparam, time.perf_counter())
+        self.messages: List[Tuple[int, int, int, int, float]] = []
+        # Screen coordinates of the window and of its client area
+        self.window_rect = (100, 50, 900, 650)
+        self.client_origin = (108, 81)
+
+    def map(self, start: int, data: bytes,
+            protect: int = PAGE_READWRITE) -> None:
+        """Maps memory at start. Ranges must not overlap."""
+
+        if start not in self._memory:
+            self._starts.insert(bisect_right(self._starts, start), start)
+        self._memory[start] = bytearray(data)
+        self._protect[start] = protect
+
+    def write(self, address: int, data: bytes) -> None:
+        """Writes into mapped memory, ignoring its protection."""
+
+        index = bisect_right(self._starts, address) - 1
+        start = self._starts[index]
+        self._memory[start][address - start:address - start + len(data)] = \
+            data
+
+    def add_module(self, name: str, base: int, size: int) -> None:
+        """Maps a zeroed module."""
+
+        self.map(base, bytes(size))
+        self.modules.append((name, base, size, "C:\\" + name))
+
+    def _find(self, address: int, size: int):
+        index = bisect_right(self._starts, address) - 1
+        if index < 0:
+            return None, None
+
+        start = self._starts[index]
+        memory = self._memory[start]
+        if (address + size > start + len(memory)
+                or self._protect[start] == PAGE_NOACCESS):
+            return None, None
+
+        return start, memory
+
+    def functions(self) -> Dict[str, Callable]:
+        """Returns the Win32 functions of the process for FakeBackend."""
+
+        return {
+            "FindWindowA": self._call("FindWindowA", lambda *args: HWND),
+            "GetWindowThreadProcessId": self._call(
+                "GetWindowThreadProcessId", self._get_window_thread),
+            "OpenProcess": self._call("OpenProcess", lambda *args: HANDLE),
+            "CloseHandle": self._call("CloseHandle", lambda handle: 1),
+            "IsWow64Process": self._call("IsWow64Process", self._is_wow64),
+            "GetProcessTimes": self._call("GetProcessTimes",
+                                          self._get_process_times),
+            "ReadProcessMemory": self._call("ReadProcessMemory",
+                                            self._read),
+            "WriteProcessMemory": self._call("WriteProcessMemory",
+                                             self._write),
+            "VirtualQueryEx": self._call("VirtualQueryEx",
+                                         self._virtual_query),
+            "CreateToolhelp32Snapshot": self._call(
+                "CreateToolhelp32Snapshot", lambda *args: HANDLE + 1),
+            "Module32First": self._call("Module32First",
+                                        self._module_first),
+            "Module32Next": self._call("Module32Next", self._module_next),
+            "EnumProcessModulesEx": self._call("EnumProcessModulesEx",
+                                               self._enum_modules),
+            "PostMessageA": self._call("PostMessageA", self._post_message),
+            "GetWindowRect": self._call("GetWindowRect",
+                                        self._get_window_rect),
+            "ScreenToClient": self._call("ScreenToClient",
+                                         self._screen_to_client),
+            "GetForegroundWindow": self._call("GetForegroundWindow",
+                                              lambda: HWND),
+        }
+
+    def _call(self, name: str, function: Callable) -> Callable:
+        def counted(*args):
+            self.calls[name] += 1
+            return function(*args)
+
+        return counted
+
+    def _get_window_thread(self, hwnd, pid) -> int:
+        _value(pid).value = PID
+        return 1
+
+    def _is_wow64(self, handle, wow64) -> int:
+        _value(wow64).value = self.pointer_size == 4
+        return 1
+
+    def _get_process_times(self, handle, creation, exit_time, kernel_time,
+                           user_time) -> int:
+        creation = _value(creation)
+        creation.dwLowDateTime = self.creation_time & 0xFFFFFFFF
+        creation.dwHighDateTime = self.creation_time >> 32
+        return 1
+
+    def _read(self, handle, address, buffer, size, read) -> int:
+        address = _int(address)
+        start, memory = self._find(address, size)
+        if memory is None:
+            return 0
+
+        # Copies without a temporary bytes object, so tests can measure
+        # the allocations of the reader alone
+        source = (ctypes.c_char * size).from_buffer(memory, address - start)
+        ctypes.memmove(buffer, source, size)
+        return 1
+
+    def _write(self, handle, address, buffer, size, written) -> int:
+        address = _int(address)
+        start, memory = self._find(address, size)
+        if memory is None:
+            return 0
+
+        offset = address - start
+        memory[offset:offset + size] = ctypes.string_at(buffer, size)
+        return 1
+
+    def _virtual_query(self, handle, address, mbi, length) -> int:
+        mbi = _value(mbi)
+        address = _int(address)
+
+        previous_end = 0
+        for start in self._starts:
+            end = start + len(self._memory[start])
+            if address < start:
+                mbi.BaseAddress = previous_end
+                mbi.RegionSize = start - previous_end
+                mbi.State, mbi.Protect, mbi.Type = MEM_FREE, PAGE_NOACCESS, 0
+                return length
+            if address < end:
+                mbi.BaseAddress, mbi.RegionSize = start, end - start
+                mbi.State, mbi.Protect = MEM_COMMIT, self._protect[start]
+                mbi.Type = MEM_PRIVATE
+                return length
+            previous_end = end
+
+        return 0
+
+    def _module_first(self, snapshot, entry) -> int:
+        self._module_index = 0
+        return self._module_next(snapshot, entry)
+
+    def _module_next(self, snapshot, entry) -> int:
+        if self._module_index >= len(self.modules):
+            return 0
+
+        entry = _value(entry)
+        name, base, size, path = self.modules[self._module_index]
+        entry.szModule = name.encode()
+        entry.szExePath = path.encode()
+        entry.modBaseSize = size
+        entry.modBaseAddr = ctypes.cast(ctypes.c_void_p(base),
+                                        type(entry.modBaseAddr))
+
+        self._module_index += 1
+        return 1
+
+    def _enum_modules(self, handle, modules, size, needed, flag) -> int:
+        _value(needed).value = (len(self.modules)
+                                * ctypes.sizeof(ctypes.c_void_p))
+        return 1
+
+    def _post_message(self, hwnd, msg, wparam, lparam) -> int:
+        self.messages.append((hwnd, msg, wparam, lparam, time.perf_counter()))
+        return 1
+
+    def _get_window_rect(self, hwnd, rect) -> int:
+        rect = _value(rect)
+        rect.left, rect.top, rect.right, rect.bottom = self.window_rect
+        return 1
+
+    def _screen_to_client(self, hwnd, point) -> int:
+        point = _value(point)
+        point.x -= self.client_origin[0]
+        point.y -= self.client_origin[1]
+        return 1
@@ -0,0 +1,61 @@
+import pickle
+
+import pytest
+
+from pywinbot import Address
+
+
+def test_calculations():
+    addr = Address("10BC4AF0")
+
+    assert addr + 4 == 0x10BC4AF4
+    assert addr + "A" == 0x10BC4AFA
+    assert 4 + addr == 0x10BC4AF4
+    assert addr + Address("10BA0170") == 0x21764C60
+    assert addr - 0x10 == Address(0x10BC4AE0)
+    assert addr * 2 == 0x217895E0
+
+    for result in (addr + 4, 4 + addr, addr - "F0", addr * 2):
+        assert type(result) is Address
+
+    # The distance of two addresses is a plain number
+    distance = Address(0x1010) - Address(0x1000)
+    assert distance == 0x10 and type(distance) is int
+
+
+def test_string_representation():
+    addr = Address("10BC4AF0")
+
+    assert addr.address_string == "10BC4AF0"
+    assert addr.address_decimal == 280775408
+    assert repr(addr) == "<Address hex=10BC4AF0 decimal=280775408>"
+    assert pickle.loads(pickle.dumps(addr)).address_string == "10BC4AF0"
+
+    assert (addr + 4).address_string == "0x10bc4af4"
+    assert Address(0x10).address_string == "0x10"
+
+
+def test_addresses_are_ints():
+    assert Address("FF") == 0xFF
+    assert {Address("FF"): 1}[0xFF] == 1
+    assert sorted([Address(3), Address("1")]) == [1, 3]
+    assert f"{Address(255):X}" == "FF"
+
+
+def test_address_array():
+    np = pytest.importorskip("numpy")
+    from pywinbot import AddressArray
+
+    entities = AddressArray([Address(0x1000), 0x2000, np.uint64(0x3000)])
+
+    assert len(entities) == 3
+    assert entities[1] == 0x2000 and type(entities[1]) is Address
+    assert list(entities + "1A0") == [0x11A0, 0x21A0, 0x31A0]
+    assert list(entities - 0x10) == [0xFF0, 0x1FF0, 0x2FF0]
+
+    grid = entities.values[:, None] + np.array([0x10, 0x14], dtype=np.uint64)
+    assert AddressArray(grid)[2, 1] == 0x3014
+
+    assert (entities + [0, 4, 8]).requests("i") == [
+        (0x1000, "i"), (0x2004, "i"), (0x3008, "i")]
+    assert entities[:1].requests("str", 16) == [(0x1000, "str", 16)]
@@ -0,0 +1,61 @@
+import asyncio
+import struct
+
+import pytest
+
+from pywinbot import Address, AsyncMemoryReader
+
+
+def gather(memory_reader, *requests):
+    async def main():
+        reader = AsyncMemoryReader(memory_reader)
+        try:
+            return await asyncio.gather(
+                *(reader.read(*request) for request in requests),
+                return_exceptions=True)
+        finally:
+            reader.close()
+
+    return asyncio.run(main())
+
+
+def test_reads_of_one_iteration_are_batched(process, memory_reader):
+    process.map(0x10000, struct.pack("<iid", 1, 2, 0.5))
+    process.calls.clear()
+
+    values = gather(memory_reader,
+                    (Address(0x10000), "i", 4),
+                    (Address(0x10004), "i", 4),
+                    (Address(0x10008), "d", 8))
+
+    assert values == [1, 2, 0.5]
+    assert process.calls["ReadProcessMemory"] == 1
+
+
+def test_invalid_request_fails_only_itself(process, memory_reader):
+    process.map(0x10000, struct.pack("<ii", 1, 2))
+
+    values = gather(memory_reader,
+                    (Address(0x10000), "i", 4),
+                    (Address(0x10000), "z", 4),
+                    (Address(0x10000), "q", 4),
+                    (Address(0x10004), "i", 4))
+
+    assert values[0] == 1 and values[3] == 2
+    assert isinstance(values[1], struct.error)
+    # Too small for the type, like MemoryReader.read
+    assert isinstance(values[2], struct.error)
+    with pytest.raises(struct.error):
+        memory_reader.read(Address(0x10000), "q", 4)
+
+
+def test_failing_batch_falls_back_to_single_reads(process, memory_reader):
+    process.map(0x10000, struct.pack("<ii", 1, 2))
+
+    # A plain int has no address_decimal, read_many raises for the batch
+    values = gather(memory_reader,
+                    (Address(0x10000), "i", 4),
+                    (0x10004, "i", 4))
+
+    assert values[0] == 1
+    assert isinstance(values[1], AttributeError)
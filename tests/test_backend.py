@@ -0,0 +1,55 @@
+import sys
+
+import pytest
+
+from pywinbot.backend import (FakeBackend, WindllBackend, WinFunction,
+                              get_backend, set_backend)
+
+
+class CountingBackend(FakeBackend):
+    def __init__(self, functions):
+        super().__init__(functions)
+        self.loads = 0
+
+    def load(self, function):
+        self.loads += 1
+        return super().load(function)
+
+
+@pytest.fixture
+def restore_backend():
+    yield
+    set_backend(WindllBackend())
+
+
+def test_functions_are_loaded_once_per_backend(restore_backend):
+    add = WinFunction("kernel32", "TestAdd", [], None)
+
+    first = CountingBackend({"TestAdd": lambda a, b: a + b})
+    set_backend(first)
+    assert get_backend() is first
+
+    assert add(1, 2) == 3
+    assert add(3, 4) == 7
+    assert first.loads == 1
+
+    second = CountingBackend({"TestAdd": lambda a, b: a - b})
+    set_backend(second)
+    assert add(3, 4) == -1
+    assert second.loads == 1
+
+
+def test_missing_fake_function(restore_backend):
+    set_backend(FakeBackend({}))
+
+    with pytest.raises(NotImplementedError, match="kernel32.TestMissing"):
+        WinFunction("kernel32", "TestMissing", [], None)()
+
+
+@pytest.mark.skipif(sys.platform == "win32", reason="windll is available")
+def test_windll_backend_fails_only_when_called():
+    # Importing the bindings does not need windll
+    from pywinbot.memory_reader.functions import ReadProcessMemory
+
+    with pytest.raises(OSError, match="set_backend"):
+        ReadProcessMemory(0, 0, None, 0, None)
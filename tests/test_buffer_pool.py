@@ -0,0 +1,45 @@
+import struct
+import tracemalloc
+
+import pytest
+
+from pywinbot import Address
+
+
+def test_reads_do_not_allocate_buffers(process, memory_reader):
+    process.map(0x10000, struct.pack("<i", 5) + bytes(0x10000))
+    address = Address(0x10000)
+
+    # A large buffer_size, so a new buffer per read would show in the peak
+    size = 0x8000
+    assert memory_reader.read(address, "i", size) == 5
+
+    reads = 1000
+    tracemalloc.start()
+    try:
+        before, _ = tracemalloc.get_traced_memory()
+        for _ in range(reads):
+            memory_reader.read(address, "i", size)
+        after, peak = tracemalloc.get_traced_memory()
+    finally:
+        tracemalloc.stop()
+
+    assert peak - before < size // 4
+    assert (after - before) / reads < 1
+
+
+def test_pooled_buffer_is_not_unpacked_past_buffer_size(process,
+                                                        memory_reader):
+    process.map(0x10000, bytes(range(16)))
+    address = Address(0x10000)
+
+    memory_reader.read(address, "Q", 8)
+    with pytest.raises(struct.error):
+        memory_reader.read(address, "Q", 4)
+
+
+def test_write_does_not_fit_buffer_size(process, memory_reader):
+    process.map(0x10000, bytes(8))
+
+    with pytest.raises(ValueError):
+        memory_reader.write(Address(0x10000), 5, 2)
@@ -0,0 +1,76 @@
+import struct
+
+import pytest
+
+from pywinbot import Address, DumpReader
+from pywinbot.memory_reader.flags import PAGE_NOACCESS
+
+GAME = 0x400000
+HEAP = 0x10000
+
+
+@pytest.fixture
+def dump_path(process, memory_reader, tmp_path):
+    process.map(HEAP, bytes(0x2000))
+    process.map(HEAP + 0x2000, bytes(0x1000), protect=PAGE_NOACCESS)
+    process.map(HEAP + 0x3000, bytes(0x1000))
+
+    process.write(GAME + 0x100, struct.pack("<Q", HEAP + 0x800))
+    process.write(HEAP + 0x840, struct.pack("<id", 250, 1.5))
+    process.write(HEAP + 0xFFC, struct.pack("<q", -2))
+    process.write(HEAP + 0x3000, b"Hello\0")
+
+    path = tmp_path / "game.dump"
+    assert memory_reader.dump(str(path)) == 0x4000
+    return str(path)
+
+
+def test_round_trip(memory_reader, dump_path):
+    with DumpReader(dump_path) as dump:
+        assert dump.pointer_size == 8
+        assert dump.modules.get("game.exe").base == GAME
+
+        chain = ("game.exe+100", ["40"])
+        addr = dump.get_final_pointer(*chain)
+        assert addr == memory_reader.get_final_pointer(*chain) == HEAP + 0x840
+        assert dump.resolve_pointers([chain, ("100", ["40"])]) == [addr] * 2
+
+        requests = [(addr, "i"), (addr + 4, "d"),
+                    (Address(HEAP + 0x3000), "str", 16),
+                    (Address(HEAP + 0x2000), "i")]
+        assert dump.read_many(requests) == [250, 1.5, "Hello", None]
+        assert dump.read_many(requests) == memory_reader.read_many(requests)
+
+        buffer = bytearray(8)
+        assert dump.read_into(addr, buffer)
+        assert struct.unpack("<ii", buffer)[0] == 250
+        assert not dump.read_into(Address(HEAP + 0x2FFC), buffer)
+
+        assert [(region.start, region.size) for region in dump.regions()] \
+            == [(HEAP, 0x2000), (HEAP + 0x3000, 0x1000), (GAME, 0x1000)]
+
+
+def test_reads_across_adjacent_ranges(memory_reader, dump_path, tmp_path):
+    # Dumped as separate ranges and in small chunks
+    path = str(tmp_path / "heap.dump")
+    memory_reader.dump(path, [(HEAP, 0x1000), (HEAP + 0x1000, 0x1000)],
+                       chunk_size=0x400)
+
+    with DumpReader(path) as dump:
+        assert dump.read(Address(HEAP + 0xFFC), "q", 8) == -2
+        assert len(dump.regions()) == 1
+
+
+def test_buffer_size_has_to_fit_the_type(dump_path):
+    with DumpReader(dump_path) as dump:
+        with pytest.raises(struct.error):
+            dump.read(Address(HEAP + 0x840), "d", 4)
+
+
+@pytest.mark.parametrize("data", [b"", b"PWBDUMP", b"NOTADUMP" + bytes(64)])
+def test_invalid_files(tmp_path, data):
+    path = tmp_path / "invalid.dump"
+    path.write_bytes(data)
+
+    with pytest.raises(ValueError, match="is not a dump file"):
+        DumpReader(str(path))
@@ -0,0 +1,25 @@
+import struct
+import time
+
+from pywinbot import Address, FreezeEngine
+
+
+def test_drifted_values_are_written_back(process, memory_reader):
+    process.map(0x10000, struct.pack("<ii", 100, 5))
+    engine = FreezeEngine(memory_reader, interval=0.01)
+    engine.lock(Address(0x10000), "i", 100, name="health")
+
+    assert engine.tick() == 0
+
+    process.write(0x10000, struct.pack("<i", 42))
+    with engine:
+        assert engine.running
+        deadline = time.monotonic() + 1
+        while (engine.write_counts["health"] == 0
+               and time.monotonic() < deadline):
+            time.sleep(0.01)
+
+    assert not engine.running
+    assert memory_reader.read(Address(0x10000), "i", 4) == 100
+    assert engine.write_counts["health"] == 1
+    assert engine.ticks >= 2
@@ -0,0 +1,51 @@
+import asyncio
+import time
+
+from fake_process import HWND
+from pywinbot import (AsyncWindowMessagePoster, InputScheduler,
+                      WindowMessagePoster)
+from pywinbot.window_message_poster.messages import WM_KEYDOWN, WM_KEYUP
+
+
+def test_sequence_delays_are_kept(process):
+    wmp = WindowMessagePoster(HWND)
+
+    with InputScheduler() as scheduler:
+        wmp.set_scheduler(scheduler)
+        futures = [wmp.send_key_press("F1") for _ in range(3)]
+        assert all(future.result(1) for future in futures)
+
+    times = [message[4] for message in process.messages]
+    gaps = [after - before for before, after in zip(times, times[1:])]
+    # Down and up are a key press delay apart, presses follow each other
+    for gap in gaps[::2]:
+        assert abs(gap - wmp._key_press_delay) < 0.005
+    assert scheduler.posted == 6
+    assert scheduler.max_jitter < 0.005
+
+
+def test_at_is_a_monotonic_timestamp(process):
+    with InputScheduler() as scheduler:
+        start = time.perf_counter()
+        scheduler.post(HWND, WM_KEYDOWN, 0x70, 0,
+                       at=time.monotonic() + 0.05).result(1)
+
+    assert process.messages[0][4] - start >= 0.045
+
+
+def test_async_poster_awaits_the_scheduler(process):
+    wmp = AsyncWindowMessagePoster(HWND)
+
+    async def main():
+        return await asyncio.gather(wmp.send_key_press("F1"),
+                                    wmp.send_left_click((10, 20)))
+
+    with InputScheduler() as scheduler:
+        wmp.set_scheduler(scheduler)
+        start = time.perf_counter()
+        assert asyncio.run(main()) == [True, True]
+        elapsed = time.perf_counter() - start
+
+    assert elapsed >= wmp._key_press_delay - 0.005
+    assert [message[1] for message in process.messages].count(WM_KEYUP) == 1
+    assert len(process.messages) == 4
@@ -0,0 +1,32 @@
+import pytest
+
+from fake_process import HWND
+from pywinbot import Macro, WindowMessagePoster
+from pywinbot.window_message_poster.messages import (WM_CHAR, WM_KEYDOWN,
+                                                     WM_KEYUP,
+                                                     WM_LBUTTONDOWN,
+                                                     WM_LBUTTONUP)
+
+
+def test_documented_macro_compiles_and_plays(process):
+    wmp = WindowMessagePoster(HWND)
+
+    compiled = (Macro(hold=0.01)
+                .key("F1").wait(0.02)
+                .chord("ctrl", "a")
+                .click((100, 200))
+                .text("gg")
+                .compile(wmp))
+    stats = compiled.play()
+
+    messages = [message[1] for message in process.messages]
+    assert messages == [WM_KEYDOWN, WM_KEYUP,
+                        WM_KEYDOWN, WM_KEYDOWN, WM_KEYUP, WM_KEYUP,
+                        WM_LBUTTONDOWN, WM_LBUTTONUP,
+                        WM_CHAR, WM_CHAR]
+    assert stats.events == 10
+
+
+def test_unknown_key_is_rejected():
+    with pytest.raises(ValueError):
+        Macro().key("f1")
@@ -0,0 +1,57 @@
+from pywinbot import Address, MemoryReader
+from pywinbot.memory_reader.module_map import ModuleMap
+
+
+def test_all_modules_are_enumerated(process):
+    process.add_module("Engine.DLL", 0x500000, 0x2000)
+
+    modules = ModuleMap(1234)
+
+    assert [module.name for module in modules] == ["game.exe", "Engine.DLL"]
+    assert modules["engine.dll"].size == 0x2000
+    assert modules.resolve("ENGINE.dll+10") == Address(0x500010)
+    assert modules.module_of(0x501FFF).name == "Engine.DLL"
+    assert modules.module_of(0x502000) is None
+
+
+def test_modules_with_the_same_name_are_kept(process):
+    process.add_module("ntdll.dll", 0x7FF000000000, 0x1000)
+    process.add_module("ntdll.dll", 0x77000000, 0x1000)
+
+    memory_reader = MemoryReader("game.exe", window_class="Game")
+    modules = memory_reader.modules
+
+    assert len(modules) == 3
+    assert modules["ntdll.dll"].base == Address(0x7FF000000000)
+    assert modules.module_of(0x77000010).base == Address(0x77000000)
+
+    # The count matches, so a second reader does not enumerate again
+    walks = process.calls["Module32First"]
+    MemoryReader("game.exe", window_class="Game")
+    assert process.calls["Module32First"] == walks
+
+
+def test_loaded_module_refreshes_the_map(process, memory_reader):
+    process.add_module("late.dll", 0x600000, 0x1000)
+
+    assert memory_reader.modules.refresh_if_changed(99)
+    assert "late.dll" in memory_reader.modules
+
+
+def test_reused_pid_gets_a_new_map(process, memory_reader):
+    process.modules = []
+    process.add_module("other.exe", 0x400000, 0x1000)
+    process.creation_time += 1
+
+    modules = MemoryReader("other.exe", window_class="Game").modules
+
+    assert modules is not memory_reader.modules
+    assert "other.exe" in modules and "game.exe" not in modules
+
+
+def test_close_removes_the_cached_map(process, memory_reader):
+    walks = process.calls["Module32First"]
+    memory_reader.close()
+
+    MemoryReader("game.exe", window_class="Game")
+    assert process.calls["Module32First"] == walks + 1
@@ -0,0 +1,53 @@
+import asyncio
+import time
+
+from fake_process import HWND
+from pywinbot import AsyncWindowMessagePoster, WindowMessagePoster
+from pywinbot.window_message_poster.messages import (MK_LBUTTON,
+                                                     WM_LBUTTONDOWN,
+                                                     WM_LBUTTONUP,
+                                                     WM_MOUSEMOVE)
+
+
+def test_drag_looks_up_the_window_once(process):
+    wmp = WindowMessagePoster(HWND)
+
+    stats = wmp.send_drag((10, 20), (110, 20), duration=0.05, rate=200)
+
+    # Positions are relative to the top left of the window
+    left, top = process.window_rect[:2]
+    client_x, client_y = process.client_origin
+
+    def lparam(x, y):
+        return (x + left - client_x) | ((y + top - client_y) << 16)
+
+    messages = [message[1:4] for message in process.messages]
+    assert messages[0] == (WM_LBUTTONDOWN, MK_LBUTTON, lparam(10, 20))
+    assert messages[-1] == (WM_LBUTTONUP, 0, lparam(110, 20))
+    assert {message[0] for message in messages[1:-1]} == {WM_MOUSEMOVE}
+    assert stats.events == len(messages)
+
+    assert process.calls["GetWindowRect"] == 1
+    assert process.calls["ScreenToClient"] == 1
+
+
+def test_async_gestures_share_the_event_loop(process):
+    wmp = AsyncWindowMessagePoster(HWND)
+
+    async def main():
+        return await asyncio.gather(
+            wmp.send_drag((0, 0), (100, 0), duration=0.2),
+            wmp.send_mouse_path([(0, 50), (100, 50)], duration=0.2))
+
+    start = time.perf_counter()
+    drag, path = asyncio.run(main())
+    elapsed = time.perf_counter() - start
+
+    # Both gestures ran at the same time instead of one after the other
+    assert elapsed < 0.35
+    assert drag.duration >= 0.2 + wmp._key_press_delay - 0.01
+    assert path.duration >= 0.19
+
+    kinds = [message[1] for message in process.messages]
+    assert kinds.count(WM_LBUTTONDOWN) == kinds.count(WM_LBUTTONUP) == 1
+    assert len(kinds) == drag.events + path.events
@@ -0,0 +1,17 @@
+from pywinbot import Address
+from pywinbot.memory_reader.pointer_cache import PointerCache, make_key
+
+
+def test_entry_removed_during_validation_is_a_miss():
+    cache = PointerCache(validate=True)
+    key = make_key("10", ["8"])
+    cache.put(key, Address(0x20), Address(0x10), 0x18)
+
+    def validator(entry):
+        # Like another thread of AsyncMemoryReader evicting it meanwhile
+        cache.invalidate(key)
+        return False
+
+    assert cache.get(key, validator) is None
+    assert cache.misses == 1
+    assert len(cache) == 0
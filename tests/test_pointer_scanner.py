@@ -0,0 +1,65 @@
+import struct
+
+import pytest
+
+# The scanner needs numpy
+pytest.importorskip("numpy")
+
+from pywinbot import Address, PointerPaths, PointerScanner  # noqa: E402
+
+MODULE = 0x400000
+HEAP = 0x10000000
+A = HEAP
+B = HEAP + 0x1000
+
+
+def pointer(value):
+    return struct.pack("<Q", value)
+
+
+@pytest.fixture
+def image(process):
+    # game.exe+100 -> A, A+20 -> B, health at B+48
+    process.map(HEAP, bytes(0x2000))
+    process.write(MODULE + 0x100, pointer(A))
+    process.write(A + 0x20, pointer(B))
+    # A shorter path that only works until B moves
+    process.write(MODULE + 0x200, pointer(B))
+    return process
+
+
+def scan(memory_reader, target):
+    scanner = PointerScanner.from_reader(memory_reader)
+    return scanner.scan(Address(target), max_depth=3, max_offset=0x100)
+
+
+def test_scan_finds_known_chain(image, memory_reader):
+    paths = list(scan(memory_reader, B + 0x48))
+
+    assert ("game.exe+100", ["20", "48"]) in paths
+    assert ("game.exe+200", ["48"]) in paths
+    for base, offsets in paths:
+        assert memory_reader.get_final_pointer(base, offsets) == B + 0x48
+
+
+def test_save_and_load(image, memory_reader, tmp_path):
+    paths = scan(memory_reader, B + 0x48)
+
+    paths.save(str(tmp_path / "health.ptrs"))
+    loaded = PointerPaths.load(str(tmp_path / "health.ptrs"))
+
+    assert list(loaded) == list(paths)
+    assert loaded.modules == paths.modules
+
+
+def test_intersect_and_filter_after_target_moved(image, memory_reader):
+    before = scan(memory_reader, B + 0x48)
+
+    # The game allocates the object somewhere else
+    moved = HEAP + 0x1800
+    image.write(A + 0x20, pointer(moved))
+    after = scan(memory_reader, moved + 0x48)
+
+    assert list(before.intersect(after)) == [("game.exe+100", ["20", "48"])]
+    assert list(before.filter(memory_reader, moved + 0x48)) == \
+        [("game.exe+100", ["20", "48"])]
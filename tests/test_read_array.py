@@ -0,0 +1,46 @@
+import struct
+
+import pytest
+
+np = pytest.importorskip("numpy")
+
+from pywinbot import Address  # noqa: E402
+
+HEAP = 0x10000
+
+ENTITY = np.dtype({"names": ["id", "x", "y"],
+                   "formats": ["<u4", "<f4", "<f4"],
+                   "offsets": [0x0, 0x30, 0x34]})
+
+
+def test_packed_records(process, memory_reader):
+    process.map(HEAP, struct.pack("<5i", 3, 1, 4, 1, 5))
+
+    values = memory_reader.read_array(Address(HEAP), "<i4", 5)
+
+    assert values.tolist() == [3, 1, 4, 1, 5]
+    assert len(memory_reader.read_array(Address(HEAP), "<i4", 0)) == 0
+    # One record more than is mapped
+    assert memory_reader.read_array(Address(HEAP), "<i4", 6) is None
+
+
+def test_strided_records(process, memory_reader):
+    stride = 0x200
+    memory = bytearray(stride * 3)
+    for index in range(3):
+        struct.pack_into("<I", memory, index * stride, 100 + index)
+        struct.pack_into("<ff", memory, index * stride + 0x30,
+                         index * 10.0, -index * 10.0)
+    # Only the part of the last record up to the end of the dtype
+    process.map(HEAP, memory[:stride * 2 + ENTITY.itemsize])
+    process.calls.clear()
+
+    entities = memory_reader.read_array(Address(HEAP), ENTITY, 3,
+                                        stride=stride)
+
+    assert process.calls["ReadProcessMemory"] == 1
+    assert entities.strides == (stride,)
+    assert entities["id"].tolist() == [100, 101, 102]
+    assert entities["x"].tolist() == [0.0, 10.0, 20.0]
+    assert entities["y"].tolist() == [0.0, -10.0, -20.0]
+    assert entities[np.abs(entities["x"]) < 15]["id"].tolist() == [100, 101]
@@ -0,0 +1,50 @@
+import struct
+
+from pywinbot import Address
+from pywinbot.memory_reader.flags import PAGE_NOACCESS
+
+
+def test_close_values_are_read_at_once(process, memory_reader):
+    process.map(0x10000, struct.pack("<iii", 1, 2, 3) + bytes(0x1000))
+    process.map(0x20000, struct.pack("<d", 2.5))
+    process.calls.clear()
+
+    values = memory_reader.read_many([
+        (Address(0x10000), "i"),
+        (Address(0x20000), "d"),
+        (Address(0x10008), "i"),
+        (Address(0x10004), "i"),
+    ])
+
+    assert values == [1, 2.5, 3, 2]
+    assert process.calls["ReadProcessMemory"] == 2
+
+
+def test_max_gap_splits_reads(process, memory_reader):
+    process.map(0x10000, bytes(0x1000))
+    process.calls.clear()
+
+    requests = [(Address(0x10000), "i"), (Address(0x10100), "i")]
+
+    memory_reader.read_many(requests, max_gap=0x100)
+    assert process.calls["ReadProcessMemory"] == 1
+
+    memory_reader.read_many(requests, max_gap=0x10)
+    assert process.calls["ReadProcessMemory"] == 3
+
+
+def test_failed_read_falls_back_to_single_values(process, memory_reader):
+    process.map(0x10000, struct.pack("<i", 7))
+    process.map(0x10004, bytes(4), protect=PAGE_NOACCESS)
+    process.map(0x10008, struct.pack("<i", 9))
+    process.calls.clear()
+
+    values = memory_reader.read_many([
+        (Address(0x10000), "i"),
+        (Address(0x10004), "i"),
+        (Address(0x10008), "i"),
+    ])
+
+    assert values == [7, None, 9]
+    # One merged read, then one per value
+    assert process.calls["ReadProcessMemory"] == 4
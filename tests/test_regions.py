@@ -0,0 +1,92 @@
+import struct
+
+from pywinbot import Address
+from pywinbot.memory_reader.flags import (MEM_COMMIT, MEM_PRIVATE,
+                                          MEM_RESERVE, PAGE_NOACCESS,
+                                          PAGE_READONLY, PAGE_READWRITE)
+from pywinbot.memory_reader.regions import MemoryRegion, RegionMap
+
+
+def region(start, size, protect=PAGE_READWRITE, state=MEM_COMMIT):
+    return MemoryRegion(start, size, state, protect, MEM_PRIVATE, None)
+
+
+def region_map():
+    # Unsorted on purpose, the reserved region is ignored
+    return RegionMap([
+        region(0x5000, 0x1000, PAGE_READONLY),
+        region(0x1000, 0x1000),
+        region(0x3000, 0x1000, PAGE_NOACCESS),
+        region(0x2000, 0x1000),
+        region(0x4000, 0x1000, state=MEM_RESERVE),
+    ])
+
+
+def test_region_of():
+    regions = region_map()
+
+    assert len(regions) == 4
+    assert regions.region_of(0x1FFF).start == 0x1000
+    assert regions.region_of(Address(0x2000)).start == 0x2000
+    assert regions.region_of(0x4800) is None
+    assert regions.region_of(0x500) is None
+
+
+def test_is_readable_and_unreadable():
+    regions = region_map()
+
+    # Across two adjacent regions
+    assert regions.is_readable(0x1F00, 0x200)
+    assert not regions.is_readable(0x2F00, 0x200)
+    assert not regions.is_readable(0x4FFF, 2)
+
+    assert regions.is_unreadable(0x2F00, 0x200)
+    # Not in the index, so not known to be unreadable
+    assert not regions.is_unreadable(0x4800, 4)
+    assert not regions.is_unreadable(0x1000, 0x10)
+
+
+def test_readable_ranges():
+    regions = region_map()
+
+    assert regions.readable_ranges() == [(0x1000, 0x2000), (0x5000, 0x1000)]
+    assert regions.readable_ranges(0x1800, 0x5800) == [(0x1800, 0x1800),
+                                                       (0x5000, 0x800)]
+
+
+def test_update_trims_overlapped_regions():
+    regions = region_map()
+
+    # Re-queried from 0x1000 to 0x1800, but the region grew to 0x3800
+    regions.update(0x1000, 0x1800, [region(0x1000, 0x2800)])
+
+    assert [(item.start, item.size, item.protect) for item in regions] == [
+        (0x1000, 0x2800, PAGE_READWRITE),
+        (0x3800, 0x800, PAGE_NOACCESS),
+        (0x5000, 0x1000, PAGE_READONLY),
+    ]
+    assert regions.is_readable(0x3000, 0x800)
+
+
+def test_refresh_regions_after_allocation(process, memory_reader):
+    regions = memory_reader.regions()
+    assert regions.region_of(0x20000) is None
+
+    process.map(0x20000, bytes(0x1000))
+    memory_reader.refresh_regions(Address(0x20000), 0x1000)
+
+    assert regions.is_readable(0x20000, 0x1000)
+
+
+def test_read_many_skips_unreadable_regions(process, memory_reader):
+    process.map(0x10000, struct.pack("<i", 7))
+    process.map(0x30000, bytes(4), protect=PAGE_NOACCESS)
+    memory_reader.regions()
+    process.calls.clear()
+
+    values = memory_reader.read_many([(Address(0x10000), "i"),
+                                      (Address(0x30000), "i")])
+
+    assert values == [7, None]
+    # Only the readable value was read
+    assert process.calls["ReadProcessMemory"] == 1
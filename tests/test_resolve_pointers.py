@@ -0,0 +1,42 @@
+import struct
+
+from pywinbot import Address, MemoryReader
+
+GAME = 0x400000
+HEAP = 0x10000000
+
+
+def test_shared_prefixes_are_read_once(process, memory_reader):
+    process.map(HEAP, bytes(0x2000))
+    process.write(GAME + 0x100, struct.pack("<Q", HEAP))
+    process.write(HEAP + 0x20, struct.pack("<Q", HEAP + 0x1000))
+    process.calls.clear()
+
+    chains = [
+        ("100", ["20", "48"]),
+        ("game.exe+100", ["20", "4C"]),
+        ("100", ["8"]),
+        # Points to 0, which is not mapped
+        ("100", ["28", "0", "4"]),
+    ]
+    resolved = memory_reader.resolve_pointers(chains)
+
+    assert resolved == [HEAP + 0x1048, HEAP + 0x104C, HEAP + 8, None]
+    assert all(isinstance(address, Address)
+               for address in resolved if address is not None)
+    # One read_many per level, the chains share the pointer at game.exe+100
+    assert process.calls["ReadProcessMemory"] == 3
+
+    assert resolved[:3] == [memory_reader.get_final_pointer(base, offsets)
+                            for base, offsets in chains[:3]]
+
+
+def test_pointers_of_32_bit_processes(process):
+    process.pointer_size = 4
+    process.map(HEAP, bytes(0x100))
+    # A 64-bit read would include the garbage after the pointer
+    process.write(GAME + 0x100, struct.pack("<II", HEAP, 0xFFFFFFFF))
+    memory_reader = MemoryReader("game.exe", window_class="Game")
+
+    assert memory_reader.pointer_size == 4
+    assert memory_reader.resolve_pointers([("100", ["10"])]) == [HEAP + 0x10]
@@ -0,0 +1,56 @@
+import struct
+
+import pytest
+
+from pywinbot import Address, Field, Pointer, Schema
+
+HEAP = 0x10000
+
+
+class Item(Schema):
+    item_id = Field(0x0, "I")
+    amount = Field(0x4, "H")
+
+
+class Player(Schema):
+    health = Field(0x10, "i")
+    position = Field(0x20, "f", count=3)
+    name = Field(0x40, "16s")
+    weapon = Pointer(0x50, Item)
+    shield = Pointer(0x58, Item)
+
+
+def test_compiled_layout():
+    assert Player.size(pointer_size=8) == 0x60
+    assert Player.size(pointer_size=4) == 0x5C
+
+    with pytest.raises(ValueError):
+        class Overlapping(Schema):
+            first = Field(0x0, "Q")
+            second = Field(0x4, "I")
+
+        Overlapping.compile()
+
+
+def test_read_struct_follows_pointers(process, memory_reader):
+    process.map(HEAP, bytes(0x1000))
+    process.write(HEAP + 0x10, struct.pack("<i", 250))
+    process.write(HEAP + 0x20, struct.pack("<3f", 1.5, 2.0, -3.0))
+    process.write(HEAP + 0x40, b"Hero".ljust(16, b"\0"))
+    process.write(HEAP + 0x50, struct.pack("<QQ", HEAP + 0x800, 0))
+    process.write(HEAP + 0x800, struct.pack("<IH", 1234, 3))
+    process.calls.clear()
+
+    player = memory_reader.read_struct(Address(HEAP), Player)
+
+    assert player.health == 250
+    assert player.position == (1.5, 2.0, -3.0)
+    assert player.name.rstrip(b"\0") == b"Hero"
+    assert player.weapon == Item.Record(item_id=1234, amount=3)
+    # Null pointers are not followed
+    assert player.shield is None
+    assert process.calls["ReadProcessMemory"] == 2
+
+
+def test_read_struct_fails_on_unmapped_memory(process, memory_reader):
+    assert memory_reader.read_struct(Address(HEAP), Player) is None
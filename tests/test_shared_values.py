@@ -0,0 +1,55 @@
+import struct
+import time
+
+from pywinbot import Address, ValuePublisher, ValueSubscriber
+from pywinbot.memory_reader.shared_values import _layout
+
+GAME = 0x400000
+HEAP = 0x10000
+
+
+def test_values_are_naturally_aligned():
+    valid_offset, offsets, size = _layout(["?", "3s", "h", "12s", "d"])
+
+    assert valid_offset == 24
+    assert offsets == [29, 30, 34, 36, 48]
+    assert size == 56
+
+
+def test_publish_and_subscribe(process, memory_reader):
+    process.map(HEAP, bytes(0x1000))
+    process.write(HEAP, struct.pack("<i", 100))
+    process.write(HEAP + 0x10, b"abc")
+    process.write(GAME + 0x100, struct.pack("<Q", HEAP + 0x800))
+    process.write(HEAP + 0x840, struct.pack("<d", 12.5))
+
+    publisher = ValuePublisher(memory_reader, {
+        "health": (Address(HEAP), "i"),
+        "tag": (HEAP + 0x10, "3s"),
+        "x": (("game.exe+100", ["40"]), "d"),
+        "missing": (("game.exe+108", ["40"]), "i"),
+    })
+    try:
+        with ValueSubscriber(publisher.name) as subscriber:
+            assert subscriber.names == ["health", "tag", "x", "missing"]
+            assert subscriber.read() is None
+
+            publisher.tick()
+            values = subscriber.read()
+            assert values == (100, b"abc", 12.5, None)
+            assert values.health == 100
+            assert subscriber.tick == 1
+            assert subscriber.sequence == 2
+
+            process.write(HEAP, struct.pack("<i", 93))
+            publisher.start()
+            deadline = time.monotonic() + 5
+            while subscriber.sequence < 6 and time.monotonic() < deadline:
+                time.sleep(0.01)
+            publisher.stop()
+
+            assert subscriber.read().health == 93
+            assert subscriber.tick >= 3
+            assert not publisher.running
+    finally:
+        publisher.close()
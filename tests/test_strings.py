@@ -0,0 +1,62 @@
+import struct
+
+import pytest
+
+from pywinbot import Address
+
+PAGE = 0x10000
+
+
+def test_read_string_stops_at_the_page_end(process, memory_reader):
+    # The next page is not mapped, so a read across it would fail
+    process.map(PAGE, bytes(0x1000))
+    process.write(PAGE + 0xFFA, b"Hello\0")
+
+    assert memory_reader.read_string(Address(PAGE + 0xFFA)) == "Hello"
+
+    # Without terminator the readable part is returned
+    process.write(PAGE + 0xFFF, b"!")
+    assert memory_reader.read_string(Address(PAGE + 0xFFA)) == "Hello!"
+    assert memory_reader.read_string(Address(PAGE + 0x1000)) is None
+
+
+def test_read_string_across_pages(process, memory_reader):
+    # Two regions, a single read can not span both
+    process.map(PAGE, bytes(0x1000))
+    process.map(PAGE + 0x1000, bytes(0x1000))
+    text = "AĀ" + "x" * 20
+    data = text.encode("utf-16-le") + bytes(2)
+    process.write(PAGE + 0xFF0, data[:0x10])
+    process.write(PAGE + 0x1000, data[0x10:])
+
+    # The zero bytes at the odd offset 1 are not a terminator
+    assert memory_reader.read_string(Address(PAGE + 0xFF0),
+                                     "utf-16-le") == text
+    assert memory_reader.read_string(Address(PAGE + 0xFF0), "utf-16-le",
+                                     max_len=8) == text[:4]
+    assert memory_reader.read_string(Address(PAGE + 0xFF0), "utf-16-le",
+                                     terminator=b"x\0") == "AĀ"
+
+
+@pytest.mark.parametrize("chunk_size", [0, 48, 0x2000])
+def test_read_string_chunk_size(process, memory_reader, chunk_size):
+    with pytest.raises(ValueError):
+        memory_reader.read_string(Address(PAGE), chunk_size=chunk_size)
+
+
+def test_prefixed_and_std_strings(process, memory_reader):
+    process.map(PAGE, bytes(0x1000))
+    process.write(PAGE, struct.pack("<I", 5) + b"Hello, World")
+    # Short std::string, stored in the object
+    process.write(PAGE + 0x100, b"short\0".ljust(16, b"\0")
+                  + struct.pack("<QQ", 5, 15))
+    # Long std::wstring behind a pointer
+    long_text = "a longer wide string"
+    process.write(PAGE + 0x200, long_text.encode("utf-16-le"))
+    process.write(PAGE + 0x180, struct.pack("<QQQQ", PAGE + 0x200, 0,
+                                            len(long_text), 31))
+
+    assert memory_reader.read_prefixed_string(Address(PAGE)) == "Hello"
+    assert memory_reader.read_std_string(Address(PAGE + 0x100)) == "short"
+    assert memory_reader.read_std_string(Address(PAGE + 0x180),
+                                         "utf-16-le") == long_text
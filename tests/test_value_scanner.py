@@ -0,0 +1,57 @@
+import struct
+
+import pytest
+
+pytest.importorskip("numpy")
+
+from pywinbot import ValueScanner  # noqa: E402
+
+HEAP = 0x10000
+
+
+@pytest.fixture
+def scanner(process, memory_reader):
+    process.map(HEAP, bytes(0x1000))
+    for offset in (0x10, 0x404, 0x800):
+        process.write(HEAP + offset, struct.pack("<i", 100))
+
+    # Small chunks, so candidates are spread over several blocks
+    return ValueScanner(memory_reader, "i", regions=[(HEAP, 0x1000)],
+                        chunk_size=0x100)
+
+
+def test_exact_value_scans(process, scanner):
+    assert scanner.first_scan(100) == 3
+    assert list(scanner.addresses()) == [HEAP + 0x10, HEAP + 0x404,
+                                         HEAP + 0x800]
+
+    process.write(HEAP + 0x10, struct.pack("<i", 93))
+    process.write(HEAP + 0x404, struct.pack("<i", 120))
+
+    assert scanner.next_scan("decreased") == 1
+    assert scanner.results() == [(HEAP + 0x10, 93)]
+
+    assert scanner.next_scan("equal", 90) == 0
+    assert scanner.results() == []
+
+
+def test_unknown_initial_value(process, scanner):
+    assert scanner.first_scan() == 0x1000 // 4
+
+    assert scanner.next_scan("unchanged") == 0x1000 // 4
+
+    process.write(HEAP + 0x800, struct.pack("<i", 101))
+    assert scanner.next_scan("changed") == 1
+    assert scanner.next_scan("increased") == 0
+
+
+def test_between_and_invalid_comparisons(process, scanner):
+    process.write(HEAP + 0xF00, struct.pack("<i", 150))
+
+    assert scanner.first_scan(between=(100, 150)) == 4
+    assert scanner.values().tolist() == [100, 100, 100, 150]
+
+    with pytest.raises(ValueError):
+        scanner.next_scan("bigger")
+    with pytest.raises(ValueError):
+        scanner.next_scan("equal")
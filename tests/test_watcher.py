@@ -0,0 +1,73 @@
+import struct
+import time
+
+from pywinbot import Address
+from pywinbot.memory_reader.watcher import Watcher
+
+
+def test_watch_added_while_polling_is_not_delayed(process, memory_reader):
+    process.map(0x10000, struct.pack("<ii", 1, 2))
+    watcher = Watcher(memory_reader, max_interval=5.0)
+    watcher.watch(Address(0x10000), "i", interval=5.0, name="slow")
+
+    poll = watcher.poll
+    added = []
+
+    def poll_then_watch():
+        # Like another thread adding a watch right after the poll
+        next_due = poll()
+        if not added:
+            added.append(watcher.watch(Address(0x10004), "i", name="new"))
+        return next_due
+
+    watcher.poll = poll_then_watch
+    watcher.start()
+    try:
+        deadline = time.monotonic() + 1.0
+        while ((not added or watcher.value("new") is None)
+               and time.monotonic() < deadline):
+            time.sleep(0.01)
+    finally:
+        watcher.stop()
+
+    assert watcher.value("new") == 2
+
+
+def test_raising_callback_does_not_stop_other_watches(process,
+                                                     memory_reader):
+    process.map(0x10000, struct.pack("<ii", 1, 2))
+    watcher = Watcher(memory_reader)
+
+    def broken(event):
+        raise RuntimeError("broken callback")
+
+    watcher.watch(Address(0x10000), "i", interval=0.01, callback=broken,
+                  name="broken")
+    watcher.watch(Address(0x10004), "i", interval=0.01, name="other")
+
+    watcher.start()
+    try:
+        time.sleep(0.05)
+        memory_reader.write(Address(0x10000), 10, 4)
+        memory_reader.write(Address(0x10004), 20, 4)
+        event = watcher.events.get(timeout=1)
+    finally:
+        watcher.stop()
+
+    assert (event.name, event.old, event.new) == ("other", 2, 20)
+    assert watcher.callback_errors == 1
+
+
+def test_int_and_chain_targets(process, memory_reader):
+    process.map(0x10000, struct.pack("<ii", 1, 2))
+    process.write(0x400100, struct.pack("<Q", 0x10000))
+    watcher = Watcher(memory_reader)
+
+    number = watcher.watch(0x10000, "i")
+    chain = watcher.watch(("game.exe+100", ["4"]), "i")
+    watcher.poll()
+
+    assert number == 0x10000
+    assert chain == ("game.exe+100", ("4",))
+    assert (watcher.value(number), watcher.value(chain)) == (1, 2)
+    assert watcher.reads == 1
@@ -0,0 +1,72 @@
+from fake_process import HWND
+from pywinbot import WindowMessagePoster
+from pywinbot.window_message_poster import window_geometry
+from pywinbot.window_message_poster.messages import (WM_LBUTTONDOWN,
+                                                     WM_LBUTTONUP)
+from pywinbot.window_message_poster.window_geometry import WindowGeometry
+
+
+def resize(process):
+    # A resized window with a thicker border
+    process.window_rect = (100, 50, 1000, 700)
+    process.client_origin = (110, 90)
+
+
+def test_offset_is_cached_until_invalidated(process):
+    geometry = WindowGeometry(HWND)
+
+    assert geometry.offset() == (100 - 108, 50 - 81)
+    assert geometry.rect == process.window_rect
+
+    resize(process)
+    assert geometry.offset() == (-8, -31)
+    assert geometry.refreshes == 1
+    assert process.calls["ScreenToClient"] == 1
+
+    geometry.invalidate()
+    assert geometry.offset() == (-10, -40)
+    assert geometry.refreshes == 2
+
+
+def test_offset_expires_after_ttl(process, monkeypatch):
+    now = [1000.0]
+    monkeypatch.setattr(window_geometry.time, "monotonic", lambda: now[0])
+    geometry = WindowGeometry(HWND, ttl=1)
+
+    geometry.offset()
+    resize(process)
+    now[0] += 0.5
+    assert geometry.offset() == (-8, -31)
+
+    now[0] += 0.5
+    assert geometry.offset() == (-10, -40)
+    assert geometry.refreshes == 2
+
+
+def test_detect_moves_polls_the_window_rect(process):
+    geometry = WindowGeometry(HWND, detect_moves=True)
+
+    geometry.offset()
+    geometry.offset()
+    assert geometry.refreshes == 1
+    assert process.calls["ScreenToClient"] == 1
+
+    resize(process)
+    assert geometry.offset() == (-10, -40)
+    assert geometry.refreshes == 2
+
+
+def test_cached_clicks_match_uncached_clicks(process):
+    wmp = WindowMessagePoster(HWND)
+    wmp.send_left_click((10, 40))
+
+    wmp.enable_geometry_cache()
+    wmp.send_left_click((10, 40))
+    wmp.send_left_click((10, 40))
+    assert wmp.to_lparams([(10, 40)]) == [process.messages[0][3]]
+
+    lparam = (10 - 8) | ((40 - 31) << 16)
+    assert [message[1:4] for message in process.messages] == [
+        (WM_LBUTTONDOWN, 0, lparam), (WM_LBUTTONUP, 0, lparam)] * 3
+    # One lookup for the uncached click and one to fill the cache
+    assert process.calls["ScreenToClient"] == 2